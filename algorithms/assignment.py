@@ -0,0 +1,150 @@
+from collections import deque
+from typing import Optional, Tuple
+
+import numpy as np
+
+from algorithms.instrumentation import current
+
+
+def hungarian(costs) -> Tuple[np.ndarray, float]:
+    """
+    Méthode hongroise par plus courts chemins augmentants (Jonker-Volgenant) :
+    une ligne est ajoutée à chaque tour et les potentiels (u, v) sont mis à
+    jour sur toutes les colonnes à la fois avec NumPy. O(n²·m) au pire.
+
+    `costs` est une matrice n x m (n <= m) ; une entrée infinie interdit la
+    cellule. Retourne (colonne affectée à chaque ligne, coût total).
+    """
+    C = np.asarray(costs, dtype=float)
+    if C.ndim != 2 or C.shape[0] > C.shape[1]:
+        raise ValueError("La matrice des coûts doit avoir au moins autant de colonnes que de lignes")
+    n, m = C.shape
+    # Indices décalés de 1 : la colonne 0 est une colonne fictive de départ
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    row_of = np.zeros(m + 1, dtype=np.int64)    # ligne (1..n) affectée à chaque colonne, 0 sinon
+    way = np.zeros(m + 1, dtype=np.int64)
+    steps = 0
+    for i in range(1, n + 1):
+        row_of[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            steps += 1
+            used[j0] = True
+            i0 = row_of[j0]
+            free = ~used[1:]
+            reduced = C[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            if not np.isfinite(delta):
+                raise ValueError("Aucune affectation complète n'existe")
+            u[row_of[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if row_of[j0] == 0:
+                break
+        # Inversion du chemin augmentant
+        while j0:
+            j1 = way[j0]
+            row_of[j0] = row_of[j1]
+            j0 = j1
+
+    recorder = current()
+    if recorder is not None:
+        recorder.count('hungarian.augmenting_steps', steps)
+    assignment = np.empty(n, dtype=np.int64)
+    matched = np.flatnonzero(row_of[1:])
+    assignment[row_of[1:][matched] - 1] = matched
+    return assignment, C[np.arange(n), assignment].sum().item()
+
+
+def auction(indptr: np.ndarray, indices: np.ndarray, costs: np.ndarray,
+            epsilon: Optional[float] = None, factor: float = 5.0) -> Tuple[np.ndarray, float]:
+    """
+    Enchères de Bertsekas avec ε-scaling, sur une matrice creuse au format CSR
+    (ligne i : colonnes indices[indptr[i]:indptr[i+1]], coûts alignés).
+    Adaptée aux grandes instances creuses : chaque enchère ne parcourt que
+    les cellules permises de sa ligne.
+
+    ε est divisé par `factor` à chaque phase jusqu'à `epsilon` (1/(n+1) par
+    défaut : le résultat est alors optimal pour des coûts entiers ; sinon il
+    est à au plus n·epsilon de l'optimum). Problème carré uniquement.
+    Retourne (colonne affectée à chaque ligne, coût total).
+    """
+    n = len(indptr) - 1
+    ptr, cols = np.asarray(indptr).tolist(), np.asarray(indices).tolist()
+    costs = np.asarray(costs, dtype=float)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), 0.0
+    if np.any(np.diff(indptr) == 0):
+        raise ValueError("Aucune affectation complète n'existe")
+    if len(cols) and max(cols) >= n:
+        raise ValueError("Le problème d'affectation doit être carré")
+    benefit = (-costs).tolist()
+    span = float(costs.max() - costs.min())
+    final = epsilon if epsilon is not None else 1.0 / (n + 1)
+    eps = max(span / 2, final)
+    # Au-delà, une ligne surenchérit sans fin : aucune affectation complète
+    limit = 2 * (n + 1) * (span + eps)
+
+    prices = [0.0] * n
+    owner = [-1] * n
+    assigned = [-1] * n
+    bids = 0
+    while True:
+        owner = [-1] * n
+        assigned = [-1] * n
+        queue = deque(range(n))
+        while queue:
+            i = queue.popleft()
+            best = second = -np.inf
+            best_j = -1
+            for k in range(ptr[i], ptr[i + 1]):
+                value = benefit[k] - prices[cols[k]]
+                if value > best:
+                    second = best
+                    best, best_j = value, cols[k]
+                elif value > second:
+                    second = value
+            if second == -np.inf:
+                second = best - span - eps
+            prices[best_j] += best - second + eps
+            if prices[best_j] > limit:
+                raise ValueError("Aucune affectation complète n'existe")
+            bids += 1
+            previous = owner[best_j]
+            owner[best_j] = i
+            assigned[i] = best_j
+            if previous != -1:
+                assigned[previous] = -1
+                queue.append(previous)
+        if eps <= final:
+            break
+        eps = max(eps / factor, final)
+
+    recorder = current()
+    if recorder is not None:
+        recorder.count('auction.bids', bids)
+    assignment = np.asarray(assigned, dtype=np.int64)
+    # Coût de la cellule choisie dans chaque ligne
+    total = 0.0
+    for i, j in enumerate(assigned):
+        k = ptr[i] + cols[ptr[i]:ptr[i + 1]].index(j)
+        total += costs[k]
+    return assignment, total
+
+
+def dense_to_csr(costs) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cellules permises (coût fini) d'une matrice dense, au format CSR."""
+    C = np.asarray(costs, dtype=float)
+    rows, cols = np.nonzero(np.isfinite(C))
+    indptr = np.zeros(C.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=C.shape[0]), out=indptr[1:])
+    return indptr, cols.astype(np.int64), C[rows, cols]
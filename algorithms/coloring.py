@@ -0,0 +1,194 @@
+from typing import Dict, Hashable, List, Tuple
+
+from algorithms.csr import CompactGraph
+
+
+class BucketQueue:
+    """
+    File de priorité à seaux indexée pour des clés entières bornées.
+
+    Chaque seau est une liste doublement chaînée stockée dans des tableaux
+    d'entiers : insertion, suppression et changement de clé sont en O(1),
+    et les extractions min/max sont en O(1) amorti tant que les clés ne
+    varient que d'une unité à la fois (cas de DSATUR et du smallest-last).
+    """
+
+    __slots__ = ('_head', '_next', '_prev', '_key', '_low', '_high', '_size')
+
+    def __init__(self, num_items: int, max_key: int):
+        self._head = [-1] * (max_key + 1)
+        self._next = [-1] * num_items
+        self._prev = [-1] * num_items
+        self._key = [-1] * num_items
+        self._low = max_key
+        self._high = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item: int) -> bool:
+        return self._key[item] != -1
+
+    def key(self, item: int) -> int:
+        return self._key[item]
+
+    def push(self, item: int, key: int) -> None:
+        head = self._head[key]
+        self._next[item] = head
+        self._prev[item] = -1
+        if head != -1:
+            self._prev[head] = item
+        self._head[key] = item
+        self._key[item] = key
+        self._size += 1
+        if key < self._low:
+            self._low = key
+        if key > self._high:
+            self._high = key
+
+    def remove(self, item: int) -> None:
+        key = self._key[item]
+        nxt, prv = self._next[item], self._prev[item]
+        if prv != -1:
+            self._next[prv] = nxt
+        else:
+            self._head[key] = nxt
+        if nxt != -1:
+            self._prev[nxt] = prv
+        self._key[item] = -1
+        self._size -= 1
+
+    def update(self, item: int, key: int) -> None:
+        self.remove(item)
+        self.push(item, key)
+
+    def pop_max(self) -> int:
+        if not self._size:
+            raise IndexError("La file de priorité est vide")
+        while self._head[self._high] == -1:
+            self._high -= 1
+        item = self._head[self._high]
+        self.remove(item)
+        return item
+
+    def pop_min(self) -> int:
+        if not self._size:
+            raise IndexError("La file de priorité est vide")
+        while self._head[self._low] == -1:
+            self._low += 1
+        item = self._head[self._low]
+        self.remove(item)
+        return item
+
+
+def _to_adjacency(G) -> Tuple[List[Hashable], List[List[int]]]:
+    """
+    Convertit un graphe (networkx ou CompactGraph) en listes d'adjacence sur
+    des indices entiers.
+    """
+    if isinstance(G, CompactGraph):
+        ptr, adj = G.indptr.tolist(), G.indices.tolist()
+        adjacency = [[v for v in adj[ptr[u]:ptr[u + 1]] if v != u] for u in range(G.num_nodes)]
+        return list(G.labels), adjacency
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    adjacency = [[index[v] for v in G.neighbors(u) if v != u] for u in nodes]
+    return nodes, adjacency
+
+
+def _first_free_color(neighbors: List[int], colors: List[int],
+                      mark: List[int], stamp: int) -> int:
+    """
+    Plus petite couleur absente du voisinage, en O(degré) grâce au marquage.
+    """
+    for v in neighbors:
+        c = colors[v]
+        if c != -1:
+            mark[c] = stamp
+    color = 0
+    while mark[color] == stamp:
+        color += 1
+    return color
+
+
+def dsatur(adjacency: List[List[int]]) -> List[int]:
+    """
+    Coloration DSATUR : on colore toujours le sommet de saturation maximale.
+
+    Les saturations sont tenues dans une BucketQueue ; à saturation égale,
+    les sommets de plus haut degré sont servis en premier à l'initialisation.
+    """
+    n = len(adjacency)
+    colors = [-1] * n
+    if n == 0:
+        return colors
+
+    max_degree = max(len(neighbors) for neighbors in adjacency)
+    queue = BucketQueue(n, max_degree + 1)
+    # Insertion par degré croissant : le plus haut degré se retrouve en tête
+    for u in sorted(range(n), key=lambda x: len(adjacency[x])):
+        queue.push(u, 0)
+
+    neighbor_colors = [set() for _ in range(n)]
+    mark = [-1] * (max_degree + 2)
+
+    while queue:
+        u = queue.pop_max()
+        color = _first_free_color(adjacency[u], colors, mark, u)
+        colors[u] = color
+        for v in adjacency[u]:
+            if colors[v] == -1 and color not in neighbor_colors[v]:
+                neighbor_colors[v].add(color)
+                queue.update(v, len(neighbor_colors[v]))
+
+    return colors
+
+
+def smallest_last(adjacency: List[List[int]]) -> List[int]:
+    """
+    Coloration smallest-last : on retire successivement le sommet de degré
+    résiduel minimal, puis on colore gloutonnement dans l'ordre inverse.
+    """
+    n = len(adjacency)
+    colors = [-1] * n
+    if n == 0:
+        return colors
+
+    degrees = [len(neighbors) for neighbors in adjacency]
+    max_degree = max(degrees)
+    queue = BucketQueue(n, max_degree)
+    for u in range(n):
+        queue.push(u, degrees[u])
+
+    order = []
+    while queue:
+        u = queue.pop_min()
+        order.append(u)
+        for v in adjacency[u]:
+            if v in queue:
+                queue.update(v, queue.key(v) - 1)
+
+    mark = [-1] * (max_degree + 2)
+    for u in reversed(order):
+        colors[u] = _first_free_color(adjacency[u], colors, mark, u)
+
+    return colors
+
+
+STRATEGIES = {
+    'dsatur': dsatur,
+    'smallest_last': smallest_last,
+}
+
+
+def color_graph(G, strategy: str) -> Tuple[Dict[Hashable, int], int]:
+    """
+    Applique la stratégie de coloration demandée à un graphe networkx ou CompactGraph.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Stratégie de coloration non supportée: {strategy}")
+    nodes, adjacency = _to_adjacency(G)
+    colors = STRATEGIES[strategy](adjacency)
+    num_colors = max(colors) + 1 if colors else 0
+    return {node: colors[i] for i, node in enumerate(nodes)}, num_colors
@@ -0,0 +1,233 @@
+import numpy as np
+from typing import Hashable, List, Optional, Tuple
+
+from algorithms.instrumentation import current
+from algorithms.union_find import components_from_edges
+
+
+def edges_to_csr(num_nodes: int, src: np.ndarray, dst: np.ndarray, *data: np.ndarray,
+                 symmetric: bool = False) -> Tuple[np.ndarray, ...]:
+    """
+    Construit les tableaux CSR (indptr, indices, *données) à partir d'une liste d'arcs.
+
+    Avec symmetric=True chaque arête est stockée dans les deux sens, ce qui
+    donne la représentation d'un graphe non orienté.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    data = tuple(np.asarray(d) for d in data)
+    if symmetric:
+        src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+        data = tuple(np.concatenate([d, d]) for d in data)
+
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+    indices = dst[order]
+    return (indptr, indices) + tuple(d[order] for d in data)
+
+
+def networkx_to_csr(G) -> Tuple[List[Hashable], np.ndarray, np.ndarray]:
+    """
+    Convertit un graphe networkx en (nœuds, indptr, indices).
+
+    Les nœuds sont numérotés dans l'ordre de G.nodes() ; pour un graphe non
+    orienté, chaque arête apparaît dans la liste d'adjacence de ses deux extrémités.
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indices = []
+    for i, u in enumerate(nodes):
+        neighbors = G.successors(u) if G.is_directed() else G.neighbors(u)
+        indices.extend(index[v] for v in neighbors)
+        indptr[i + 1] = len(indices)
+    return nodes, indptr, np.asarray(indices, dtype=np.int64)
+
+
+class CompactGraph:
+    """
+    Graphe compact au format CSR, partagé par toutes les méthodes de GraphAlgorithms.
+
+    Les sommets sont internés en entiers 0..n-1 : soit par une table de libellés,
+    soit par un préfixe ('X' pour X0, X1, ...) sans stocker aucune chaîne, soit
+    par l'identité. Les poids et capacités sont des tableaux alignés sur
+    `indices`. Un graphe non orienté stocke chaque arête dans les deux sens.
+    """
+
+    __slots__ = ('directed', 'indptr', 'indices', 'weight', 'capacity',
+                 '_labels', '_prefix', '_index', '_csc', '_components')
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, directed: bool = False,
+                 weight: Optional[np.ndarray] = None, capacity: Optional[np.ndarray] = None,
+                 labels: Optional[List[Hashable]] = None, prefix: Optional[str] = None):
+        self.directed = directed
+        self.indptr = indptr
+        self.indices = indices
+        self.weight = weight
+        self.capacity = capacity
+        self._labels = labels
+        self._prefix = prefix
+        self._index = None
+        self._csc = None
+        self._components = None
+
+    @classmethod
+    def from_edges(cls, num_nodes: int, src: np.ndarray, dst: np.ndarray,
+                   directed: bool = False, weight: Optional[np.ndarray] = None,
+                   capacity: Optional[np.ndarray] = None,
+                   labels: Optional[List[Hashable]] = None,
+                   prefix: Optional[str] = None) -> 'CompactGraph':
+        """Construit le graphe à partir d'arcs (src[k], dst[k]) numérotés."""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        columns = [c for c in (weight, capacity) if c is not None]
+        if not directed:
+            # Les boucles ne sont stockées qu'une fois
+            mirror = src != dst
+            src, dst = np.concatenate([src, dst[mirror]]), np.concatenate([dst, src[mirror]])
+            columns = [np.concatenate([c, np.asarray(c)[mirror]]) for c in columns]
+        indptr, indices, *columns = edges_to_csr(num_nodes, src, dst, *columns)
+        weight = columns.pop(0) if weight is not None else None
+        capacity = columns.pop(0) if capacity is not None else None
+        return cls(indptr, indices, directed, weight, capacity, labels, prefix)
+
+    @classmethod
+    def from_networkx(cls, G) -> 'CompactGraph':
+        """
+        Conversion depuis networkx en une passe sur les arêtes. Les attributs
+        'weight' et 'capacity' sont repris s'ils sont présents sur toutes les arêtes.
+        """
+        labels = list(G.nodes())
+        index = {node: i for i, node in enumerate(labels)}
+        edges = list(G.edges(data=True))
+        src = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+        dst = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+        columns = {}
+        for attribute in ('weight', 'capacity'):
+            if edges and all(attribute in data for _, _, data in edges):
+                columns[attribute] = np.asarray([data[attribute] for _, _, data in edges])
+        graph = cls.from_edges(len(labels), src, dst, G.is_directed(), labels=labels, **columns)
+        graph._index = index
+        return graph
+
+    def to_networkx(self):
+        """Conversion vers networkx (chaque arête n'est ajoutée qu'une fois)."""
+        import networkx as nx
+        G = nx.DiGraph() if self.directed else nx.Graph()
+        G.add_nodes_from(self.labels)
+        src, dst, columns = self.edge_arrays()
+        labels = self.labels
+        u = [labels[i] for i in src.tolist()]
+        v = [labels[j] for j in dst.tolist()]
+        if columns:
+            names = list(columns)
+            values = zip(*(columns[name].tolist() for name in names))
+            G.add_edges_from((a, b, dict(zip(names, data)))
+                             for a, b, data in zip(u, v, values))
+        else:
+            G.add_edges_from(zip(u, v))
+        return G
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        if self.directed:
+            return len(self.indices)
+        src = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr))
+        return int(np.count_nonzero(src <= self.indices))
+
+    @property
+    def labels(self) -> List[Hashable]:
+        if self._labels is None:
+            if self._prefix is None:
+                return range(self.num_nodes)
+            return [f'{self._prefix}{i}' for i in range(self.num_nodes)]
+        return self._labels
+
+    def label(self, i: int) -> Hashable:
+        if self._labels is not None:
+            return self._labels[i]
+        if self._prefix is not None:
+            return f'{self._prefix}{i}'
+        return i
+
+    def index(self, label: Hashable) -> int:
+        """Numéro interne d'un sommet ; ValueError si le sommet est absent."""
+        if self._labels is not None:
+            if self._index is None:
+                self._index = {node: i for i, node in enumerate(self._labels)}
+            if label in self._index:
+                return self._index[label]
+        elif self._prefix is not None:
+            text = str(label)
+            if text.startswith(self._prefix) and text[len(self._prefix):].isdigit():
+                i = int(text[len(self._prefix):])
+                if i < self.num_nodes:
+                    return i
+        elif isinstance(label, (int, np.integer)) and 0 <= label < self.num_nodes:
+            return int(label)
+        raise ValueError(f"Sommet inconnu: {label}")
+
+    def degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbors(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, dict]:
+        """
+        Arêtes sous forme (src, dst, {attribut: valeurs}), chaque arête d'un
+        graphe non orienté n'apparaissant qu'une fois (src <= dst).
+        """
+        src = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+        dst = self.indices
+        columns = {name: values for name, values in
+                   (('weight', self.weight), ('capacity', self.capacity)) if values is not None}
+        if not self.directed:
+            keep = src <= dst
+            src, dst = src[keep], dst[keep]
+            columns = {name: values[keep] for name, values in columns.items()}
+        return src, dst, columns
+
+    def csc(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Arcs entrants (indptr, sources, permutation vers les tableaux CSR),
+        calculés une fois puis conservés avec le graphe.
+        """
+        if not self.directed:
+            return self.indptr, self.indices, np.arange(len(self.indices))
+        if self._csc is None:
+            src = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+            order = np.argsort(self.indices, kind='stable')
+            indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=self.num_nodes), out=indptr[1:])
+            self._csc = (indptr, src[order], order)
+        return self._csc
+
+    def components(self) -> Tuple[np.ndarray, int]:
+        """
+        Composantes connexes (faiblement connexes pour un graphe orienté) :
+        (composante de chaque sommet, nombre de composantes), calculées une
+        fois par union-find vectorisé puis conservées avec le graphe.
+        """
+        if self._components is None:
+            src = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.indptr))
+            labels, count, rounds = components_from_edges(self.num_nodes, src, self.indices)
+            recorder = current()
+            if recorder is not None:
+                recorder.count('components.rounds', rounds)
+            self._components = (labels, count)
+        return self._components
+
+    def connected(self, i: int, j: int) -> bool:
+        """
+        Vrai si les sommets numéro i et j sont dans la même composante. Faux
+        garantit qu'aucun chemin ne les relie ; pour un graphe orienté, vrai
+        ne garantit pas qu'un chemin orienté existe.
+        """
+        labels, _ = self.components()
+        return bool(labels[i] == labels[j])
@@ -0,0 +1,211 @@
+import heapq
+from typing import Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from algorithms.csr import CompactGraph
+from algorithms.instrumentation import current
+from algorithms.union_find import DisjointSet
+
+
+def _edge_weights(graph: CompactGraph) -> np.ndarray:
+    if graph.weight is None:
+        raise ValueError("Le graphe doit porter des poids ('weight') sur ses arêtes")
+    return graph.weight
+
+
+def welsh_powell_csr(graph: CompactGraph) -> Tuple[Dict[Hashable, int], int]:
+    """
+    Welsh-Powell sur CSR : ordre par degré décroissant (stable), puis
+    première couleur libre trouvée par marquage en O(degré).
+    """
+    n = graph.num_nodes
+    ptr, adj = graph.indptr.tolist(), graph.indices.tolist()
+    colors = [-1] * n
+    mark = [-1] * (int(graph.degree().max(initial=0)) + 2)
+    max_color = 0
+    for u in np.argsort(-graph.degree(), kind='stable').tolist():
+        for k in range(ptr[u], ptr[u + 1]):
+            c = colors[adj[k]]
+            if c != -1:
+                mark[c] = u
+        color = 0
+        while mark[color] == u:
+            color += 1
+        colors[u] = color
+        max_color = max(max_color, color)
+    return {graph.label(i): c for i, c in enumerate(colors)}, max_color + 1
+
+
+# Fréquence des appels de progression de Dijkstra (en sommets fixés)
+PROGRESS_INTERVAL = 4096
+
+
+def dijkstra_csr(graph: CompactGraph, source: int,
+                 target: Union[int, Iterable[int], None] = None,
+                 progress: Optional[Callable] = None) -> Tuple[List[float], List[int]]:
+    """
+    Dijkstra avec tas binaire sur CSR. S'arrête dès que `target` (un sommet
+    ou une collection de sommets, pour plusieurs requêtes depuis la même
+    source) est fixé. `progress(sommets_fixés, n)` est appelé tous les
+    PROGRESS_INTERVAL sommets.
+
+    Retourne (distances, prédécesseurs) indexés par numéro de sommet.
+    """
+    weights = _edge_weights(graph)
+    if weights.size and weights.min() < 0:
+        raise ValueError("Dijkstra n'accepte pas de poids négatifs")
+    ptr, adj, w = graph.indptr.tolist(), graph.indices.tolist(), weights.tolist()
+    n = graph.num_nodes
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    done = [False] * n
+    dist[source] = 0
+    heap = [(0, source)]
+    settled = pushes = 0
+    pending = None
+    if target is not None:
+        pending = {target} if isinstance(target, (int, np.integer)) else set(target)
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        settled += 1
+        if progress is not None and settled % PROGRESS_INTERVAL == 0:
+            progress(settled, n)
+        if pending is not None and u in pending:
+            pending.discard(u)
+            if not pending:
+                break
+        for k in range(ptr[u], ptr[u + 1]):
+            v = adj[k]
+            nd = d + w[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd, v))
+                pushes += 1
+    recorder = current()
+    if recorder is not None:
+        # Extractions = insertions (source comprise) moins ce qui reste dans le tas
+        recorder.count('dijkstra.heap_pushes', pushes + 1)
+        recorder.count('dijkstra.settled', settled)
+        recorder.count('dijkstra.stale_pops', pushes + 1 - len(heap) - settled)
+    return dist, pred
+
+
+def bellman_ford_csr(graph: CompactGraph, source: int,
+                     progress: Optional[Callable] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bellman-Ford vectorisé : chaque tour relâche tous les arcs d'un coup et
+    s'arrête dès qu'aucune distance ne diminue. `progress(tour, n)` est
+    appelé à chaque tour de relaxation.
+
+    Retourne (distances, prédécesseurs) ; lève ValueError en cas de cycle
+    de poids négatif accessible depuis la source.
+    """
+    weights = _edge_weights(graph)
+    n = graph.num_nodes
+    src = np.repeat(np.arange(n, dtype=np.int64), graph.degree())
+    dst = graph.indices
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[source] = 0
+    recorder = current()
+    for rounds in range(n):
+        if progress is not None:
+            progress(rounds, n)
+        candidate = dist[src] + weights
+        improve = np.flatnonzero(candidate < dist[dst])
+        if recorder is not None:
+            recorder.count('bellman_ford.rounds')
+            recorder.count('bellman_ford.relaxations', len(improve))
+        if len(improve) == 0:
+            return dist, pred
+        # Meilleur arc entrant par sommet amélioré
+        order = improve[np.lexsort((candidate[improve], dst[improve]))]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = dst[order][1:] != dst[order][:-1]
+        best = order[first]
+        dist[dst[best]] = candidate[best]
+        pred[dst[best]] = src[best]
+    raise ValueError("Le graphe contient un cycle de poids négatif.")
+
+
+def path_from_predecessors(pred, source: int, target: int) -> List[int]:
+    path = [target]
+    while path[-1] != source:
+        path.append(int(pred[path[-1]]))
+    path.reverse()
+    return path
+
+
+def _kruskal_edges(graph: CompactGraph) -> Tuple[List[int], List[int], list]:
+    """Arêtes retenues par Kruskal (extrémités et poids), dans l'ordre de sélection."""
+    _edge_weights(graph)
+    src, dst, columns = graph.edge_arrays()
+    weights = columns['weight']
+    order = np.argsort(weights, kind='stable')
+    sets = DisjointSet(graph.num_nodes)
+    # Une forêt couvrante a V - k arêtes (k composantes) : arrêt dès qu'elle est complète
+    _, count = graph.components()
+    limit = graph.num_nodes - count
+
+    us, vs, ws = [], [], []
+    examined = 0
+    if limit > 0:
+        for u, v, w in zip(src[order].tolist(), dst[order].tolist(), weights[order].tolist()):
+            examined += 1
+            if not sets.union(u, v):
+                continue
+            us.append(u)
+            vs.append(v)
+            ws.append(w)
+            if len(us) == limit:
+                break
+    recorder = current()
+    if recorder is not None:
+        recorder.count('kruskal.edges_examined', examined)
+        recorder.count('kruskal.unions', len(us))
+    return us, vs, ws
+
+
+def kruskal_csr(graph: CompactGraph) -> Tuple[List[Tuple[Hashable, Hashable, Dict]], float]:
+    """
+    Kruskal sur les tableaux d'arêtes : tri NumPy des poids puis union-find
+    (DisjointSet). Donne une forêt couvrante si le graphe n'est
+    pas connexe.
+    """
+    us, vs, ws = _kruskal_edges(graph)
+    edges = [(graph.label(u), graph.label(v), {'weight': w}) for u, v, w in zip(us, vs, ws)]
+    return edges, sum(ws)
+
+
+class SpanningTree(NamedTuple):
+    """Arbre couvrant minimal d'une composante connexe."""
+    nodes: List[Hashable]
+    edges: List[Tuple[Hashable, Hashable, Dict]]
+    total_weight: float
+
+
+def spanning_forest_csr(graph: CompactGraph) -> List[SpanningTree]:
+    """
+    Forêt couvrante minimale découpée par composante connexe (numérotées
+    par plus petit sommet, voir CompactGraph.components) : un arbre par
+    composante, sommet isolé compris.
+    """
+    labels, count = graph.components()
+    if count == 0:
+        return []
+    us, vs, ws = _kruskal_edges(graph)
+    members = np.argsort(labels, kind='stable')
+    bounds = np.cumsum(np.bincount(labels, minlength=count))[:-1]
+    trees = [SpanningTree([graph.label(i) for i in part.tolist()], [], 0)
+             for part in np.split(members, bounds)]
+    component = labels.tolist()
+    for u, v, w in zip(us, vs, ws):
+        tree = trees[component[u]]
+        tree.edges.append((graph.label(u), graph.label(v), {'weight': w}))
+    return [tree._replace(total_weight=sum(data['weight'] for _, _, data in tree.edges))
+            for tree in trees]
@@ -0,0 +1,152 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from algorithms.csr import CompactGraph
+from algorithms.csr_algorithms import _edge_weights
+from algorithms.instrumentation import current
+from algorithms.shared_pool import SHARED, shared_pool
+
+# Arêtes à relâcher en dessous desquelles une phase n'est pas répartie entre processus
+SHARD_MIN_EDGES = 200_000
+
+
+def default_delta(graph: CompactGraph) -> float:
+    """Largeur de seau par défaut : poids maximal divisé par le degré moyen."""
+    weights = _edge_weights(graph)
+    if weights.size == 0 or weights.max() <= 0:
+        return 1.0
+    mean_degree = max(len(graph.indices) / max(graph.num_nodes, 1), 1.0)
+    return float(weights.max()) / mean_degree
+
+
+def _split(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+           mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sous-graphe CSR des arêtes retenues par `mask` (ordre des lignes conservé)."""
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows[mask], minlength=n), out=ptr[1:])
+    return ptr, indices[mask], weights[mask]
+
+
+def _best(v: np.ndarray, cand: np.ndarray, u: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Meilleur candidat par sommet (plus petite distance, puis plus petit prédécesseur)."""
+    if len(v) == 0:
+        return v, cand, u
+    order = np.lexsort((u, cand, v))
+    v, cand, u = v[order], cand[order], u[order]
+    first = np.ones(len(v), dtype=bool)
+    first[1:] = v[1:] != v[:-1]
+    return v[first], cand[first], u[first]
+
+
+def _relax(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+           dist: np.ndarray, vertices: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Relâche toutes les arêtes sortant de `vertices` d'un coup et retourne les
+    améliorations (sommet, distance, prédécesseur), une par sommet.
+    """
+    starts = indptr[vertices]
+    degrees = indptr[vertices + 1] - starts
+    total = int(degrees.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0), empty
+    u = np.repeat(vertices, degrees)
+    edges = np.repeat(starts - (np.cumsum(degrees) - degrees), degrees) + np.arange(total)
+    v = indices[edges]
+    cand = dist[u] + weights[edges]
+    keep = cand < dist[v]
+    return _best(v[keep], cand[keep], u[keep])
+
+
+def _relax_shard(args) -> Tuple[np.ndarray, ...]:
+    kind, vertices = args
+    s = SHARED
+    return _relax(s[f'{kind}_indptr'], s[f'{kind}_indices'], s[f'{kind}_weights'],
+                  s['dist'], vertices)
+
+
+def delta_stepping_csr(graph: CompactGraph, source: int, delta: Optional[float] = None,
+                       processes: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Plus courts chemins depuis `source` par delta-stepping (Meyer-Sanders).
+
+    Les sommets sont rangés dans des seaux de largeur `delta` (default_delta
+    par défaut). Le seau courant est vidé par relaxations vectorisées de ses
+    arêtes légères (poids <= delta), répétées tant qu'elles y ramènent des
+    sommets, puis ses arêtes lourdes sont relâchées une seule fois. Avec
+    processes > 1, les phases de plus de SHARD_MIN_EDGES arêtes sont
+    réparties entre processus sur un CSR en mémoire partagée.
+
+    Les distances sont identiques à celles de Dijkstra ; en cas d'égalité
+    entre plusieurs plus courts chemins, le prédécesseur retenu peut
+    différer. Retourne (distances, prédécesseurs).
+    """
+    weights = _edge_weights(graph)
+    if weights.size and weights.min() < 0:
+        raise ValueError("Le delta-stepping n'accepte pas de poids négatifs")
+    delta = float(delta) if delta is not None else default_delta(graph)
+    if delta <= 0:
+        raise ValueError("La largeur des seaux (delta) doit être positive")
+    n = graph.num_nodes
+    light = weights <= delta
+    arrays = {'dist': np.full(n, np.inf)}
+    for kind, mask in (('light', light), ('heavy', ~light)):
+        ptr, idx, w = _split(graph.indptr, graph.indices, weights.astype(float), mask)
+        arrays.update({f'{kind}_indptr': ptr, f'{kind}_indices': idx, f'{kind}_weights': w})
+    processes = processes or 1
+
+    with shared_pool(arrays, processes) as pool:
+        dist = arrays['dist']
+        pred = np.full(n, -1, dtype=np.int64)
+
+        def relax(kind, vertices):
+            ptr = arrays[f'{kind}_indptr']
+            edges = int((ptr[vertices + 1] - ptr[vertices]).sum())
+            if pool is None or edges < SHARD_MIN_EDGES:
+                found = _relax(ptr, arrays[f'{kind}_indices'], arrays[f'{kind}_weights'],
+                               dist, vertices)
+            else:
+                shards = pool.map(_relax_shard, [(kind, chunk) for chunk in
+                                                 np.array_split(vertices, processes)])
+                found = _best(*(np.concatenate(parts) for parts in zip(*shards)))
+            v, cand, u = found
+            dist[v] = cand
+            pred[v] = u
+            return v
+
+        dist[source] = 0
+        settled = np.zeros(n, dtype=bool)
+        pending = np.array([source], dtype=np.int64)
+        buckets = phases = 0
+        while True:
+            pending = np.unique(pending[~settled[pending]])
+            if len(pending) == 0:
+                break
+            buckets += 1
+            # Numéro de seau entier : le même calcul décide de l'appartenance
+            # au seau courant partout, sans erreur d'arrondi sur ses bornes
+            index = np.floor(dist[pending] / delta)
+            current_index = index.min()
+            frontier = pending[index == current_index]
+            removed = []
+            while len(frontier):
+                phases += 1
+                removed.append(frontier)
+                settled[frontier] = True
+                improved = relax('light', frontier)
+                inside = np.floor(dist[improved] / delta) <= current_index
+                frontier = np.unique(improved[inside])
+                pending = np.concatenate([pending, improved[~inside]])
+            improved = relax('heavy', np.unique(np.concatenate(removed)))
+            pending = np.concatenate([pending, improved])
+
+        recorder = current()
+        if recorder is not None:
+            recorder.count('delta_stepping.buckets', buckets)
+            recorder.count('delta_stepping.light_phases', phases)
+        dist = np.array(dist)
+
+    return dist, pred
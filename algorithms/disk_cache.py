@@ -0,0 +1,101 @@
+import os
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class DiskCache:
+    """
+    Cache LRU de valeurs sérialisées, indexé par une empreinte (chaîne).
+
+    Les entrées sont gardées sous forme d'octets : chaque lecture rend une
+    copie indépendante, que l'appelant peut modifier sans altérer le cache.
+    Les entrées les moins récemment utilisées sont évincées au-delà de
+    `capacity` ; avec `directory`, elles sont aussi conservées sur disque
+    d'une session à l'autre. Une capacité nulle sans répertoire désactive
+    le cache.
+
+    Les sous-classes fournissent `suffix` (extension des fichiers) et les
+    méthodes encode / decode ; decode lève ValueError sur des octets
+    illisibles, l'entrée étant alors recalculée.
+    """
+
+    suffix = '.bin'
+
+    def __init__(self, capacity: int, directory: Optional[str] = None):
+        self.capacity = capacity
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0 or self.directory is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _load(self, key: str) -> Optional[bytes]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store(self, key: str, data: bytes) -> None:
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # Écriture atomique : un lecteur concurrent ne voit jamais de fichier partiel
+        tmp = self._path(key) + f'.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self._path(key))
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if self.capacity <= 0:
+            return
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(trouvé, valeur) ; la valeur est une copie."""
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        else:
+            data = self._load(key)
+            if data is not None:
+                self._remember(key, data)
+        if data is not None:
+            try:
+                value = self.decode(data)
+            except ValueError:
+                # Fichier corrompu ou d'une version incompatible : recalculé
+                self._entries.pop(key, None)
+            else:
+                self.hits += 1
+                return True, value
+        self.misses += 1
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        data = self.encode(value)
+        self._remember(key, data)
+        self._store(key, data)
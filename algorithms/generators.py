@@ -0,0 +1,135 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from algorithms.csr import CompactGraph
+from config.settings import GRAPH_SETTINGS
+
+# Type de graphe, préfixe des sommets et attribut des arêtes par algorithme
+GRAPH_KINDS = {
+    'welsh_powell': (False, None, None),
+    'dijkstra': (False, 'X', 'weight'),
+    'kruskal': (False, 'X', 'weight'),
+    'bellman_ford': (False, 'X', 'weight'),
+    'ford_fulkerson': (True, None, 'capacity'),
+}
+
+
+def random_pairs(num_vertices: int, probability: float,
+                 rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tire les paires (i, j), i < j, d'un graphe G(n, p) par sauts géométriques
+    (Batagelj–Brandes) : seules les positions retenues sont générées, par lots
+    vectorisés, au lieu d'un tirage par paire.
+    """
+    total = num_vertices * (num_vertices - 1) // 2
+    if total == 0 or probability <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    positions = []
+    last = -1
+    batch = int(total * probability * 1.05) + 64
+    while last < total:
+        gaps = rng.geometric(min(probability, 1.0), size=batch)
+        steps = last + np.cumsum(gaps)
+        positions.append(steps[steps < total])
+        last = int(steps[-1])
+        batch = int((total - last) * probability * 1.05) + 64
+    positions = np.concatenate(positions)
+
+    # Position linéaire -> (ligne, colonne) dans le triangle supérieur strict
+    rows = np.arange(num_vertices, dtype=np.int64)
+    offsets = rows * num_vertices - rows * (rows + 1) // 2
+    i = np.searchsorted(offsets, positions, side='right') - 1
+    j = i + 1 + (positions - offsets[i])
+    return i, j
+
+
+def random_graph(num_vertices: int, algorithm_type: str, seed: Optional[int] = None,
+                 probability: Optional[float] = None) -> CompactGraph:
+    """
+    Génère le graphe aléatoire adapté à l'algorithme spécifié, directement en CSR
+    (CompactGraph).
+
+    Une chaîne 0 - 1 - ... - (n-1) garantit la connexité, puis chaque autre
+    paire i < j est reliée avec la probabilité donnée. Les poids (ou les
+    capacités) sont tirés en bloc ; `seed` rend la génération reproductible.
+    """
+    if algorithm_type not in GRAPH_KINDS:
+        raise ValueError(f"Type d'algorithme non supporté: {algorithm_type}")
+    directed, prefix, attribute = GRAPH_KINDS[algorithm_type]
+    if probability is None:
+        probability = GRAPH_SETTINGS['RANDOM_EDGE_PROBABILITY']
+    rng = np.random.default_rng(seed)
+
+    i, j = random_pairs(num_vertices, probability, rng)
+    extra = j > i + 1
+    chain = np.arange(max(num_vertices - 1, 0), dtype=np.int64)
+    src = np.concatenate([chain, i[extra]])
+    dst = np.concatenate([chain + 1, j[extra]])
+
+    columns = {}
+    if attribute == 'weight':
+        columns['weight'] = rng.integers(GRAPH_SETTINGS['MIN_WEIGHT'],
+                                         GRAPH_SETTINGS['MAX_WEIGHT'] + 1, size=len(src))
+    elif attribute == 'capacity':
+        columns['capacity'] = rng.integers(1, 21, size=len(src))
+
+    return CompactGraph.from_edges(num_vertices, src, dst, directed, prefix=prefix, **columns)
+
+
+def random_transport_problem(num_sources: int, num_destinations: int,
+                             seed: Optional[int] = None) -> Tuple[List[int], List[int],
+                                                                  List[List[int]]]:
+    """
+    Problème de transport équilibré (offre, demande, coûts) : quantités
+    tirées dans [50, 100], coûts dans [10, 100]. L'écart entre offre et
+    demande totales est reporté sur la dernière ligne ou colonne.
+    """
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(50, 101, size=num_sources)
+    demand = rng.integers(50, 101, size=num_destinations)
+    gap = int(supply.sum() - demand.sum())
+    if gap > 0:
+        demand[-1] += gap
+    elif gap < 0:
+        supply[-1] -= gap
+    costs = rng.integers(10, 101, size=(num_sources, num_destinations))
+    return supply.tolist(), demand.tolist(), costs.tolist()
+
+
+def random_assignment_problem(n: int, seed: Optional[int] = None,
+                              degree: Optional[int] = None) -> List[List[Optional[int]]]:
+    """
+    Coûts d'un problème d'affectation n x n, tirés dans [10, 100]. Avec
+    `degree`, chaque ligne n'a qu'environ `degree` cellules permises (les
+    autres valent None), dont toujours celle d'une permutation aléatoire
+    pour qu'une affectation complète existe.
+    """
+    rng = np.random.default_rng(seed)
+    costs = rng.integers(10, 101, size=(n, n)).tolist()
+    if degree is None or degree >= n:
+        return costs
+    allowed = np.zeros((n, n), dtype=bool)
+    allowed[np.arange(n), rng.permutation(n)] = True
+    allowed[np.repeat(np.arange(n), degree), rng.integers(0, n, size=n * degree)] = True
+    return [[c if keep else None for c, keep in zip(row, mask)]
+            for row, mask in zip(costs, allowed.tolist())]
+
+
+def random_tasks(num_tasks: int, seed: Optional[int] = None, probability: float = 0.3,
+                 window: Optional[int] = None) -> Dict[int, Dict]:
+    """
+    Projet aléatoire {id: {'duration', 'predecessors'}} : durées dans [1, 10],
+    chaque tâche dépendant de chacune des `window` tâches précédentes (toutes
+    par défaut) avec la probabilité donnée.
+    """
+    rng = np.random.default_rng(seed)
+    durations = rng.integers(1, 11, size=num_tasks).tolist()
+    span = num_tasks if window is None else window
+    tasks = {}
+    for i in range(num_tasks):
+        low = max(0, i - span)
+        predecessors = np.flatnonzero(rng.random(i - low) < probability) + low
+        tasks[i] = {'duration': durations[i], 'predecessors': predecessors.tolist()}
+    return tasks
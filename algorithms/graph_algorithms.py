@@ -1,14 +1,43 @@
-import networkx as nx
-import random
-from typing import Dict, List, Tuple, Set
-from config.settings import GRAPH_SETTINGS
+from typing import TYPE_CHECKING, Dict, List, Tuple, Set, Union
+from algorithms.coloring import color_graph
+from algorithms.csr import CompactGraph, networkx_to_csr
+from algorithms.csr_algorithms import (SpanningTree, bellman_ford_csr, dijkstra_csr,
+                                       kruskal_csr, path_from_predecessors,
+                                       spanning_forest_csr, welsh_powell_csr)
+from algorithms.generators import random_graph
+from algorithms.instrumentation import timed
+from algorithms.result_cache import memoized
+from algorithms.scheduling import (CPMResult, PertSimulation, ResourceSchedule, cpm,
+                                   pert_monte_carlo, resource_constrained_schedule)
+from config.settings import ERROR_MESSAGES
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Toutes les méthodes acceptent un graphe networkx ou un CompactGraph.
+# networkx n'est importé qu'à la première utilisation d'un graphe networkx.
+Graph = Union['nx.Graph', CompactGraph]
+
+NO_PATH = "Aucun chemin n'existe entre les sommets spécifiés"
+
+
+def _reject_unreachable(G: CompactGraph, source: int, target: int, message: str) -> None:
+    # Composantes calculées une fois par graphe : test en O(1) avant toute recherche
+    if not G.connected(source, target):
+        raise ValueError(message)
+
 
 class GraphAlgorithms:
     @staticmethod
-    def welsh_powell(G: nx.Graph) -> Dict[int, int]:
+    @timed('graph.welsh_powell')
+    @memoized('graph.welsh_powell')
+    def welsh_powell(G: Graph) -> Dict[int, int]:
         """
         Implémentation corrigée de l'algorithme de Welsh-Powell pour la coloration de graphe.
         """
+        if isinstance(G, CompactGraph):
+            return welsh_powell_csr(G)
+
         # Trier les nœuds par degré décroissant
         nodes = sorted(G.nodes(), key=lambda x: G.degree(x), reverse=True)
         colors = {}
@@ -30,32 +59,116 @@ class GraphAlgorithms:
         return colors, max_color + 1
 
     @staticmethod
-    def dijkstra(G: nx.Graph, start: str, end: str) -> Tuple[List[str], float]:
+    @timed('graph.coloration')
+    def coloration(G: Graph, strategy: str = 'welsh_powell') -> Tuple[Dict, int]:
+        """
+        Coloration de graphe selon la stratégie choisie :
+        'welsh_powell', 'dsatur', 'smallest_last' ou 'parallel'.
+        """
+        if strategy == 'welsh_powell':
+            return GraphAlgorithms.welsh_powell(G)
+        if strategy == 'parallel':
+            return GraphAlgorithms.coloration_parallele(G)
+        return color_graph(G, strategy)
+
+    @staticmethod
+    @timed('graph.coloration_parallele')
+    def coloration_parallele(G: Graph, processes: int = None,
+                             seed: int = None) -> Tuple[Dict, int]:
+        """
+        Coloration spéculative répartie sur un pool de processus (mémoire partagée).
+        """
+        if isinstance(G, CompactGraph):
+            nodes, indptr, indices = G.labels, G.indptr, G.indices
+        else:
+            nodes, indptr, indices = networkx_to_csr(G)
+        # multiprocessing n'est chargé que pour ce mode
+        from algorithms.parallel_coloring import speculative_coloring
+        colors, _ = speculative_coloring(indptr, indices, processes, seed)
+        num_colors = int(colors.max()) + 1 if len(nodes) else 0
+        return {node: int(colors[i]) for i, node in enumerate(nodes)}, num_colors
+
+    @staticmethod
+    @timed('graph.dijkstra')
+    def dijkstra(G: Graph, start: str, end: str, progress=None) -> Tuple[List[str], float]:
         """
         Implémentation corrigée de l'algorithme de Dijkstra.
         """
+        if isinstance(G, CompactGraph):
+            source, target = G.index(start), G.index(end)
+            _reject_unreachable(G, source, target, NO_PATH)
+            dist, pred = dijkstra_csr(G, source, target, progress)
+            if pred[target] == -1 and source != target:
+                raise ValueError(NO_PATH)
+            path = path_from_predecessors(pred, source, target)
+            return [G.label(i) for i in path], dist[target]
+        import networkx as nx
         try:
             path = nx.dijkstra_path(G, start, end, weight='weight')
             path_length = nx.dijkstra_path_length(G, start, end, weight='weight')
             return path, path_length
         except nx.NetworkXNoPath:
-            raise ValueError("Aucun chemin n'existe entre les sommets spécifiés")
+            raise ValueError(NO_PATH)
 
     @staticmethod
-    def kruskal(G: nx.Graph) -> Tuple[List[Tuple[int, int]], float]:
+    @timed('graph.delta_stepping')
+    def delta_stepping(G: Graph, start: str, end: str, delta: float = None,
+                       processes: int = None) -> Tuple[List[str], float]:
         """
-        Implémentation corrigée de l'algorithme de Kruskal.
+        Plus court chemin par delta-stepping : relaxations vectorisées seau
+        par seau (largeur `delta`), réparties entre `processes` processus
+        sur les très grands graphes. Même longueur que dijkstra.
         """
+        if not isinstance(G, CompactGraph):
+            G = CompactGraph.from_networkx(G)
+        from algorithms.delta_stepping import delta_stepping_csr
+        source, target = G.index(start), G.index(end)
+        _reject_unreachable(G, source, target, NO_PATH)
+        dist, pred = delta_stepping_csr(G, source, delta, processes)
+        if dist[target] == float('inf'):
+            raise ValueError(NO_PATH)
+        path = [G.label(i) for i in path_from_predecessors(pred, source, target)]
+        length = dist[target]
+        return path, int(length) if G.weight.dtype.kind in 'iu' else float(length)
+
+    @staticmethod
+    @timed('graph.kruskal')
+    @memoized('graph.kruskal')
+    def kruskal(G: Graph, per_component: bool = False) -> Union[Tuple[List[Tuple[int, int]], float],
+                                                                List[SpanningTree]]:
+        """
+        Implémentation corrigée de l'algorithme de Kruskal. Sur un graphe non
+        connexe, le résultat est une forêt couvrante minimale ; avec
+        per_component=True, elle est rendue composante par composante
+        (liste de SpanningTree : sommets, arêtes, poids total).
+        """
+        if per_component:
+            if not isinstance(G, CompactGraph):
+                G = CompactGraph.from_networkx(G)
+            return spanning_forest_csr(G)
+        if isinstance(G, CompactGraph):
+            return kruskal_csr(G)
+        import networkx as nx
         mst = nx.minimum_spanning_tree(G, algorithm='kruskal')
         mst_edges = list(mst.edges(data=True))
         total_weight = sum(data['weight'] for _, _, data in mst_edges)
         return mst_edges, total_weight
 
     @staticmethod
-    def ford_fulkerson(G: nx.DiGraph, source: int, sink: int) -> Tuple[float, Dict]:
+    @timed('graph.ford_fulkerson')
+    def ford_fulkerson(G: Graph, source: int, sink: int) -> Tuple[float, Dict]:
         """
         Implémentation corrigée de l'algorithme de Ford-Fulkerson.
         """
+        unreachable = (f"{ERROR_MESSAGES['disconnected_graph']} : "
+                       "la source et le puits ne sont pas reliés")
+        if isinstance(G, CompactGraph):
+            _reject_unreachable(G, G.index(source), G.index(sink), unreachable)
+            G = G.to_networkx()
+        import networkx as nx
+        # Même refus pour un graphe networkx, au prix d'un parcours
+        if source in G and sink in G and not nx.has_path(G.to_undirected(as_view=True), source, sink):
+            raise ValueError(unreachable)
         try:
             flow_value, flow_dict = nx.maximum_flow(G, source, sink)
             cut_value, partition = nx.minimum_cut(G, source, sink)
@@ -64,10 +177,21 @@ class GraphAlgorithms:
             raise ValueError("Le graphe doit être dirigé avec des capacités valides")
         
     @staticmethod
-    def bellman_ford(G: nx.DiGraph, start: str, end: str) -> Tuple[list, float]:
+    @timed('graph.bellman_ford')
+    def bellman_ford(G: Graph, start: str, end: str, progress=None) -> Tuple[list, float]:
         """
         Implémentation de l'algorithme de Bellman-Ford pour trouver le plus court chemin.
         """
+        if isinstance(G, CompactGraph):
+            source, target = G.index(start), G.index(end)
+            _reject_unreachable(G, source, target, NO_PATH)
+            dist, pred = bellman_ford_csr(G, source, progress)
+            if dist[target] == float('inf'):
+                raise ValueError(NO_PATH)
+            path = [G.label(i) for i in path_from_predecessors(pred, source, target)]
+            length = dist[target]
+            return path, int(length) if G.weight.dtype.kind in 'iu' else float(length)
+        import networkx as nx
         try:
             length, path = nx.single_source_bellman_ford(G, source=start, target=end)
             return path, length
@@ -78,108 +202,54 @@ class GraphAlgorithms:
 
 
     @staticmethod
+    @timed('graph.potentiel_metra')
     def potentiel_metra(tasks: Dict[int, Dict]) -> Tuple[Dict[int, int], int]:
         """
-        Implémentation corrigée de la méthode METRA (calcul des dates au plus tôt).
+        Méthode METRA : dates au plus tôt et durée totale du projet.
         """
-        G = nx.DiGraph()
-        
-        # Créer le graphe
-        for task_id, task_info in tasks.items():
-            G.add_node(task_id, duration=task_info['duration'])
-            for pred in task_info['predecessors']:
-                G.add_edge(pred, task_id)
-
-        # Vérifier s'il y a des cycles
-        if not nx.is_directed_acyclic_graph(G):
-            raise ValueError("Le graphe des tâches contient des cycles")
-
-        # Calculer les dates au plus tôt
-        early_dates = {0: 0}
-        for task in nx.topological_sort(G):
-            if task not in early_dates:
-                early_dates[task] = 0
-            task_duration = tasks[task]['duration']
-            for pred in tasks[task]['predecessors']:
-                early_dates[task] = max(early_dates[task],
-                                      early_dates[pred] + tasks[pred]['duration'])
-
-        # Calculer la durée totale du projet
-        project_duration = max(early_dates[task] + tasks[task]['duration'] 
-                             for task in tasks)
-
-        return early_dates, project_duration
+        result = GraphAlgorithms.cpm(tasks)
+        early_dates = dict(zip(result.tasks, result.earliest_start.tolist()))
+        return early_dates, result.project_duration
 
     @staticmethod
-    def generate_random_graph(num_vertices: int, algorithm_type: str) -> nx.Graph:
+    @timed('graph.cpm')
+    def cpm(tasks: Dict[int, Dict]) -> CPMResult:
         """
-        Génère un graphe aléatoire adapté à l'algorithme spécifié.
+        Chemin critique complet en O(V + E) : dates au plus tôt et au plus tard,
+        marges totales et libres, chemin critique.
         """
-        if algorithm_type == "welsh_powell":
-            G = nx.Graph()
-            # Assurer la connexité
-            for i in range(num_vertices):
-                G.add_node(i)
-            for i in range(1, num_vertices):
-                G.add_edge(i-1, i)
-            
-            # Ajouter des arêtes aléatoires
-            for i in range(num_vertices):
-                for j in range(i + 2, num_vertices):
-                    if random.random() < GRAPH_SETTINGS['RANDOM_EDGE_PROBABILITY']:
-                        G.add_edge(i, j)
-            return G
-
-        elif algorithm_type in ["dijkstra", "kruskal"]:
-            G = nx.Graph()
-            for i in range(num_vertices):
-                G.add_node(f'X{i}')
-            # Assurer la connexité avec des poids
-            for i in range(num_vertices - 1):
-                weight = random.randint(GRAPH_SETTINGS['MIN_WEIGHT'],
-                                    GRAPH_SETTINGS['MAX_WEIGHT'])
-                G.add_edge(f'X{i}', f'X{i+1}', weight=weight)
-            # Ajouter des arêtes supplémentaires
-            for i in range(num_vertices):
-                for j in range(i + 2, num_vertices):
-                    if random.random() < GRAPH_SETTINGS['RANDOM_EDGE_PROBABILITY']:
-                        weight = random.randint(GRAPH_SETTINGS['MIN_WEIGHT'],
-                                            GRAPH_SETTINGS['MAX_WEIGHT'])
-                        G.add_edge(f'X{i}', f'X{j}', weight=weight)
-            return G
-
-        elif algorithm_type == "ford_fulkerson":
-            G = nx.DiGraph()
-            for i in range(num_vertices):
-                G.add_node(i)
-            # Assurer la connexité avec des capacités
-            for i in range(num_vertices - 1):
-                capacity = random.randint(1, 20)
-                G.add_edge(i, i+1, capacity=capacity)
-            # Ajouter des arcs supplémentaires
-            for i in range(num_vertices):
-                for j in range(i + 2, num_vertices):
-                    if random.random() < GRAPH_SETTINGS['RANDOM_EDGE_PROBABILITY']:
-                        capacity = random.randint(1, 20)
-                        G.add_edge(i, j, capacity=capacity)
-            return G
-
-        elif algorithm_type == "bellman_ford":
-            G = nx.Graph()
-            for i in range(num_vertices):
-                G.add_node(f'X{i}')
-            # Assurer la connexité avec des poids
-            for i in range(num_vertices - 1):
-                weight = random.randint(GRAPH_SETTINGS['MIN_WEIGHT'],
-                                    GRAPH_SETTINGS['MAX_WEIGHT'])
-                G.add_edge(f'X{i}', f'X{i+1}', weight=weight)
-            # Ajouter des arêtes supplémentaires
-            for i in range(num_vertices):
-                for j in range(i + 2, num_vertices):
-                    if random.random() < GRAPH_SETTINGS['RANDOM_EDGE_PROBABILITY']:
-                        weight = random.randint(GRAPH_SETTINGS['MIN_WEIGHT'],
-                                            GRAPH_SETTINGS['MAX_WEIGHT'])
-                        G.add_edge(f'X{i}', f'X{j}', weight=weight)
-            return G
-
-        raise ValueError(f"Type d'algorithme non supporté: {algorithm_type}")
+        return cpm(tasks)
+
+    @staticmethod
+    @timed('graph.pert_monte_carlo')
+    def pert_monte_carlo(tasks: Dict[int, Dict], num_scenarios: int = 10000,
+                         seed: int = None, processes: int = None,
+                         progress=None) -> PertSimulation:
+        """
+        Mode risque PERT : durées (optimiste, probable, pessimiste) simulées par
+        Monte-Carlo ; distribution de la durée du projet et indice de criticité.
+        """
+        return pert_monte_carlo(tasks, num_scenarios, seed=seed, processes=processes,
+                                progress=progress)
+
+    @staticmethod
+    @timed('graph.resource_schedule')
+    def resource_schedule(tasks: Dict[int, Dict],
+                          capacities: Dict[str, int]) -> ResourceSchedule:
+        """
+        METRA sous contraintes de ressources : ordonnancement par liste à partir
+        des dates CPM, chaque tâche déclarant 'resources': {ressource: quantité}.
+        """
+        return resource_constrained_schedule(tasks, capacities)
+
+    @staticmethod
+    @timed('graph.generate_random_graph')
+    def generate_random_graph(num_vertices: int, algorithm_type: str,
+                              seed: int = None, compact: bool = False,
+                              probability: float = None) -> Graph:
+        """
+        Génère un graphe aléatoire adapté à l'algorithme spécifié
+        (CompactGraph si compact=True, networkx sinon).
+        """
+        graph = random_graph(num_vertices, algorithm_type, seed=seed, probability=probability)
+        return graph if compact else graph.to_networkx()
@@ -0,0 +1,96 @@
+import contextvars
+import functools
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Enregistreur actif pour le contexte courant (thread ou tâche), None par défaut
+_current: contextvars.ContextVar = contextvars.ContextVar('recorder', default=None)
+
+
+class Recorder:
+    """
+    Compteurs et chronomètres nommés d'une ou plusieurs résolutions,
+    par exemple 'stepping_stone.pivots' ou 'dijkstra.heap_pushes'.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        # nom -> [nombre d'appels, durée totale, durée maximale]
+        self.timers: Dict[str, List[float]] = {}
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.timers.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+
+    def to_dict(self) -> Dict:
+        return {
+            'counters': dict(self.counters),
+            'timers': {name: {'count': int(n), 'total_seconds': total, 'max_seconds': peak}
+                       for name, (n, total, peak) in self.timers.items()},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, prefix: str = 'ro') -> str:
+        """Format texte d'exposition Prometheus (compteurs et résumés de durée)."""
+        lines = [f'# TYPE {prefix}_events_total counter']
+        lines += [f'{prefix}_events_total{{name="{name}"}} {value}'
+                  for name, value in sorted(self.counters.items())]
+        lines.append(f'# TYPE {prefix}_duration_seconds summary')
+        for name, (n, total, _) in sorted(self.timers.items()):
+            lines.append(f'{prefix}_duration_seconds_sum{{name="{name}"}} {total}')
+            lines.append(f'{prefix}_duration_seconds_count{{name="{name}"}} {int(n)}')
+        return '\n'.join(lines) + '\n'
+
+
+def current() -> Optional[Recorder]:
+    """Enregistreur actif, ou None si l'instrumentation est désactivée."""
+    return _current.get()
+
+
+@contextmanager
+def instrument(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """
+    Active l'instrumentation pour les résolutions lancées dans le bloc :
+
+        with instrument() as rec:
+            TransportAlgorithms.stepping_stone(solution, costs)
+        print(rec.to_prometheus())
+    """
+    recorder = recorder if recorder is not None else Recorder()
+    token = _current.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current.reset(token)
+
+
+def timed(name: str):
+    """
+    Chronomètre une méthode sous `name` lorsque l'instrumentation est active ;
+    sinon la méthode est appelée directement.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _current.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            with recorder.timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,124 @@
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+from algorithms.shared_pool import SHARED, shared_pool
+
+def _gather_neighbors(indptr: np.ndarray, indices: np.ndarray,
+                      vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Retourne (propriétaire, voisin) pour toutes les arêtes sortantes de `vertices`.
+    """
+    starts = indptr[vertices]
+    degrees = indptr[vertices + 1] - starts
+    owner = np.repeat(np.arange(len(vertices)), degrees)
+    offsets = np.arange(len(owner)) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+    return owner, indices[np.repeat(starts, degrees) + offsets]
+
+
+def _tentative_colors(indptr, indices, colors, pending, lo, hi) -> None:
+    """
+    Phase spéculative : chaque sommet en attente de [lo, hi) reçoit la plus
+    petite couleur absente chez ses voisins, d'après l'état courant des couleurs.
+    """
+    vertices = lo + np.flatnonzero(pending[lo:hi])
+    if len(vertices) == 0:
+        return
+    owner, neighbors = _gather_neighbors(indptr, indices, vertices)
+    neighbor_colors = colors[neighbors]
+    used = neighbor_colors >= 0
+    owner, neighbor_colors = owner[used], neighbor_colors[used]
+
+    # Couleurs distinctes triées par sommet : la première couleur c_k != k est le mex
+    stride = int(neighbor_colors.max(initial=0)) + 1
+    keys = np.unique(owner * stride + neighbor_colors)
+    owner, neighbor_colors = keys // stride, keys % stride
+    counts = np.bincount(owner, minlength=len(vertices))
+    rank = np.arange(len(keys)) - np.repeat(np.cumsum(counts) - counts, counts)
+    mex = counts.copy()
+    gap = neighbor_colors != rank
+    np.minimum.at(mex, owner[gap], rank[gap])
+    colors[vertices] = mex
+
+
+def _detect_conflicts(indptr, indices, colors, pending, priority,
+                      conflicts, lo, hi) -> None:
+    """
+    Phase de correction : un sommet coloré ce tour-ci qui partage sa couleur
+    avec un voisin lui aussi recoloré et plus prioritaire doit être recoloré.
+    """
+    vertices = lo + np.flatnonzero(pending[lo:hi])
+    conflicts[lo:hi] = False
+    if len(vertices) == 0:
+        return
+    owner, neighbors = _gather_neighbors(indptr, indices, vertices)
+    u = vertices[owner]
+    clash = (pending[neighbors] & (colors[neighbors] == colors[u])
+             & (priority[neighbors] > priority[u]))
+    conflicts[u[clash]] = True
+
+
+def _run_phase(args) -> None:
+    phase, lo, hi = args
+    s = SHARED
+    if phase == 'color':
+        _tentative_colors(s['indptr'], s['indices'], s['colors'], s['pending'], lo, hi)
+    else:
+        _detect_conflicts(s['indptr'], s['indices'], s['colors'], s['pending'],
+                          s['priority'], s['conflicts'], lo, hi)
+
+
+def speculative_coloring(indptr: np.ndarray, indices: np.ndarray,
+                         processes: Optional[int] = None,
+                         seed: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """
+    Coloration parallèle spéculative (Gebremedhin–Manne) d'un graphe CSR non orienté.
+
+    Les sommets sont découpés en partitions contiguës traitées par un pool de
+    processus sur mémoire partagée. À chaque tour, les sommets en attente sont
+    colorés de manière optimiste puis une passe de détection remet en attente
+    le sommet le moins prioritaire (priorités aléatoires) de chaque conflit.
+
+    Retourne (couleurs, nombre de tours).
+    """
+    n = len(indptr) - 1
+    processes = processes or os.cpu_count() or 1
+    rng = np.random.default_rng(seed)
+    arrays = {
+        'indptr': np.asarray(indptr, dtype=np.int64),
+        'indices': np.asarray(indices, dtype=np.int64),
+        'colors': np.full(n, -1, dtype=np.int64),
+        'pending': np.ones(n, dtype=bool),
+        'priority': rng.permutation(n).astype(np.int64),
+        'conflicts': np.zeros(n, dtype=bool),
+    }
+    bounds = np.linspace(0, n, processes + 1, dtype=np.int64)
+    partitions = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+    with shared_pool(arrays, processes) as pool:
+        def run(phase):
+            if pool is not None:
+                pool.map(_run_phase, [(phase, lo, hi) for lo, hi in partitions])
+                return
+            for lo, hi in partitions:
+                if phase == 'color':
+                    _tentative_colors(arrays['indptr'], arrays['indices'],
+                                      arrays['colors'], arrays['pending'], lo, hi)
+                else:
+                    _detect_conflicts(arrays['indptr'], arrays['indices'],
+                                      arrays['colors'], arrays['pending'],
+                                      arrays['priority'], arrays['conflicts'], lo, hi)
+
+        rounds = 0
+        while arrays['pending'].any():
+            rounds += 1
+            run('color')
+            run('conflicts')
+            # Seuls les sommets en conflit repassent au tour suivant
+            arrays['pending'][:] = arrays['conflicts']
+            arrays['colors'][arrays['pending']] = -1
+
+        colors = np.array(arrays['colors'])
+
+    return colors, rounds
@@ -0,0 +1,133 @@
+import functools
+import hashlib
+import inspect
+import pickle
+from typing import Any, Optional
+
+import numpy as np
+
+from algorithms.csr import CompactGraph
+from algorithms.disk_cache import DiskCache
+from algorithms.instrumentation import current
+from config.settings import CACHE_SETTINGS
+
+# Entre dans chaque empreinte : la changer écarte les résultats mémoïsés par une version antérieure
+RESULT_CACHE_VERSION = 1
+
+
+def _update(digest, value: Any) -> None:
+    """Ajoute au condensat une forme canonique de `value` (ordre compris)."""
+    if isinstance(value, CompactGraph):
+        labels = value._labels if value._labels is not None else value._prefix
+        digest.update(repr(('csr', value.directed, value.num_nodes, labels)).encode())
+        for array in (value.indptr, value.indices, value.weight, value.capacity):
+            _update(digest, array)
+    elif hasattr(value, 'is_directed') and hasattr(value, 'edges'):
+        _update_networkx(digest, value)
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(repr(('array', value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        # Offres, demandes, coûts : comparés par leurs octets une fois convertis
+        try:
+            array = np.asarray(value) if value else None
+        except ValueError:  # lignes de longueurs différentes
+            array = None
+        if array is not None and array.dtype.kind in 'biuf':
+            _update(digest, array)
+        else:
+            digest.update(repr(value).encode())
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b'\x1e')
+
+
+def _update_networkx(digest, G) -> None:
+    """
+    Condensat d'un graphe networkx sous forme de tableaux, comme
+    graph_fingerprint : sommets, extrémités numérotées des arêtes, puis une
+    colonne par attribut d'arête. Les arêtes gardent leur ordre de parcours,
+    qui départage les égalités des algorithmes networkx.
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = list(G.edges(data=True))
+    digest.update(repr(('nx', G.is_directed(), G.is_multigraph(), len(nodes))).encode())
+    digest.update('\x1f'.join(map(repr, nodes)).encode())
+    _update(digest, np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges)))
+    _update(digest, np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges)))
+    for key in sorted({key for _, _, data in edges for key in data}, key=repr):
+        digest.update(repr(key).encode())
+        _update(digest, [data.get(key) for _, _, data in edges])
+
+
+def fingerprint(*values: Any) -> str:
+    """
+    Empreinte du contenu des arguments : tableaux CSR d'un CompactGraph,
+    sommets et arêtes d'un graphe networkx, octets des listes numériques.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(RESULT_CACHE_VERSION).encode())
+    for value in values:
+        _update(digest, value)
+    return digest.hexdigest()
+
+
+class ResultCache(DiskCache):
+    """
+    Cache des résultats d'algorithmes indexé par l'empreinte de leurs entrées,
+    sérialisés par pickle.
+    """
+
+    suffix = '.pickle'
+
+    def __init__(self, capacity: int = 0, directory: Optional[str] = None):
+        super().__init__(capacity, directory)
+
+    def encode(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return pickle.loads(data)
+        except (pickle.UnpicklingError, EOFError, AttributeError) as e:
+            raise ValueError(str(e)) from e
+
+
+# Cache partagé par les méthodes mémoïsées de GraphAlgorithms et TransportAlgorithms
+RESULTS = ResultCache(CACHE_SETTINGS['RESULT_CACHE_SIZE'], CACHE_SETTINGS['RESULT_CACHE_DIR'])
+
+# Arguments sans effet sur le résultat, exclus de l'empreinte
+_IGNORED = ('progress',)
+
+
+def memoized(name: str):
+    """
+    Mémoïse une méthode dans RESULTS, sous une clé formée de `name` et de
+    l'empreinte de ses arguments (valeurs par défaut comprises).
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not RESULTS.enabled:
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            parts = [name]
+            for argument, value in bound.arguments.items():
+                if argument not in _IGNORED:
+                    parts += [argument, value]
+            key = fingerprint(*parts)
+            found, value = RESULTS.get(key)
+            recorder = current()
+            if recorder is not None:
+                recorder.count(f'{name}.cache_hits' if found else f'{name}.cache_misses')
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            RESULTS.put(key, value)
+            return value
+        return wrapper
+    return decorator
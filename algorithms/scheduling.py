@@ -0,0 +1,633 @@
+import heapq
+
+import numpy as np
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from algorithms.csr import edges_to_csr
+
+
+class CPMResult(NamedTuple):
+    """
+    Résultat complet de la méthode du chemin critique (CPM / METRA).
+
+    Les tableaux sont indexés comme `tasks` (ordre d'insertion du dictionnaire).
+    """
+    tasks: List[Hashable]
+    earliest_start: np.ndarray
+    earliest_finish: np.ndarray
+    latest_start: np.ndarray
+    latest_finish: np.ndarray
+    total_float: np.ndarray
+    free_float: np.ndarray
+    critical_path: List[Hashable]
+    project_duration: int
+
+
+def _dependency_arrays(tasks: Dict[Hashable, Dict]) -> Tuple[List[Hashable],
+                                                              np.ndarray, np.ndarray]:
+    """
+    Numérote les tâches et retourne (ids, src, dst), où chaque arc src -> dst
+    relie un prédécesseur à sa tâche.
+    """
+    ids = list(tasks)
+    index = {task: i for i, task in enumerate(ids)}
+    src, dst = [], []
+    for i, task in enumerate(ids):
+        for pred in tasks[task]['predecessors']:
+            if pred not in index:
+                raise ValueError(f"Prédécesseur inconnu pour la tâche {task}: {pred}")
+            src.append(index[pred])
+            dst.append(i)
+    return ids, np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
+
+
+def task_arrays(tasks: Dict[Hashable, Dict]) -> Tuple[List[Hashable], np.ndarray,
+                                                       np.ndarray, np.ndarray]:
+    """
+    Convertit le dictionnaire de tâches en (ids, durées, src, dst).
+    """
+    ids, src, dst = _dependency_arrays(tasks)
+    durations = np.asarray([tasks[task]['duration'] for task in ids])
+    if len(ids) == 0:
+        durations = durations.astype(np.int64)
+    return ids, durations, src, dst
+
+
+def _kahn(ptr: List[int], succ: List[int], indegree: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    Algorithme de Kahn sur listes d'adjacence CSR ; `indegree` est consommé.
+    """
+    num_tasks = len(indegree)
+    level = [0] * num_tasks
+    order = [u for u in range(num_tasks) if indegree[u] == 0]
+
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        next_level = level[u] + 1
+        for k in range(ptr[u], ptr[u + 1]):
+            v = succ[k]
+            indegree[v] -= 1
+            if level[v] < next_level:
+                level[v] = next_level
+            if indegree[v] == 0:
+                order.append(v)
+
+    if len(order) < num_tasks:
+        raise ValueError("Le graphe des tâches contient des cycles")
+    return order, level
+
+
+def topological_order(num_tasks: int, src: np.ndarray,
+                      dst: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Algorithme de Kahn sur tableaux d'entiers, en O(V + E).
+
+    Retourne (ordre topologique, niveau de chaque tâche), le niveau étant la
+    longueur en arcs du plus long chemin qui mène à la tâche.
+    """
+    indptr, successors = edges_to_csr(num_tasks, src, dst)
+    order, level = _kahn(indptr.tolist(), successors.tolist(),
+                         np.bincount(dst, minlength=num_tasks).tolist())
+    return np.asarray(order, dtype=np.int64), np.asarray(level, dtype=np.int64)
+
+
+def _equal(a, b):
+    if np.asarray(a).dtype.kind == 'f' or np.asarray(b).dtype.kind == 'f':
+        return np.isclose(a, b)
+    return a == b
+
+
+def cpm_arrays(durations: np.ndarray, src: np.ndarray,
+               dst: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Passes avant et arrière du chemin critique sur tableaux, en O(V + E).
+
+    Retourne les dates au plus tôt / au plus tard, les marges totales et
+    libres ainsi que l'ordre topologique utilisé.
+    """
+    n = len(durations)
+    indptr, successors = edges_to_csr(n, src, dst)
+    ptr, succ = indptr.tolist(), successors.tolist()
+    order, level = _kahn(ptr, succ, np.bincount(dst, minlength=n).tolist())
+    dur = durations.tolist()
+
+    # Passe avant : dates au plus tôt
+    es = [0] * n
+    for u in order:
+        ef = es[u] + dur[u]
+        for k in range(ptr[u], ptr[u + 1]):
+            if ef > es[succ[k]]:
+                es[succ[k]] = ef
+    earliest_start = np.asarray(es, dtype=durations.dtype)
+    earliest_finish = earliest_start + durations
+    project_duration = earliest_finish.max() if n else durations.dtype.type(0)
+
+    # Passe arrière : dates au plus tard
+    lf = [project_duration.item()] * n
+    for u in reversed(order):
+        for k in range(ptr[u], ptr[u + 1]):
+            v = succ[k]
+            ls = lf[v] - dur[v]
+            if ls < lf[u]:
+                lf[u] = ls
+    latest_finish = np.asarray(lf, dtype=durations.dtype)
+    latest_start = latest_finish - durations
+
+    # Marge libre : retard possible sans décaler aucun successeur
+    next_start = np.full(n, project_duration, dtype=durations.dtype)
+    np.minimum.at(next_start, src, earliest_start[dst])
+
+    return {
+        'order': np.asarray(order, dtype=np.int64),
+        'level': np.asarray(level, dtype=np.int64),
+        'earliest_start': earliest_start,
+        'earliest_finish': earliest_finish,
+        'latest_start': latest_start,
+        'latest_finish': latest_finish,
+        'total_float': latest_start - earliest_start,
+        'free_float': next_start - earliest_finish,
+        'project_duration': project_duration,
+        'indptr': indptr,
+        'successors': successors,
+    }
+
+
+def _critical_chain(result: Dict[str, np.ndarray]) -> List[int]:
+    """
+    Extrait un chemin critique : une chaîne de tâches à marge nulle allant
+    de la date 0 à la fin du projet.
+    """
+    critical = _equal(result['total_float'], 0)
+    starts = np.flatnonzero(critical & _equal(result['earliest_start'], 0))
+    if len(starts) == 0:
+        return []
+    es, ef = result['earliest_start'], result['earliest_finish']
+    indptr, successors = result['indptr'], result['successors']
+    chain = [int(starts[0])]
+    while True:
+        u = chain[-1]
+        nxt = successors[indptr[u]:indptr[u + 1]]
+        nxt = nxt[critical[nxt] & _equal(es[nxt], ef[u])]
+        if len(nxt) == 0:
+            return chain
+        chain.append(int(nxt[0]))
+
+
+def cpm(tasks: Dict[Hashable, Dict]) -> CPMResult:
+    """
+    Méthode du chemin critique sur un dictionnaire de tâches
+    {id: {'duration': d, 'predecessors': [...]}}, sans passer par networkx.
+    """
+    ids, durations, src, dst = task_arrays(tasks)
+    result = cpm_arrays(durations, src, dst)
+    return CPMResult(
+        tasks=ids,
+        earliest_start=result['earliest_start'],
+        earliest_finish=result['earliest_finish'],
+        latest_start=result['latest_start'],
+        latest_finish=result['latest_finish'],
+        total_float=result['total_float'],
+        free_float=result['free_float'],
+        critical_path=[ids[i] for i in _critical_chain(result)],
+        project_duration=result['project_duration'].item(),
+    )
+
+
+class IncrementalSchedule:
+    """
+    Ordonnancement METRA maintenu incrémentalement.
+
+    L'objet conserve un ordre topologique (positions) et les dates au plus tôt.
+    Une modification de durée ou de prédécesseur ne repropage que le cône
+    aval réellement affecté, dans l'ordre topologique. L'ajout d'un arc
+    réordonne localement (Pearce–Kelly) et détecte un cycle sans reparcourir
+    tout le graphe.
+    """
+
+    def __init__(self, tasks: Dict[Hashable, Dict]):
+        ids, durations, src, dst = task_arrays(tasks)
+        result = cpm_arrays(durations, src, dst)
+        self._ids = ids
+        self._index = {task: i for i, task in enumerate(ids)}
+        self._duration = durations.tolist()
+        # Ensembles des deux côtés : un prédécesseur répété ne compte qu'une fois
+        self._preds = [set() for _ in ids]
+        self._succs = [set() for _ in ids]
+        for u, v in zip(src.tolist(), dst.tolist()):
+            self._preds[v].add(u)
+            self._succs[u].add(v)
+        self._pos = [0] * len(ids)
+        for position, u in enumerate(result['order'].tolist()):
+            self._pos[u] = position
+        self._es = result['earliest_start'].tolist()
+        self._finish_heap = []
+        self._rebuild_finish_heap()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _node(self, task: Hashable) -> int:
+        if task not in self._index:
+            raise ValueError(f"Tâche inconnue: {task}")
+        return self._index[task]
+
+    def _rebuild_finish_heap(self) -> None:
+        self._finish_heap = [(-(self._es[u] + self._duration[u]), u)
+                             for u in range(len(self._ids))]
+        heapq.heapify(self._finish_heap)
+
+    @property
+    def project_duration(self):
+        """Durée totale du projet (max des dates de fin au plus tôt)."""
+        heap = self._finish_heap
+        # Les entrées périmées sont retirées paresseusement
+        while heap and -heap[0][0] != self._es[heap[0][1]] + self._duration[heap[0][1]]:
+            heapq.heappop(heap)
+        return -heap[0][0] if heap else 0
+
+    @property
+    def earliest_dates(self) -> Dict[Hashable, int]:
+        return dict(zip(self._ids, self._es))
+
+    def earliest_start(self, task: Hashable):
+        return self._es[self._node(task)]
+
+    def _propagate(self, seed: int, force: bool = False) -> int:
+        """
+        Recalcule les dates au plus tôt à partir de `seed`, dans l'ordre
+        topologique, en s'arrêtant dès qu'une date ne change plus. Avec
+        force=True les successeurs de `seed` sont revus même si sa date de
+        début est inchangée (sa durée, donc sa fin, a changé).
+
+        Retourne le nombre de tâches recalculées.
+        """
+        pos, es, dur, preds, succs = self._pos, self._es, self._duration, self._preds, self._succs
+        heap = [(pos[seed], seed)]
+        queued = {seed}
+        visited = 0
+        while heap:
+            _, u = heapq.heappop(heap)
+            queued.discard(u)
+            visited += 1
+            start = max((es[p] + dur[p] for p in preds[u]), default=0)
+            if start == es[u] and not (force and u == seed):
+                continue
+            es[u] = start
+            heapq.heappush(self._finish_heap, (-(start + dur[u]), u))
+            for v in succs[u]:
+                if v not in queued:
+                    queued.add(v)
+                    heapq.heappush(heap, (pos[v], v))
+        if len(self._finish_heap) > 4 * len(self._ids) + 16:
+            self._rebuild_finish_heap()
+        return visited
+
+    def set_duration(self, task: Hashable, duration) -> int:
+        """Modifie la durée d'une tâche et repropage vers l'aval."""
+        u = self._node(task)
+        if duration == self._duration[u]:
+            return 0
+        self._duration[u] = duration
+        return self._propagate(u, force=True)
+
+    def add_task(self, task: Hashable, duration, predecessors=()) -> int:
+        """Ajoute une tâche (placée en fin d'ordre topologique)."""
+        if task in self._index:
+            raise ValueError(f"La tâche existe déjà: {task}")
+        preds = [self._node(p) for p in predecessors]
+        u = len(self._ids)
+        self._ids.append(task)
+        self._index[task] = u
+        self._duration.append(duration)
+        self._preds.append(set(preds))
+        self._succs.append(set())
+        for p in self._preds[u]:
+            self._succs[p].add(u)
+        # Les positions restent une permutation de 0..n-1
+        self._pos.append(u)
+        self._es.append(0)
+        return self._propagate(u, force=True)
+
+    def add_predecessor(self, task: Hashable, predecessor: Hashable) -> int:
+        """
+        Ajoute l'arc predecessor -> task. Lève ValueError si l'arc crée un cycle ;
+        l'ordonnancement reste alors inchangé.
+        """
+        v, u = self._node(task), self._node(predecessor)
+        if v in self._succs[u]:
+            return 0
+        if u == v:
+            raise ValueError("Le graphe des tâches contient des cycles")
+        if self._pos[v] < self._pos[u]:
+            self._reorder(u, v)
+        self._preds[v].add(u)
+        self._succs[u].add(v)
+        return self._propagate(v)
+
+    def remove_predecessor(self, task: Hashable, predecessor: Hashable) -> int:
+        """Retire l'arc predecessor -> task et repropage vers l'aval."""
+        v, u = self._node(task), self._node(predecessor)
+        if v not in self._succs[u]:
+            raise ValueError(f"{predecessor} n'est pas un prédécesseur de {task}")
+        self._succs[u].discard(v)
+        self._preds[v].discard(u)
+        return self._propagate(v)
+
+    def _reorder(self, u: int, v: int) -> None:
+        """
+        Pearce–Kelly : l'arc u -> v viole l'ordre (pos[v] < pos[u]). On explore
+        la zone affectée [pos[v], pos[u]] dans les deux sens puis on réattribue
+        les positions concernées.
+        """
+        pos = self._pos
+        upper, lower = pos[u], pos[v]
+
+        forward, stack, seen = [], [v], {v}
+        while stack:
+            x = stack.pop()
+            forward.append(x)
+            for y in self._succs[x]:
+                if y == u:
+                    raise ValueError("Le graphe des tâches contient des cycles")
+                if y not in seen and pos[y] < upper:
+                    seen.add(y)
+                    stack.append(y)
+
+        backward, stack = [], [u]
+        seen_back = {u}
+        while stack:
+            x = stack.pop()
+            backward.append(x)
+            for y in self._preds[x]:
+                if y not in seen_back and pos[y] > lower:
+                    seen_back.add(y)
+                    stack.append(y)
+
+        backward.sort(key=pos.__getitem__)
+        forward.sort(key=pos.__getitem__)
+        slots = sorted(pos[x] for x in backward + forward)
+        for x, slot in zip(backward + forward, slots):
+            pos[x] = slot
+
+
+class PertSimulation(NamedTuple):
+    """
+    Résultat d'une simulation PERT de Monte-Carlo.
+
+    `criticality[i]` est la proportion de scénarios où la tâche `tasks[i]`
+    est sur un chemin critique.
+    """
+    tasks: List[Hashable]
+    project_durations: np.ndarray
+    criticality: np.ndarray
+
+    def percentile(self, q: float) -> float:
+        return float(np.percentile(self.project_durations, q))
+
+
+def _pert_model(tasks: Dict[Hashable, Dict]) -> Tuple[List[Hashable], Dict[str, object]]:
+    """
+    Prépare les paramètres bêta-PERT et les groupes d'arcs par niveau
+    topologique, partagés par tous les lots de scénarios.
+    """
+    ids, src, dst = _dependency_arrays(tasks)
+    n = len(ids)
+    estimates = np.asarray([
+        (info.get('optimistic', info.get('duration')),
+         info.get('most_likely', info.get('duration')),
+         info.get('pessimistic', info.get('duration')))
+        for info in (tasks[task] for task in ids)
+    ], dtype=np.float64).reshape(n, 3)
+    low, mode, high = estimates.T
+    if np.any(low > mode) or np.any(mode > high):
+        raise ValueError("Les durées doivent vérifier optimiste <= probable <= pessimiste")
+
+    # Loi bêta-PERT : alpha = 1 + 4 (m - a) / (b - a), beta = 1 + 4 (b - m) / (b - a)
+    spread = high - low
+    safe = np.where(spread > 0, spread, 1.0)
+    _, level = topological_order(n, src, dst)
+
+    def groups(key_level, key, other):
+        # Arcs triés par (niveau, sommet regroupé) pour np.*.reduceat
+        order = np.lexsort((key, key_level))
+        key, other, key_level = key[order], other[order], key_level[order]
+        result = []
+        for lvl in np.unique(key_level):
+            lo, hi = np.searchsorted(key_level, [lvl, lvl + 1])
+            targets, starts = np.unique(key[lo:hi], return_index=True)
+            result.append((targets, starts, other[lo:hi]))
+        return result
+
+    model = {
+        'num_tasks': n,
+        'low': low[:, None],
+        'spread': spread[:, None],
+        'alpha': (1 + 4 * (mode - low) / safe)[:, None],
+        'beta': (1 + 4 * (high - mode) / safe)[:, None],
+        'forward': groups(level[dst], dst, src),
+        'backward': groups(level[src], src, dst)[::-1],
+    }
+    return ids, model
+
+
+def _simulate_chunk(model: Dict[str, object], num_scenarios: int,
+                    seed: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simule un lot de scénarios : toutes les durées sont tirées d'un coup dans
+    une matrice (tâches x scénarios), puis les dates sont propagées niveau par
+    niveau pour tous les scénarios à la fois.
+
+    Retourne (durées du projet, nombre de scénarios critiques par tâche).
+    """
+    n = model['num_tasks']
+    rng = np.random.default_rng(seed)
+    durations = model['low'] + model['spread'] * rng.beta(
+        model['alpha'], model['beta'], size=(n, num_scenarios))
+
+    start = np.zeros((n, num_scenarios))
+    for targets, starts, preds in model['forward']:
+        start[targets] = np.maximum.reduceat(start[preds] + durations[preds], starts, axis=0)
+    finish = start + durations
+    project = finish.max(axis=0) if n else np.zeros(num_scenarios)
+
+    latest_finish = np.broadcast_to(project, (n, num_scenarios)).copy()
+    for targets, starts, succs in model['backward']:
+        latest_finish[targets] = np.minimum.reduceat(
+            latest_finish[succs] - durations[succs], starts, axis=0)
+
+    critical = np.isclose(latest_finish, finish)
+    return project, critical.sum(axis=1)
+
+
+_PERT_MODEL = None
+
+
+def _init_pert_worker(model):
+    global _PERT_MODEL
+    _PERT_MODEL = model
+
+
+def _simulate_chunk_worker(args):
+    return _simulate_chunk(_PERT_MODEL, *args)
+
+
+def pert_monte_carlo(tasks: Dict[Hashable, Dict], num_scenarios: int = 10000,
+                     seed: Optional[int] = None, chunk_size: Optional[int] = None,
+                     processes: Optional[int] = None,
+                     progress: Optional[Callable] = None) -> PertSimulation:
+    """
+    Simulation PERT de Monte-Carlo.
+
+    Chaque tâche fournit 'optimistic', 'most_likely' et 'pessimistic' (ou à
+    défaut une 'duration' fixe) ainsi que ses 'predecessors'. Les scénarios
+    sont traités par lots de `chunk_size` ; avec processes > 1 les lots sont
+    répartis sur un pool de processus. Le résultat ne dépend que de `seed`,
+    pas du nombre de processus. `progress(lots_terminés, nombre_de_lots)` est
+    appelé après chaque lot.
+    """
+    if num_scenarios <= 0:
+        raise ValueError("Le nombre de scénarios doit être positif")
+    ids, model = _pert_model(tasks)
+    if chunk_size is None:
+        # Environ 4 millions de cellules par matrice (tâches x scénarios)
+        chunk_size = max(1, 4_000_000 // max(len(ids), 1))
+    sizes = [min(chunk_size, num_scenarios - k) for k in range(0, num_scenarios, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = list(zip(sizes, seeds))
+
+    if processes and processes > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(processes, initializer=_init_pert_worker,
+                                 initargs=(model,)) as pool:
+            results = []
+            for result in pool.map(_simulate_chunk_worker, jobs):
+                results.append(result)
+                if progress is not None:
+                    progress(len(results), len(jobs))
+    else:
+        results = []
+        for size, chunk_seed in jobs:
+            results.append(_simulate_chunk(model, size, chunk_seed))
+            if progress is not None:
+                progress(len(results), len(jobs))
+
+    project = np.concatenate([r[0] for r in results])
+    critical = np.sum([r[1] for r in results], axis=0)
+    return PertSimulation(tasks=ids, project_durations=project,
+                          criticality=critical / num_scenarios)
+
+
+class ResourceSchedule(NamedTuple):
+    """
+    Ordonnancement sous contraintes de ressources.
+
+    `usage[r]` est le profil d'utilisation de la ressource r : une liste de
+    points (date, quantité utilisée) valables jusqu'au point suivant.
+    """
+    tasks: List[Hashable]
+    start: np.ndarray
+    finish: np.ndarray
+    makespan: int
+    usage: Dict[Hashable, List[Tuple[int, int]]]
+
+
+def resource_constrained_schedule(tasks: Dict[Hashable, Dict],
+                                  capacities: Dict[Hashable, int]) -> ResourceSchedule:
+    """
+    Schéma de génération parallèle (list scheduling) piloté par événements.
+
+    Chaque tâche peut déclarer 'resources': {ressource: quantité}. Les tâches
+    prêtes sont servies par ordre de date de début au plus tard CPM (puis au
+    plus tôt) ; le temps saute directement d'une fin de tâche à la suivante
+    grâce à un tas d'événements, au lieu d'avancer pas à pas.
+
+    Les tâches prêtes sont regroupées par profil de demande : à chaque
+    démarrage on ne compare que la tête de chaque groupe compatible avec les
+    capacités libres, au lieu de reparcourir toute la file.
+    """
+    ids, durations, src, dst = task_arrays(tasks)
+    n = len(ids)
+    result = cpm_arrays(durations, src, dst)
+    ptr, succ = result['indptr'].tolist(), result['successors'].tolist()
+    latest, earliest = result['latest_start'].tolist(), result['earliest_start'].tolist()
+    dur = durations.tolist()
+
+    names = list(capacities)
+    resource_index = {name: k for k, name in enumerate(names)}
+    capacity = [capacities[name] for name in names]
+    demands = []
+    for task in ids:
+        demand = []
+        for name, amount in tasks[task].get('resources', {}).items():
+            if name not in resource_index:
+                raise ValueError(f"Ressource inconnue pour la tâche {task}: {name}")
+            if amount > capacities[name]:
+                raise ValueError(f"La tâche {task} demande plus que la capacité de {name}")
+            if amount > 0:
+                demand.append((resource_index[name], amount))
+        demands.append(tuple(sorted(demand)))
+
+    free = capacity[:]
+    usage = {name: [(0, 0)] for name in names}
+    remaining = np.bincount(dst, minlength=n).tolist()
+    start = [0] * n
+    events = []
+    ready = {}
+    time = 0
+
+    def release(u):
+        # Une tâche sans ressource démarre dès que ses prédécesseurs sont finis
+        if demands[u]:
+            heapq.heappush(ready.setdefault(demands[u], []), (latest[u], earliest[u], u))
+        else:
+            start[u] = time
+            heapq.heappush(events, (time + dur[u], u))
+
+    for u in range(n):
+        if remaining[u] == 0:
+            release(u)
+
+    while True:
+        while True:
+            best = None
+            for demand, queue in ready.items():
+                if (best is None or queue[0] < ready[best][0]) and \
+                        all(free[k] >= amount for k, amount in demand):
+                    best = demand
+            if best is None:
+                break
+            u = heapq.heappop(ready[best])[2]
+            if not ready[best]:
+                del ready[best]
+            for k, amount in best:
+                free[k] -= amount
+            start[u] = time
+            heapq.heappush(events, (time + dur[u], u))
+
+        for k, name in enumerate(names):
+            used = capacity[k] - free[k]
+            if usage[name][-1][0] == time:
+                usage[name][-1] = (time, used)
+            elif usage[name][-1][1] != used:
+                usage[name].append((time, used))
+
+        if not events:
+            break
+        time = events[0][0]
+        while events and events[0][0] == time:
+            _, u = heapq.heappop(events)
+            for k, amount in demands[u]:
+                free[k] += amount
+            for j in range(ptr[u], ptr[u + 1]):
+                v = succ[j]
+                remaining[v] -= 1
+                if remaining[v] == 0:
+                    release(v)
+
+    start_dates = np.asarray(start, dtype=durations.dtype)
+    finish_dates = start_dates + durations
+    makespan = finish_dates.max().item() if n else 0
+    return ResourceSchedule(tasks=ids, start=start_dates, finish=finish_dates,
+                            makespan=makespan, usage=usage)
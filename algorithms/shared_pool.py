@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from multiprocessing import Pool, shared_memory
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+# Tableaux partagés attachés par chaque processus de travail (voir shared_pool)
+SHARED: Dict[str, np.ndarray] = {}
+_SEGMENTS = []
+
+
+def _share(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Copie un tableau dans un nouveau segment de mémoire partagée.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    shared[...] = array
+    return shm, shared
+
+
+def _init_worker(layout: Dict[str, Tuple[str, tuple, str]]) -> None:
+    for key, (name, shape, dtype) in layout.items():
+        # Les processus du pool partagent le resource_tracker du parent,
+        # qui reste seul responsable de la libération du segment
+        shm = shared_memory.SharedMemory(name=name)
+        _SEGMENTS.append(shm)
+        SHARED[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+@contextmanager
+def shared_pool(arrays: Dict[str, np.ndarray], processes: int) -> Iterator[Optional[Pool]]:
+    """
+    Pool de `processes` processus travaillant sur `arrays` en mémoire
+    partagée : les tableaux du dictionnaire sont remplacés par leurs copies
+    partagées (les écritures du parent et des processus sont visibles de
+    tous), et chaque processus les retrouve dans SHARED sous la même clé.
+
+    Avec processes <= 1, rien n'est partagé et le pool vaut None. À la
+    sortie, le pool est arrêté, `arrays` est vidé et les segments libérés :
+    copier les résultats avant de sortir du bloc.
+    """
+    segments = []
+    pool = None
+    try:
+        if processes > 1:
+            layout = {}
+            for key in arrays:
+                shm, arrays[key] = _share(arrays[key])
+                segments.append(shm)
+                layout[key] = (shm.name, arrays[key].shape, arrays[key].dtype.str)
+            pool = Pool(processes, initializer=_init_worker, initargs=(layout,))
+        yield pool
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        arrays.clear()
+        for shm in segments:
+            shm.close()
+            shm.unlink()
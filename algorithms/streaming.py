@@ -0,0 +1,53 @@
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from algorithms.union_find import DisjointSet
+
+# Un bloc d'arêtes : (src, dst, {attribut: valeurs}), comme produit par EdgeStream
+EdgeChunk = Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]
+
+
+def kruskal_stream(chunks: Iterable[EdgeChunk]) -> Tuple[List[Tuple[int, int, float]], float]:
+    """
+    Forêt couvrante minimale d'un flux d'arêtes non orienté.
+
+    On ne garde que la forêt courante (au plus V - 1 arêtes) : chaque bloc est
+    fusionné avec elle et filtré par Kruskal. Une arête écartée ferme un cycle
+    dont elle est la plus lourde, elle ne peut donc appartenir à aucune forêt
+    minimale (propriété du cycle) ; la mémoire reste en O(V + bloc).
+    """
+    forest_src = np.empty(0, dtype=np.int64)
+    forest_dst = np.empty(0, dtype=np.int64)
+    forest_w = np.empty(0)
+    for src, dst, columns in chunks:
+        if 'weight' not in columns:
+            raise ValueError("Le graphe doit porter des poids ('weight') sur ses arêtes")
+        cand_src = np.concatenate([forest_src, src])
+        cand_dst = np.concatenate([forest_dst, dst])
+        cand_w = np.concatenate([forest_w, columns['weight']])
+        order = np.argsort(cand_w, kind='stable')
+        nodes = int(max(cand_src.max(initial=-1), cand_dst.max(initial=-1))) + 1
+        sets = DisjointSet(nodes)
+        keep = [k for k, u, v in zip(order.tolist(), cand_src[order].tolist(),
+                                     cand_dst[order].tolist()) if sets.union(u, v)]
+        forest_src, forest_dst, forest_w = cand_src[keep], cand_dst[keep], cand_w[keep]
+
+    edges = list(zip(forest_src.tolist(), forest_dst.tolist(), forest_w.tolist()))
+    return edges, float(forest_w.sum())
+
+
+def connected_components_stream(chunks: Iterable[EdgeChunk]) -> Tuple[List[int], int]:
+    """
+    Composantes connexes d'un flux d'arêtes par union-find, en un passage
+    et sans construire de liste d'adjacence.
+
+    Retourne (composante de chaque sommet, nombre de composantes).
+    """
+    sets = DisjointSet()
+    for src, dst, _ in chunks:
+        sets.grow(int(max(src.max(initial=-1), dst.max(initial=-1))) + 1)
+        union = sets.union
+        for u, v in zip(src.tolist(), dst.tolist()):
+            union(u, v)
+    return sets.labels(), sets.components
@@ -1,8 +1,18 @@
 import numpy as np
-from typing import List, Set, Tuple, Dict
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from algorithms.assignment import auction, dense_to_csr, hungarian
+from algorithms.csr import CompactGraph
+from algorithms.instrumentation import current, timed
+from algorithms.result_cache import memoized
+from algorithms.transport_kernels import (allocation_cost, as_int64, exact_tables,
+                                          int64_problem, least_cost, north_west,
+                                          real_tables, transportation_simplex)
+from algorithms.transshipment import transshipment
 
 class TransportAlgorithms:
     @staticmethod
+    @timed('transport.nord_ouest')
     def nord_ouest(supply: List[int], demand: List[int], costs: List[List[int]]) -> Tuple[List[List[int]], int]:
         """
         Implémentation corrigée de la méthode du coin Nord-Ouest.
@@ -10,6 +20,12 @@ class TransportAlgorithms:
         if sum(supply) != sum(demand):
             raise ValueError("L'offre totale doit être égale à la demande totale")
 
+        problem = TransportAlgorithms._int64_problem(supply, demand, costs)
+        if problem is not None:
+            supply_array, demand_array, cost_array = problem
+            allocation = north_west(supply_array, demand_array)
+            return allocation.tolist(), allocation_cost(allocation, cost_array)
+
         m, n = len(supply), len(demand)
         allocation = [[0 for _ in range(n)] for _ in range(m)]
         total_cost = 0
@@ -34,6 +50,7 @@ class TransportAlgorithms:
         return allocation, total_cost
 
     @staticmethod
+    @timed('transport.moindre_cout')
     def moindre_cout(supply: List[int], demand: List[int], costs: List[List[int]]) -> Tuple[List[List[int]], int]:
         """
         Implémentation corrigée de la méthode du coût minimum.
@@ -41,12 +58,22 @@ class TransportAlgorithms:
         if sum(supply) != sum(demand):
             raise ValueError("L'offre totale doit être égale à la demande totale")
 
+        recorder = current()
+        problem = TransportAlgorithms._int64_problem(supply, demand, costs)
+        if problem is not None:
+            supply_array, demand_array, cost_array = problem
+            allocation, allocations = least_cost(supply_array, demand_array, cost_array)
+            if recorder is not None:
+                recorder.count('moindre_cout.allocations', allocations)
+            return allocation.tolist(), allocation_cost(allocation, cost_array)
+
         m, n = len(supply), len(demand)
         allocation = [[0 for _ in range(n)] for _ in range(m)]
         total_cost = 0
         
         supply_temp = supply.copy()
         demand_temp = demand.copy()
+        allocations = 0
         
         while True:
             # Trouver la cellule avec le coût minimum parmi les cellules disponibles
@@ -72,27 +99,81 @@ class TransportAlgorithms:
             
             supply_temp[min_i] -= quantity
             demand_temp[min_j] -= quantity
-            
+            allocations += 1
+
+        if recorder is not None:
+            recorder.count('moindre_cout.allocations', allocations)
         return allocation, total_cost
 
     @staticmethod
+    @timed('transport.stepping_stone')
+    @memoized('transport.stepping_stone')
     def stepping_stone(initial_solution: List[List[int]], 
-                      costs: List[List[int]]) -> Tuple[List[List[int]], int]:
+                      costs: List[List[int]],
+                      progress: Optional[Callable] = None) -> Tuple[List[List[int]], int]:
         """
         Implémentation corrigée de la méthode du Stepping Stone.
+
+        `progress(pivots)` est appelé à chaque ligne examinée, ce qui permet
+        de suivre (et d'interrompre) les longues recherches de cycles.
+
+        Un problème d'affectation (n x n, offres et demandes toutes égales
+        à 1) est très dégénéré pour cette méthode : il est confié à la
+        méthode hongroise.
         """
+        if TransportAlgorithms._is_assignment(initial_solution):
+            recorder = current()
+            if recorder is not None:
+                recorder.count('stepping_stone.assignment_routed')
+            return TransportAlgorithms.affectation(costs)
+        return TransportAlgorithms._stepping_stone(initial_solution, costs, progress)
+
+    @staticmethod
+    def _stepping_stone(initial_solution: List[List[int]],
+                        costs: List[List[int]],
+                        progress: Optional[Callable] = None) -> Tuple[List[List[int]], int]:
+        """
+        Cas général du Stepping Stone. Sur une solution de base entière, les
+        coûts réduits sont évalués par potentiels (transportation_simplex),
+        en int64 quand les bornes le permettent et en entiers Python sinon :
+        le résultat ne dépend pas de la taille des coûts. Des coûts réels
+        sont évalués en float64 ; des quantités non entières gardent la
+        recherche exhaustive des cycles.
+        """
+        recorder = current()
+        tables = exact_tables(initial_solution, costs)
+        if tables is None:
+            tables = real_tables(initial_solution, costs)
+        if tables is not None:
+            allocation, cost_array = tables
+            if cost_array.dtype == object and recorder is not None:
+                recorder.count('transport.big_int_fallbacks')
+            result = transportation_simplex(allocation, cost_array, progress)
+            if result is not None:
+                allocation, passes, pivots = result
+                if recorder is not None:
+                    recorder.count('stepping_stone.pricing_passes', passes)
+                    recorder.count('stepping_stone.cycle_searches', pivots)
+                    recorder.count('stepping_stone.pivots', pivots)
+                return allocation.tolist(), allocation_cost(allocation, cost_array)
+
         m, n = len(initial_solution), len(initial_solution[0])
         current_solution = [row[:] for row in initial_solution]
+        pivots = searches = passes = 0
         
         while True:
+            passes += 1
             # Calculer les coûts réduits pour les cellules non utilisées
             best_improvement = 0
             best_path = None
             
             for i in range(m):
+                if progress is not None:
+                    progress(pivots)
                 for j in range(n):
                     if current_solution[i][j] == 0:
                         # Trouver un cycle pour cette cellule
+                        searches += 1
                         path = TransportAlgorithms._find_cycle(current_solution, i, j)
                         if path is None:
                             continue
@@ -121,6 +202,12 @@ class TransportAlgorithms:
             for i, j in best_path:
                 current_solution[i][j] += sign * min_quantity
                 sign *= -1
+            pivots += 1
+
+        if recorder is not None:
+            recorder.count('stepping_stone.pricing_passes', passes)
+            recorder.count('stepping_stone.cycle_searches', searches)
+            recorder.count('stepping_stone.pivots', pivots)
         
         # Calculer le coût total
         total_cost = sum(current_solution[i][j] * costs[i][j]
@@ -129,6 +216,76 @@ class TransportAlgorithms:
                         
         return current_solution, total_cost
 
+    @staticmethod
+    def _int64_problem(supply: List[int], demand: List[int], costs: List[List[int]]):
+        """
+        Tableaux int64 du problème, ou None (réels, ou bornes dépassées :
+        calcul en entiers Python, exact mais plus lent).
+        """
+        problem = int64_problem(supply, demand, costs)
+        recorder = current()
+        if (problem is None and recorder is not None
+                and as_int64(supply) is not None and as_int64(costs) is not None):
+            recorder.count('transport.big_int_fallbacks')
+        return problem
+
+    @staticmethod
+    def _is_assignment(solution: List[List[int]]) -> bool:
+        """Vrai si la solution est celle d'un problème n x n à offres et demandes unitaires."""
+        allocation = np.asarray(solution)
+        return (allocation.ndim == 2 and allocation.shape[0] == allocation.shape[1]
+                and bool(np.all(allocation.sum(axis=0) == 1))
+                and bool(np.all(allocation.sum(axis=1) == 1)))
+
+    @staticmethod
+    @timed('transport.affectation')
+    def affectation(costs: List[List[float]],
+                    method: str = 'hongroise') -> Tuple[List[List[int]], int]:
+        """
+        Problème d'affectation n x n (offres et demandes égales à 1).
+
+        method : 'hongroise' (Jonker-Volgenant, O(n³)) ou 'encheres'
+        (enchères avec ε-scaling, pour les grandes instances creuses : les
+        cellules de coût infini ou None sont interdites et ignorées).
+        Retourne (allocation 0/1, coût total) comme les autres méthodes.
+        """
+        n = len(costs)
+        if any(len(row) != n for row in costs):
+            raise ValueError("La matrice des coûts doit être carrée")
+        dense = np.array([[np.inf if c is None else c for c in row] for row in costs],
+                         dtype=float).reshape(n, n)
+        if method == 'hongroise':
+            assignment, total = hungarian(dense)
+        elif method == 'encheres':
+            assignment, total = auction(*dense_to_csr(dense))
+        else:
+            raise ValueError(f"Méthode d'affectation non supportée: {method}")
+
+        allocation = [[0] * n for _ in range(n)]
+        for i, j in enumerate(assignment.tolist()):
+            allocation[i][j] = 1
+        integral = all(isinstance(costs[i][j], (int, np.integer))
+                       for i, j in enumerate(assignment.tolist()))
+        return allocation, int(round(total)) if integral else total
+
+    @staticmethod
+    @timed('transport.transbordement')
+    def transbordement(G, supply: Dict[Hashable, int],
+                       demand: Dict[Hashable, int]) -> Tuple[Dict[Tuple, int], int]:
+        """
+        Transbordement : expédition à travers un réseau orienté (networkx ou
+        CompactGraph) dont les arcs portent un coût unitaire 'weight' et
+        éventuellement une capacité 'capacity'. Les sommets absents de
+        `supply` et `demand` sont des sommets de transit (entrepôts).
+
+        Retourne ({(u, v): quantité transportée sur l'arc}, coût total).
+        """
+        if not isinstance(G, CompactGraph):
+            G = CompactGraph.from_networkx(G)
+        if not G.directed:
+            raise ValueError("Le réseau de transbordement doit être orienté")
+        return transshipment(G, supply, demand)
+
     @staticmethod
     def _find_cycle(solution: List[List[int]], start_i: int, start_j: int) -> List[Tuple[int, int]]:
         """
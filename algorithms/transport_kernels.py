@@ -0,0 +1,294 @@
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from algorithms.union_find import DisjointSet
+
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def as_int64(values) -> Optional[np.ndarray]:
+    """
+    Tableau int64 de `values` si ce sont tous des entiers représentables sur
+    64 bits ; None sinon (réels, grands entiers Python, tableau irrégulier).
+    """
+    try:
+        array = np.asarray(values)
+    except (ValueError, OverflowError, TypeError):
+        return None
+    if array.dtype.kind not in 'iu':
+        return None
+    if array.dtype.kind == 'u' and array.size and int(array.max()) > INT64_MAX:
+        return None
+    return array.astype(np.int64)
+
+
+def fits_int64(costs: np.ndarray, total_quantity: int) -> bool:
+    """
+    Vrai si aucun calcul du noyau ne peut déborder : coût total (au plus
+    quantité totale x plus grand coût) et coûts réduits (au plus 2(m+n+1)
+    fois le plus grand coût, les potentiels sommant m + n coûts).
+    """
+    m, n = costs.shape
+    largest = max(int(costs.max(initial=0)), -int(costs.min(initial=0)))
+    return largest * max(total_quantity, 2 * (m + n + 1)) <= INT64_MAX
+
+
+def int64_problem(supply, demand, costs) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    (offre, demande, coûts) en int64 si le problème entier tient sans
+    débordement ; None s'il faut rester sur les entiers Python.
+    """
+    supply, demand, costs = as_int64(supply), as_int64(demand), as_int64(costs)
+    if supply is None or demand is None or costs is None:
+        return None
+    if (supply.ndim != 1 or demand.ndim != 1
+            or costs.shape != (len(supply), len(demand))
+            or supply.min(initial=0) < 0 or demand.min(initial=0) < 0):
+        return None
+    total = sum(supply.tolist())
+    if total != sum(demand.tolist()) or not fits_int64(costs, total):
+        return None
+    return supply, demand, costs
+
+
+def as_python_ints(values) -> Optional[np.ndarray]:
+    """
+    Tableau d'entiers Python (dtype object, précision illimitée) si toutes
+    les valeurs sont entières ; None sinon.
+    """
+    try:
+        array = np.array(values, dtype=object)
+    except (ValueError, TypeError):
+        return None
+    flat = array.ravel().tolist()
+    if not all(isinstance(x, (int, np.integer)) and not isinstance(x, bool) for x in flat):
+        return None
+    return np.array([int(x) for x in flat], dtype=object).reshape(array.shape)
+
+
+def exact_tables(allocation, costs) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    (allocation, coûts) d'une solution entière : en int64 si les bornes de
+    fits_int64 sont respectées, en entiers Python sinon ; None pour des
+    valeurs non entières ou des tables incohérentes.
+    """
+    allocation, costs = as_python_ints(allocation), as_python_ints(costs)
+    if (allocation is None or costs is None or allocation.ndim != 2
+            or allocation.shape != costs.shape or allocation.size == 0
+            or min(allocation.ravel().tolist()) < 0):
+        return None
+    wide = as_int64(costs.tolist())
+    total = sum(allocation.ravel().tolist())
+    if wide is not None and total <= INT64_MAX and fits_int64(wide, total):
+        return allocation.astype(np.int64), wide
+    return allocation, costs
+
+
+def real_tables(allocation, costs) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    (allocation int64, coûts float64) d'une solution entière à coûts réels
+    finis ; None sinon.
+    """
+    allocation = as_int64(allocation)
+    try:
+        costs = np.asarray(costs, dtype=np.float64)
+    except (ValueError, TypeError):
+        return None
+    if (allocation is None or allocation.ndim != 2 or allocation.shape != costs.shape
+            or allocation.size == 0 or allocation.min() < 0 or not np.isfinite(costs).all()):
+        return None
+    return allocation, costs
+
+
+def allocation_cost(allocation: np.ndarray, costs: np.ndarray) -> Union[int, float]:
+    """
+    Coût total d'une allocation : exact en int64 (bornes vérifiées par
+    fits_int64) ou en entiers Python pour des tableaux de dtype object,
+    réel pour des coûts float64.
+    """
+    if allocation.dtype == object or costs.dtype == object:
+        return int((allocation * costs).sum())
+    return np.einsum('ij,ij->', allocation, costs).item()
+
+
+def north_west(supply: np.ndarray, demand: np.ndarray) -> np.ndarray:
+    """
+    Coin Nord-Ouest sans boucle : les cumuls des offres et des demandes
+    découpent la quantité totale en segments, chacun affecté à la cellule
+    (ligne, colonne) dont il relève.
+    """
+    rows_end, cols_end = np.cumsum(supply), np.cumsum(demand)
+    bounds = np.union1d(rows_end, cols_end)
+    bounds = bounds[bounds > 0]
+    allocation = np.zeros((len(supply), len(demand)), dtype=np.int64)
+    if len(bounds) == 0:
+        # Quantité totale nulle : rien à affecter
+        return allocation
+    starts = np.concatenate([[0], bounds[:-1]])
+    rows = np.searchsorted(rows_end, starts, side='right')
+    cols = np.searchsorted(cols_end, starts, side='right')
+    allocation[rows, cols] = bounds - starts
+    return allocation
+
+
+def least_cost(supply: np.ndarray, demand: np.ndarray,
+               costs: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Coût minimum : les cellules sont triées une fois par coût (ordre ligne
+    par ligne en cas d'égalité, comme le balayage d'origine) puis parcourues
+    en sautant celles dont la ligne ou la colonne est épuisée.
+    Retourne (allocation, nombre d'allocations).
+    """
+    m, n = costs.shape
+    allocation = np.zeros((m, n), dtype=np.int64)
+    supply_left, demand_left = supply.tolist(), demand.tolist()
+    remaining = sum(supply_left)
+    allocations = 0
+    for cell in np.argsort(costs, axis=None, kind='stable').tolist():
+        if remaining == 0:
+            break
+        i, j = divmod(cell, n)
+        quantity = min(supply_left[i], demand_left[j])
+        if quantity == 0:
+            continue
+        allocation[i, j] = quantity
+        supply_left[i] -= quantity
+        demand_left[j] -= quantity
+        remaining -= quantity
+        allocations += 1
+    return allocation, allocations
+
+
+def _initial_basis(allocation: np.ndarray, costs: np.ndarray) -> Optional[List[Tuple[int, int]]]:
+    """
+    Base de m + n - 1 cellules formant un arbre couvrant lignes et colonnes :
+    les cellules occupées, complétées (solution dégénérée) par des cellules
+    vides de coût croissant. None si les cellules occupées forment un cycle.
+    """
+    m, n = allocation.shape
+    sets = DisjointSet(m + n)
+    basis = []
+    for i, j in zip(*(index.tolist() for index in np.nonzero(allocation))):
+        if not sets.union(i, m + j):
+            return None
+        basis.append((i, j))
+    if len(basis) < m + n - 1:
+        for cell in np.argsort(costs, axis=None, kind='stable').tolist():
+            i, j = divmod(cell, n)
+            if allocation[i, j] == 0 and sets.union(i, m + j):
+                basis.append((i, j))
+                if len(basis) == m + n - 1:
+                    break
+    return basis
+
+
+def transportation_simplex(allocation: np.ndarray, costs: np.ndarray,
+                           progress: Optional[Callable] = None) -> Optional[Tuple[np.ndarray, int, int]]:
+    """
+    Stepping Stone par potentiels (méthode MODI) sur une solution de base.
+
+    Les cellules de base forment un arbre sur les lignes et les colonnes :
+    un parcours de l'arbre donne les potentiels u, v (u[i] + v[j] = coût
+    des cellules de base), puis tous les coûts réduits c - u - v sont
+    évalués d'un coup, en int64 ou en entiers Python selon le dtype des
+    tableaux (voir exact_tables), ou en float64 avec une tolérance relative
+    aux coûts (voir real_tables). La cellule entrante est celle du coût
+    réduit le plus négatif (la première ligne par ligne en cas d'égalité)
+    et son cycle est le chemin de l'arbre entre sa ligne et sa colonne.
+    Au-delà de m + n pivots dégénérés consécutifs (quantité déplacée
+    nulle), la règle de Bland prend le relais : première cellule de coût
+    réduit négatif, cellule sortante de plus petit numéro. Une suite de
+    pivots dégénérés est alors finie, ce qui exclut tout cyclage.
+
+    Retourne (allocation optimale, passes, pivots), ou None si les cellules
+    occupées de la solution de départ contiennent un cycle.
+    """
+    m, n = allocation.shape
+    basis = _initial_basis(allocation, costs)
+    if basis is None:
+        return None
+    allocation = allocation.copy()
+    basic = np.zeros((m, n), dtype=bool)
+    for i, j in basis:
+        basic[i, j] = True
+    cost_rows = costs.tolist()
+    tolerance = 0
+    if costs.dtype.kind == 'f':
+        # Les potentiels réels accumulent des erreurs d'arrondi
+        tolerance = 1e-9 * max(1.0, float(np.abs(costs).max()))
+    passes = pivots = stalled = 0
+    while True:
+        passes += 1
+        if progress is not None:
+            progress(pivots)
+        # Arbre de base : sommets 0..m-1 (lignes) et m..m+n-1 (colonnes)
+        adjacency = [[] for _ in range(m + n)]
+        for i, j in basis:
+            adjacency[i].append(m + j)
+            adjacency[m + j].append(i)
+        parent = [-1] * (m + n)
+        depth = [0] * (m + n)
+        potential = [0] * (m + n)
+        seen = [False] * (m + n)
+        seen[0] = True
+        stack = [0]
+        while stack:
+            a = stack.pop()
+            for b in adjacency[a]:
+                if not seen[b]:
+                    seen[b] = True
+                    parent[b], depth[b] = a, depth[a] + 1
+                    cost = cost_rows[a][b - m] if a < m else cost_rows[b][a - m]
+                    potential[b] = cost - potential[a]
+                    stack.append(b)
+        u = np.asarray(potential[:m], dtype=costs.dtype)
+        v = np.asarray(potential[m:], dtype=costs.dtype)
+
+        reduced = costs - u[:, None] - v[None, :]
+        reduced[basic] = 0
+        cell = int(np.argmin(reduced))
+        if reduced.flat[cell] >= -tolerance:
+            break
+
+        def cycle(cell: int) -> Tuple[np.ndarray, np.ndarray]:
+            # Cellule entrante puis chemin de l'arbre entre sa colonne et sa ligne
+            i, j = divmod(cell, n)
+            a, b = m + j, i
+            up, down = [], []
+            while a != b:
+                if depth[a] >= depth[b]:
+                    up.append((a, parent[a]))
+                    a = parent[a]
+                else:
+                    down.append((b, parent[b]))
+                    b = parent[b]
+            cells = [(x, y - m) if x < m else (y, x - m) for x, y in up + down[::-1]]
+            return (np.asarray([i] + [r for r, _ in cells], dtype=np.int64),
+                    np.asarray([j] + [c for _, c in cells], dtype=np.int64))
+
+        rows, cols = cycle(cell)
+        minus = allocation[rows[1::2], cols[1::2]]
+        stalled = stalled + 1 if minus.min() == 0 else 0
+        if stalled > m + n:
+            # Longue suite de pivots dégénérés : règle de Bland jusqu'au
+            # prochain pivot qui déplace une quantité non nulle
+            cell = int(np.flatnonzero(reduced < -tolerance)[0])
+            rows, cols = cycle(cell)
+            minus = allocation[rows[1::2], cols[1::2]]
+            tied = np.flatnonzero(minus == minus.min())
+            numbers = rows[1::2][tied] * n + cols[1::2][tied]
+            leaving = 2 * int(tied[np.argmin(numbers)]) + 1
+        else:
+            # Cellule sortante : la première cellule « - » de plus petite quantité
+            leaving = 2 * int(np.argmin(minus)) + 1
+        signs = np.ones(len(rows), dtype=allocation.dtype)
+        signs[1::2] = -1
+        allocation[rows, cols] += signs * minus.min()
+        out = (int(rows[leaving]), int(cols[leaving]))
+        i, j = int(rows[0]), int(cols[0])
+        basic[out] = False
+        basic[i, j] = True
+        basis[basis.index(out)] = (i, j)
+        pivots += 1
+    return allocation, passes, pivots
@@ -0,0 +1,184 @@
+import heapq
+from typing import Dict, Hashable, List, Tuple
+
+import numpy as np
+
+from algorithms.csr import CompactGraph
+from algorithms.csr_algorithms import dijkstra_csr
+from algorithms.instrumentation import current
+
+
+def min_cost_flow(num_nodes: int, tail: np.ndarray, head: np.ndarray, cost: np.ndarray,
+                  capacity: np.ndarray, balance: List[int]) -> Tuple[List[float], float]:
+    """
+    Flot de coût minimum par plus courts chemins successifs, avec potentiels
+    (Dijkstra sur les coûts réduits, coûts d'arcs positifs ou nuls).
+
+    Le graphe résiduel est stocké en tableaux alignés sur les arcs (arc 2e :
+    sens direct de l'arc e, arc 2e+1 : sens inverse) : la mémoire reste
+    proportionnelle au nombre d'arcs. `balance[v]` > 0 est une offre,
+    < 0 une demande ; la capacité d'un arc peut être infinie.
+    Retourne (flot de chaque arc, coût total).
+    """
+    m = len(tail)
+    if sum(balance) != 0:
+        raise ValueError("L'offre totale doit être égale à la demande totale")
+    if m and np.min(cost) < 0:
+        raise ValueError("Les coûts des arcs doivent être positifs ou nuls")
+    start = np.empty(2 * m, dtype=np.int64)
+    start[0::2], start[1::2] = tail, head
+    order = np.argsort(start, kind='stable')
+    ptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(start, minlength=num_nodes), out=ptr[1:])
+    ptr, arcs = ptr.tolist(), order.tolist()
+    to = [0] * (2 * m)
+    to[0::2], to[1::2] = np.asarray(head).tolist(), np.asarray(tail).tolist()
+    arc_cost = [0] * (2 * m)
+    arc_cost[0::2] = np.asarray(cost).tolist()
+    arc_cost[1::2] = (-np.asarray(cost)).tolist()
+    residual = [0] * (2 * m)
+    residual[0::2] = np.asarray(capacity, dtype=float).tolist()
+
+    excess = list(balance)
+    potential = [0] * num_nodes
+    total = 0
+    augmentations = 0
+    while True:
+        sources = [v for v in range(num_nodes) if excess[v] > 0]
+        if not sources:
+            break
+        # Dijkstra multi-sources jusqu'au premier sommet en demande
+        dist = {v: 0 for v in sources}
+        pred = {}
+        done = set()
+        heap = [(0, v) for v in sources]
+        target = -1
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u in done:
+                continue
+            done.add(u)
+            if excess[u] < 0:
+                target = u
+                break
+            pu = potential[u]
+            for k in range(ptr[u], ptr[u + 1]):
+                a = arcs[k]
+                if residual[a] <= 0:
+                    continue
+                v = to[a]
+                nd = d + arc_cost[a] + pu - potential[v]
+                if nd < dist.get(v, float('inf')):
+                    dist[v] = nd
+                    pred[v] = a
+                    heapq.heappush(heap, (nd, v))
+        if target == -1:
+            raise ValueError("L'offre ne peut pas atteindre toute la demande")
+
+        # Potentiels : les coûts réduits restent positifs ou nuls
+        reach = dist[target]
+        for v in done:
+            potential[v] += dist[v] - reach
+
+        path = []
+        v = target
+        while v in pred:
+            a = pred[v]
+            path.append(a)
+            v = to[a ^ 1]
+        quantity = min(excess[v], -excess[target], *(residual[a] for a in path))
+        for a in path:
+            residual[a] -= quantity
+            residual[a ^ 1] += quantity
+            total += quantity * arc_cost[a]
+        excess[v] -= quantity
+        excess[target] += quantity
+        augmentations += 1
+
+    recorder = current()
+    if recorder is not None:
+        recorder.count('min_cost_flow.augmentations', augmentations)
+    # Le flot d'un arc est la capacité résiduelle de son arc inverse
+    return residual[1::2], total
+
+
+def _labels_to_balance(graph: CompactGraph, supply: Dict[Hashable, int],
+                       demand: Dict[Hashable, int]) -> List[int]:
+    balance = [0] * graph.num_nodes
+    for label, quantity in supply.items():
+        balance[graph.index(label)] += quantity
+    for label, quantity in demand.items():
+        balance[graph.index(label)] -= quantity
+    return balance
+
+
+def transshipment(graph: CompactGraph, supply: Dict[Hashable, int],
+                  demand: Dict[Hashable, int]) -> Tuple[Dict[Tuple[Hashable, Hashable], int], float]:
+    """
+    Transbordement sur un réseau orienté : offres, demandes, sommets de
+    transit (entrepôts) ; coûts unitaires dans `weight`, capacités
+    facultatives dans `capacity`.
+
+    Sans capacités, chaque unité suit un plus court chemin : quand le
+    nombre de couples (offre, demande) ne dépasse pas le nombre d'arcs,
+    les routes sont réduites par Dijkstra (dijkstra_csr, une recherche par
+    source arrêtée aux demandes) à un arc direct par couple, et le flot est
+    calculé sur ce réseau biparti. Sinon, il est calculé directement sur le
+    réseau. Aucune matrice dense n'est construite.
+
+    Retourne ({(u, v): quantité} sur les arcs du réseau, coût total).
+    """
+    if graph.weight is None:
+        raise ValueError("Le graphe doit porter des coûts ('weight') sur ses arcs")
+    balance = _labels_to_balance(graph, supply, demand)
+    sources = [v for v, b in enumerate(balance) if b > 0]
+    sinks = [v for v, b in enumerate(balance) if b < 0]
+    tail = np.repeat(np.arange(graph.num_nodes, dtype=np.int64), graph.degree())
+    head = graph.indices
+    integral = graph.weight.dtype.kind in 'iu'
+
+    flows: Dict[Tuple[Hashable, Hashable], int] = {}
+
+    def ship(u: int, v: int, quantity) -> None:
+        key = (graph.label(u), graph.label(v))
+        flows[key] = flows.get(key, 0) + quantity
+
+    if graph.capacity is None and len(sources) * len(sinks) <= len(head):
+        # Réduction des routes : un arc source -> demande au coût du plus court chemin
+        pair_tail, pair_head, pair_cost = [], [], []
+        for s, source in enumerate(sources):
+            # Les demandes d'une autre composante ne prolongent pas la recherche
+            reachable = [sink for sink in sinks if graph.connected(source, sink)]
+            if not reachable:
+                continue
+            dist, _ = dijkstra_csr(graph, source, reachable)
+            for t, sink in enumerate(sinks):
+                if dist[sink] != float('inf'):
+                    pair_tail.append(s)
+                    pair_head.append(len(sources) + t)
+                    pair_cost.append(dist[sink])
+        flow, total = min_cost_flow(len(sources) + len(sinks), np.asarray(pair_tail, dtype=np.int64),
+                                    np.asarray(pair_head, dtype=np.int64), np.asarray(pair_cost),
+                                    np.full(len(pair_tail), np.inf),
+                                    [balance[v] for v in sources] + [balance[v] for v in sinks])
+        # Report des quantités sur les arcs des plus courts chemins, source par source
+        shipped: Dict[int, List[Tuple[int, float]]] = {}
+        for k, quantity in enumerate(flow):
+            if quantity > 0:
+                shipped.setdefault(pair_tail[k], []).append(
+                    (sinks[pair_head[k] - len(sources)], quantity))
+        for s, deliveries in shipped.items():
+            _, pred = dijkstra_csr(graph, sources[s], [sink for sink, _ in deliveries])
+            for sink, quantity in deliveries:
+                v = sink
+                while v != sources[s]:
+                    ship(pred[v], v, int(quantity) if integral else quantity)
+                    v = pred[v]
+    else:
+        capacity = graph.capacity if graph.capacity is not None else np.full(len(head), np.inf)
+        flow, total = min_cost_flow(graph.num_nodes, tail, head, graph.weight, capacity, balance)
+        for k, quantity in enumerate(flow):
+            if quantity > 0:
+                ship(int(tail[k]), int(head[k]), int(quantity) if integral else quantity)
+
+    return flows, int(round(total)) if integral else total
@@ -0,0 +1,70 @@
+"""
+Benchmark des problèmes d'affectation (n x n, offres et demandes unitaires) :
+méthode hongroise, enchères sur matrice dense et sur matrice creuse, contre
+le cas général (Nord-Ouest puis Stepping Stone sans aiguillage).
+
+Usage : python -m benchmarks.bench_assignment [--sizes 10 100 500] [--degree 8]
+            [--general-limit 50] [--json]
+"""
+import argparse
+import time
+
+from algorithms.generators import random_assignment_problem
+from algorithms.transport import TransportAlgorithms
+from benchmarks.report import add_json_option, emit
+
+
+def _general(costs):
+    n = len(costs)
+    solution, _ = TransportAlgorithms.nord_ouest([1] * n, [1] * n, costs)
+    return TransportAlgorithms._stepping_stone(solution, costs)
+
+
+def run(sizes, degree, general_limit, seed):
+    results = []
+    for n in sizes:
+        dense = random_assignment_problem(n, seed=seed)
+        sparse = random_assignment_problem(n, seed=seed, degree=degree)
+        cases = [
+            ('hongroise', lambda: TransportAlgorithms.affectation(dense, 'hongroise')),
+            ('encheres', lambda: TransportAlgorithms.affectation(dense, 'encheres')),
+            ('hongroise[creux]', lambda: TransportAlgorithms.affectation(sparse, 'hongroise')),
+            ('encheres[creux]', lambda: TransportAlgorithms.affectation(sparse, 'encheres')),
+        ]
+        if n <= general_limit:
+            cases.insert(0, ('stepping_stone', lambda: _general(dense)))
+        for method, solve in cases:
+            start = time.perf_counter()
+            allocation, cost = solve()
+            elapsed = time.perf_counter() - start
+            # Vérifier que l'allocation est une affectation complète
+            assert all(sum(row) == 1 for row in allocation)
+            assert all(sum(column) == 1 for column in zip(*allocation))
+            results.append({
+                'n': n,
+                'method': method,
+                'cost': cost,
+                'seconds': round(elapsed, 4),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 50, 200, 500])
+    parser.add_argument('--degree', type=int, default=8,
+                        help="cellules permises par ligne des instances creuses")
+    parser.add_argument('--general-limit', type=int, default=50,
+                        help="taille maximale pour le cas général")
+    parser.add_argument('--seed', type=int, default=42)
+    add_json_option(parser)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.degree, args.general_limit, args.seed)
+    emit(results, [('n', 'n', 6), ('méthode', 'method', 18), ('coût', 'cost', 10),
+                   ('temps (s)', 'seconds', 10)], args.json)
+
+
+if __name__ == "__main__":
+    main()
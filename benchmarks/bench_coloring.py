@@ -0,0 +1,51 @@
+"""
+Benchmark des stratégies de coloration : nombre de couleurs contre temps.
+
+Usage : python -m benchmarks.bench_coloring [--sizes 1000 5000] [--density 0.01]
+"""
+import argparse
+import time
+
+import networkx as nx
+
+from algorithms.graph_algorithms import GraphAlgorithms
+from benchmarks.report import add_json_option, emit
+
+STRATEGIES = ('welsh_powell', 'dsatur', 'smallest_last')
+
+
+def run(sizes, density, seed):
+    results = []
+    for n in sizes:
+        G = nx.gnp_random_graph(n, density, seed=seed)
+        for strategy in STRATEGIES:
+            start = time.perf_counter()
+            colors, num_colors = GraphAlgorithms.coloration(G, strategy)
+            elapsed = time.perf_counter() - start
+            # Vérifier que la coloration est propre
+            assert all(colors[u] != colors[v] for u, v in G.edges())
+            results.append({
+                'nodes': n,
+                'edges': G.number_of_edges(),
+                'strategy': strategy,
+                'colors': num_colors,
+                'seconds': round(elapsed, 4),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--density', type=float, default=0.005)
+    parser.add_argument('--seed', type=int, default=42)
+    add_json_option(parser)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.density, args.seed)
+    emit(results, [('sommets', 'nodes', 8), ('arêtes', 'edges', 9), ('stratégie', 'strategy', 14),
+                   ('couleurs', 'colors', 9), ('temps (s)', 'seconds', 10)], args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark de mise à l'échelle du delta-stepping contre Dijkstra (tas
+binaire) : plus courts chemins depuis un sommet vers tous les autres, sur
+des graphes aléatoires pondérés de degré moyen fixé. Les distances doivent
+être identiques.
+
+Usage : python -m benchmarks.bench_delta_stepping [--sizes 100000 1000000]
+            [--processes 1 2 4] [--delta 10] [--degree 10] [--json]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from algorithms.csr_algorithms import dijkstra_csr
+from algorithms.delta_stepping import default_delta, delta_stepping_csr
+from algorithms.generators import random_graph
+from benchmarks.report import add_json_option, emit
+
+
+def run(sizes, processes, delta, degree, seed):
+    results = []
+    for n in sizes:
+        graph = random_graph(n, 'dijkstra', seed=seed, probability=degree / n)
+        start = time.perf_counter()
+        reference, _ = dijkstra_csr(graph, 0)
+        baseline = time.perf_counter() - start
+        reference = np.asarray(reference, dtype=float)
+        results.append({'nodes': n, 'edges': graph.num_edges, 'method': 'dijkstra',
+                        'processes': 1, 'delta': None, 'seconds': round(baseline, 4),
+                        'speedup': 1.0, 'identical': True})
+        width = delta if delta is not None else default_delta(graph)
+        for p in processes:
+            start = time.perf_counter()
+            dist, _ = delta_stepping_csr(graph, 0, width, p)
+            elapsed = time.perf_counter() - start
+            results.append({
+                'nodes': n,
+                'edges': graph.num_edges,
+                'method': 'delta_stepping',
+                'processes': p,
+                'delta': round(width, 4),
+                'seconds': round(elapsed, 4),
+                'speedup': round(baseline / elapsed, 2),
+                'identical': bool(np.array_equal(dist, reference)),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--delta', type=float, help="largeur des seaux (par défaut : default_delta)")
+    parser.add_argument('--degree', type=float, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    add_json_option(parser)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.processes, args.delta, args.degree, args.seed)
+    emit(results, [('sommets', 'nodes', 9), ('arêtes', 'edges', 10), ('méthode', 'method', 15),
+                   ('processus', 'processes', 9), ('temps (s)', 'seconds', 10),
+                   ('accélération', 'speedup', 12), ('identique', 'identical', 9)], args.json)
+
+
+if __name__ == "__main__":
+    main()
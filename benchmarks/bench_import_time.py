@@ -0,0 +1,113 @@
+"""
+Benchmark du temps de démarrage : coût d'import des modules (python -X importtime)
+et vérification qu'aucun module sans affichage ne charge Tk, matplotlib ou networkx.
+
+Usage : python -m benchmarks.bench_import_time [--repeat 5] [--save base.json]
+        [--baseline base.json] [--tolerance 0.2] [--json]
+
+Avec --baseline, le code de sortie est 1 si un module dépasse sa référence de
+plus de `tolerance` (fraction), ou si un import interdit apparaît.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+from benchmarks.report import add_json_option, emit, save_json
+
+# Modules qui doivent rester importables sans interface ni tracé
+HEADLESS_MODULES = (
+    'algorithms.graph_algorithms',
+    'algorithms.transport',
+    'utils.graph_io',
+    'utils.runner',
+    'utils.graph_utils',
+    'cli',
+    'server',
+)
+FORBIDDEN = ('tkinter', 'matplotlib', 'networkx')
+
+_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module):
+    """Un import à froid dans un nouvel interpréteur : (temps cumulé en ms, modules chargés)."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=_ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Échec de l'import de {module} :\n{proc.stderr}")
+    cumulative, loaded = None, set()
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            loaded.add(match.group(4))
+            if match.group(4) == module:
+                cumulative = int(match.group(2)) / 1000
+    return cumulative, loaded
+
+
+def run(modules, repeat):
+    results = []
+    for module in modules:
+        timings, loaded = [], set()
+        for _ in range(repeat):
+            ms, loaded = measure(module)
+            timings.append(ms)
+        forbidden = sorted(name for name in loaded if name in FORBIDDEN)
+        results.append({
+            'module': module,
+            'ms': round(min(timings), 2),
+            'modules': len(loaded),
+            'forbidden': forbidden,
+        })
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Liste des régressions par rapport à une référence {module: ms}."""
+    failures = []
+    for r in results:
+        if r['forbidden']:
+            failures.append(f"{r['module']} importe {', '.join(r['forbidden'])}")
+        reference = baseline.get(r['module'])
+        if reference is not None and r['ms'] > reference * (1 + tolerance):
+            failures.append(f"{r['module']} : {r['ms']} ms (référence {reference} ms)")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', default=list(HEADLESS_MODULES))
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="nombre d'imports à froid par module (on garde le minimum)")
+    parser.add_argument('--baseline', help="fichier JSON {module: ms} de référence")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--save', help="enregistre les temps mesurés comme référence")
+    add_json_option(parser)
+    args = parser.parse_args()
+
+    results = run(args.modules, args.repeat)
+    if args.save:
+        save_json(args.save, {r['module']: r['ms'] for r in results})
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    failures = compare(results, baseline, args.tolerance)
+
+    emit(results, [('module', 'module', 28), ('temps (ms)', 'ms', 11), ('modules', 'modules', 8),
+                   ('imports interdits', lambda r: ', '.join(r['forbidden']) or '-', 18)],
+         args.json, {'results': results, 'failures': failures})
+    if not args.json:
+        for failure in failures:
+            print(f"RÉGRESSION : {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Mesure de passage à l'échelle de la coloration parallèle spéculative.
+
+Usage : python -m benchmarks.bench_parallel_coloring [--nodes 1000000] [--degree 10]
+                                                     [--processes 1 2 4 8]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from algorithms.generators import random_graph
+from algorithms.parallel_coloring import speculative_coloring
+from benchmarks.report import add_json_option, emit
+
+
+def run(num_nodes, mean_degree, processes, seed):
+    graph = random_graph(num_nodes, 'welsh_powell', seed=seed,
+                         probability=mean_degree / max(num_nodes - 1, 1))
+    indptr, indices = graph.indptr, graph.indices
+    owner = np.repeat(np.arange(num_nodes), np.diff(indptr))
+    results = []
+    baseline = None
+    for p in processes:
+        start = time.perf_counter()
+        colors, rounds = speculative_coloring(indptr, indices, processes=p, seed=seed)
+        elapsed = time.perf_counter() - start
+        if np.any(colors[owner] == colors[indices]):
+            raise AssertionError("Coloration invalide")
+        baseline = baseline or elapsed
+        results.append({
+            'nodes': num_nodes,
+            'edges': len(indices) // 2,
+            'processes': p,
+            'rounds': rounds,
+            'colors': int(colors.max()) + 1,
+            'seconds': round(elapsed, 3),
+            'speedup': round(baseline / elapsed, 2),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--nodes', type=int, default=1_000_000)
+    parser.add_argument('--degree', type=int, default=10)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seed', type=int, default=42)
+    add_json_option(parser)
+    args = parser.parse_args()
+
+    results = run(args.nodes, args.degree, args.processes, args.seed)
+    emit(results, [('processus', 'processes', 9), ('tours', 'rounds', 6), ('couleurs', 'colors', 9),
+                   ('temps (s)', 'seconds', 10), ('accélération', 'speedup', 13)], args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Suite de benchmarks reproductible : chaque méthode de GraphAlgorithms et de
+TransportAlgorithms sur des entrées générées avec une graine fixe, à
+plusieurs tailles. Temps (minimum sur --repeat exécutions) et pic mémoire
+(tracemalloc, mesuré à part pour ne pas fausser les temps).
+
+Usage : python -m benchmarks.bench_suite [--scale small|medium|large]
+            [--methods dijkstra kruskal ...] [--output results.json]
+            [--baseline base.json] [--tolerance 0.25]
+
+Avec --baseline, les mesures plus lentes ou plus gourmandes que la référence
+au-delà de `tolerance` (fraction) sont signalées et le code de sortie est 1.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from algorithms import result_cache
+from algorithms.generators import (random_assignment_problem, random_graph, random_tasks,
+                                   random_transport_problem)
+from algorithms.graph_algorithms import GraphAlgorithms
+from algorithms.transport import TransportAlgorithms
+from benchmarks.report import print_header, print_row, save_json
+
+# Tailles par famille d'entrées : arêtes (graphes), m = n (transport), tâches (projets)
+SCALES = {
+    'small': {'graph': [1_000, 10_000], 'transport': [10, 50], 'tasks': [1_000]},
+    'medium': {'graph': [1_000, 10_000, 100_000], 'transport': [10, 50, 100],
+               'tasks': [1_000, 10_000]},
+    'large': {'graph': [1_000, 10_000, 100_000, 1_000_000], 'transport': [10, 50, 100, 500],
+              'tasks': [1_000, 10_000, 100_000]},
+}
+MEAN_DEGREE = 10
+# Écarts absolus en dessous desquels une différence est du bruit de mesure
+NOISE_FLOOR = {'seconds': 0.005, 'peak_mb': 0.5}
+
+
+class Workload(NamedTuple):
+    family: str
+    setup: Callable[[int, int], Tuple[Callable, tuple]]
+    limit: Optional[int] = None   # taille maximale raisonnable pour l'implémentation actuelle
+
+
+def _graph_shape(edges: int) -> Tuple[int, float]:
+    """(sommets, probabilité) d'un graphe de `edges` arêtes environ et de degré moyen MEAN_DEGREE."""
+    n = max(2 * edges // MEAN_DEGREE, 3)
+    extra = max(edges - (n - 1), 0)
+    return n, extra / ((n - 1) * (n - 2) / 2)
+
+
+@lru_cache(maxsize=8)
+def _graph(kind: str, edges: int, seed: int):
+    n, probability = _graph_shape(edges)
+    return random_graph(n, kind, seed=seed, probability=probability)
+
+
+@lru_cache(maxsize=4)
+def _transport(size: int, seed: int):
+    return random_transport_problem(size, size, seed=seed)
+
+
+@lru_cache(maxsize=4)
+def _assignment(size: int, seed: int):
+    return random_assignment_problem(size, seed=seed)
+
+
+@lru_cache(maxsize=4)
+def _tasks(size: int, seed: int):
+    """Projet à dépendances locales, avec durées PERT et une ressource."""
+    rng = np.random.default_rng(seed)
+    tasks = random_tasks(size, seed=seed, probability=0.3, window=10)
+    for info in tasks.values():
+        d = info['duration']
+        info.update(optimistic=max(d - 2, 1), most_likely=d, pessimistic=d + 4,
+                    resources={'equipe': int(rng.integers(1, 4))})
+    return tasks
+
+
+def _endpoints(graph):
+    return graph.label(0), graph.label(graph.num_nodes - 1)
+
+
+WORKLOADS: Dict[str, Workload] = {
+    'welsh_powell': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.welsh_powell, (_graph('welsh_powell', size, seed),))),
+    'coloration[dsatur]': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.coloration, (_graph('welsh_powell', size, seed), 'dsatur'))),
+    'coloration[smallest_last]': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.coloration, (_graph('welsh_powell', size, seed), 'smallest_last'))),
+    'coloration_parallele': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.coloration_parallele, (_graph('welsh_powell', size, seed), 2, seed))),
+    'dijkstra': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.dijkstra, (_graph('dijkstra', size, seed),
+                                   *_endpoints(_graph('dijkstra', size, seed))))),
+    'delta_stepping': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.delta_stepping, (_graph('dijkstra', size, seed),
+                                         *_endpoints(_graph('dijkstra', size, seed))))),
+    'kruskal': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.kruskal, (_graph('kruskal', size, seed),))),
+    'bellman_ford': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.bellman_ford, (_graph('bellman_ford', size, seed),
+                                       *_endpoints(_graph('bellman_ford', size, seed))))),
+    # networkx : conversion depuis le CSR comprise
+    'ford_fulkerson': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.ford_fulkerson, (_graph('ford_fulkerson', size, seed),
+                                         *_endpoints(_graph('ford_fulkerson', size, seed)))),
+        limit=100_000),
+    'generate_random_graph': Workload('graph', lambda size, seed: (
+        GraphAlgorithms.generate_random_graph, (_graph_shape(size)[0], 'dijkstra', seed, True,
+                                                _graph_shape(size)[1]))),
+    'potentiel_metra': Workload('tasks', lambda size, seed: (
+        GraphAlgorithms.potentiel_metra, (_tasks(size, seed),))),
+    'cpm': Workload('tasks', lambda size, seed: (GraphAlgorithms.cpm, (_tasks(size, seed),))),
+    'pert_monte_carlo': Workload('tasks', lambda size, seed: (
+        GraphAlgorithms.pert_monte_carlo, (_tasks(size, seed), 1000, seed))),
+    'resource_schedule': Workload('tasks', lambda size, seed: (
+        GraphAlgorithms.resource_schedule, (_tasks(size, seed), {'equipe': 5}))),
+    'nord_ouest': Workload('transport', lambda size, seed: (
+        TransportAlgorithms.nord_ouest, _transport(size, seed))),
+    'moindre_cout': Workload('transport', lambda size, seed: (
+        TransportAlgorithms.moindre_cout, _transport(size, seed))),
+    # Coûts réduits par potentiels : un parcours de l'arbre de base par pivot,
+    # ~12 s en 500 x 500 depuis le coin Nord-Ouest
+    'stepping_stone': Workload('transport', lambda size, seed: (
+        TransportAlgorithms.stepping_stone,
+        (TransportAlgorithms.nord_ouest(*_transport(size, seed))[0], _transport(size, seed)[2])),
+        limit=100),
+    'affectation[hongroise]': Workload('transport', lambda size, seed: (
+        TransportAlgorithms.affectation, (_assignment(size, seed), 'hongroise'))),
+    'affectation[encheres]': Workload('transport', lambda size, seed: (
+        TransportAlgorithms.affectation, (_assignment(size, seed), 'encheres'))),
+}
+
+
+def measure(func, args, repeat):
+    """(meilleur temps en s, pic mémoire en Mo) ; la mémoire est mesurée sur une exécution à part."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak / 2**20
+
+
+def run(methods, scale, seed, repeat, progress=None):
+    # Les répétitions mesurent les solveurs, pas le cache de résultats
+    result_cache.RESULTS = result_cache.ResultCache(capacity=0)
+    results = []
+    for name in methods:
+        workload = WORKLOADS[name]
+        for size in SCALES[scale][workload.family]:
+            record = {'method': name, 'family': workload.family, 'size': size}
+            if workload.limit is not None and size > workload.limit:
+                record['status'] = 'skipped'
+            else:
+                func, args = workload.setup(size, seed)
+                seconds, peak = measure(func, args, repeat)
+                record.update(status='ok', seconds=round(seconds, 6), peak_mb=round(peak, 3))
+            results.append(record)
+            if progress is not None:
+                progress(record)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Régressions de temps ou de mémoire par rapport à une référence."""
+    reference = {(r['method'], r['size']): r for r in baseline.get('results', [])
+                 if r.get('status') == 'ok'}
+    failures = []
+    for r in results:
+        base = reference.get((r['method'], r['size']))
+        if base is None or r['status'] != 'ok':
+            continue
+        for metric in ('seconds', 'peak_mb'):
+            if r[metric] - base[metric] > max(base[metric] * tolerance, NOISE_FLOOR[metric]):
+                failures.append(f"{r['method']} (taille {r['size']}) : {metric} "
+                                f"{r[metric]} contre {base[metric]}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--methods', nargs='+', choices=sorted(WORKLOADS),
+                        default=list(WORKLOADS))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="fichier JSON des résultats")
+    parser.add_argument('--baseline', help="résultats JSON de référence")
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    columns = [('méthode', 'method', 26), ('taille', 'size', 9),
+               ('temps (s)', lambda r: f"{r['seconds']:.4f}" if r['status'] == 'ok' else 'ignoré', 12),
+               ('pic (Mo)', lambda r: f"{r['peak_mb']:.2f}" if r['status'] == 'ok' else '-', 10)]
+    print_header(columns)
+    results = run(args.methods, args.scale, args.seed, args.repeat,
+                  lambda r: print_row(columns, r))
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'scale': args.scale,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    if args.output:
+        save_json(args.output, report)
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            failures = compare(results, json.load(f), args.tolerance)
+        for failure in failures:
+            print(f"RÉGRESSION : {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Sortie commune des benchmarks : option --json, tableau aligné ou JSON.
+
+Une colonne est un triplet (titre, valeur, largeur) : la valeur est la clé
+du résultat à afficher ou une fonction qui la calcule à partir du résultat.
+"""
+import argparse
+import json
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+Column = Tuple[str, Union[str, Callable[[Dict], Any]], int]
+
+
+def add_json_option(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--json', action='store_true', help="Sortie JSON")
+
+
+def _cell(column: Column, result: Dict) -> str:
+    _, value, _ = column
+    return str(value(result) if callable(value) else result[value])
+
+
+def print_header(columns: Sequence[Column]) -> None:
+    print(' '.join(f"{title:>{width}}" for title, _, width in columns))
+
+
+def print_row(columns: Sequence[Column], result: Dict) -> None:
+    print(' '.join(f"{_cell(column, result):>{column[2]}}" for column in columns), flush=True)
+
+
+def emit(results: List[Dict], columns: Sequence[Column], as_json: bool,
+         document: Any = None) -> None:
+    """
+    Affiche les résultats : en JSON (`document` s'il est fourni, les
+    résultats sinon) ou en tableau, une ligne par résultat.
+    """
+    if as_json:
+        print(json.dumps(results if document is None else document, indent=2))
+        return
+    print_header(columns)
+    for result in results:
+        print_row(columns, result)
+
+
+def save_json(path: str, document: Any) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
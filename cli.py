@@ -0,0 +1,60 @@
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from utils.runner import ALGORITHMS, run_file
+
+
+def _parse_param(text: str):
+    """Paramètre cle=valeur ; la valeur est lue en JSON si possible (nombres, listes...)."""
+    key, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Paramètre invalide (attendu cle=valeur): {text}")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Exécution sans interface graphique des algorithmes de graphes "
+                    "et de transport ; une ligne JSON par fichier traité.")
+    parser.add_argument('inputs', nargs='+',
+                        help="fichiers problèmes (.json) ou graphes (CSV/TSV, GraphML, .cgraph)")
+    parser.add_argument('-a', '--algorithm', choices=sorted(ALGORITHMS),
+                        help="algorithme à appliquer (obligatoire pour les fichiers de graphe)")
+    parser.add_argument('-p', '--param', action='append', type=_parse_param, default=[],
+                        help="argument de l'algorithme, par exemple -p start=X0")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="nombre de processus pour répartir les fichiers")
+    parser.add_argument('-m', '--metrics', action='store_true',
+                        help="ajoute les compteurs et chronomètres des solveurs à chaque ligne")
+    parser.add_argument('-o', '--output', help="fichier de sortie (sortie standard par défaut)")
+    args = parser.parse_args(argv)
+
+    task = partial(run_file, algorithm=args.algorithm, params=dict(args.param),
+                   metrics=args.metrics)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    failures = 0
+    parallel = args.jobs > 1 and len(args.inputs) > 1
+    executor = ProcessPoolExecutor(max_workers=args.jobs) if parallel else None
+    try:
+        records = executor.map(task, args.inputs) if parallel else map(task, args.inputs)
+        # Les résultats sont écrits dans l'ordre des fichiers, au fur et à mesure
+        for record in records:
+            failures += record['status'] != 'ok'
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            out.flush()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
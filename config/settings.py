@@ -19,7 +19,26 @@ GRAPH_SETTINGS = {
     'EDGE_WIDTH': 2,
     'RANDOM_EDGE_PROBABILITY': 0.3,
     'MIN_WEIGHT': 1,
-    'MAX_WEIGHT': 100
+    'MAX_WEIGHT': 100,
+    # Rendu des grands graphes
+    'LARGE_GRAPH_NODES': 200,      # au-delà : placement vectorisé et LineCollection
+    'LABEL_THRESHOLD': 150,        # étiquettes affichées sous ce nombre de sommets visibles
+    'EDGE_LABEL_THRESHOLD': 300,   # poids des arêtes affichés sous ce nombre d'arêtes
+    'MAX_DRAWN_EDGES': 50000,      # au-delà : échantillon aléatoire des arêtes
+    'MAX_DRAWN_NODES': 20000,      # au-delà : densité agrégée (hexbin) au lieu des points
+    # Cache des placements
+    'LAYOUT_CACHE_SIZE': 16,       # nombre de graphes gardés en mémoire (LRU)
+    'LAYOUT_CACHE_DIR': None,      # répertoire de persistance sur disque (None : mémoire seule)
+    'LAYOUT_SEED': 0,
+    # Solutions de transport
+    'TRANSPORT_TABLE_CELLS': 144,    # au-delà : carte de chaleur et vue paginée
+    'TRANSPORT_PAGE_SIZE': (25, 8),  # (sources, destinations) par page de la vue détaillée
+}
+
+# Cache des résultats (kruskal, welsh_powell, stepping_stone)
+CACHE_SETTINGS = {
+    'RESULT_CACHE_SIZE': 0,        # nombre de résultats gardés en mémoire (LRU, 0 : aucun)
+    'RESULT_CACHE_DIR': None,      # répertoire de persistance sur disque (None : mémoire seule)
 }
 
 # Couleurs pour les algorithmes
@@ -1,10 +1,11 @@
-import random
 import tkinter as tk
 from tkinter import ttk, messagebox
 from config.settings import GUI_SETTINGS, ERROR_MESSAGES
 from utils.graph_utils import GraphVisualizer
+from algorithms.generators import random_tasks, random_transport_problem
 from algorithms.graph_algorithms import GraphAlgorithms
 from algorithms.transport import TransportAlgorithms
+from gui.worker import BackgroundJob
 
 class BaseDialog:
     def __init__(self, parent, title):
@@ -12,11 +13,60 @@ class BaseDialog:
         self.dialog.title(title)
         self.dialog.geometry("300x200")
         self.dialog.config(bg=GUI_SETTINGS['BACKGROUND_COLOR'])
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+        self.job = None
         self.setup_ui()
 
     def setup_ui(self):
         pass
 
+    def close(self):
+        if self.job is not None:
+            self.job.cancel()
+        self.dialog.destroy()
+
+    def run_in_background(self, compute, display):
+        """
+        Exécute compute(progress) hors du thread Tk, avec un suivi de la
+        progression et un bouton d'annulation. display(résultat) est ensuite
+        appelé dans le thread Tk, puis la boîte de dialogue est fermée.
+        """
+        if self.job is not None:
+            return
+        status = tk.Label(self.dialog, text="Calcul en cours...",
+                          bg=GUI_SETTINGS['BACKGROUND_COLOR'])
+        status.pack(pady=5)
+        cancel_button = tk.Button(self.dialog, text="Annuler")
+        cancel_button.pack(pady=5)
+
+        def finish():
+            self.job = None
+            status.destroy()
+            cancel_button.destroy()
+
+        def on_done(result):
+            finish()
+            display(result)
+            self.dialog.destroy()
+
+        def on_error(error):
+            finish()
+            if not isinstance(error, ValueError):
+                raise error
+            messagebox.showerror("Erreur", str(error))
+
+        def on_progress(done, total=None):
+            text = f"{done} / {total}" if total else str(done)
+            status.config(text=f"Calcul en cours... {text}")
+
+        def on_cancel():
+            finish()
+            messagebox.showinfo("Annulé", "Le calcul a été annulé")
+
+        self.job = BackgroundJob(self.dialog, compute, on_done, on_error,
+                                 on_progress, on_cancel).start()
+        cancel_button.config(command=self.job.cancel)
+
     def validate_input(self):
         pass
 
@@ -34,6 +84,14 @@ class WelshPowellDialog(BaseDialog):
         self.vertices_entry = tk.Entry(self.dialog)
         self.vertices_entry.pack(pady=5)
 
+        # Stratégie de coloration
+        self.strategy_var = tk.StringVar(value="welsh_powell")
+        tk.OptionMenu(
+            self.dialog,
+            self.strategy_var,
+            "welsh_powell", "dsatur", "smallest_last", "parallel"
+        ).pack(pady=5)
+
         tk.Button(
             self.dialog,
             text="Générer",
@@ -46,12 +104,14 @@ class WelshPowellDialog(BaseDialog):
             if num_vertices <= 0:
                 raise ValueError(ERROR_MESSAGES['invalid_vertices'])
 
-            G = GraphAlgorithms.generate_random_graph(num_vertices, "welsh_powell")
-            colors, num_colors = GraphAlgorithms.welsh_powell(G)
-            
-            visualizer = GraphVisualizer()
-            visualizer.display_welsh_powell(G, colors, num_colors)
-            self.dialog.destroy()
+            strategy = self.strategy_var.get()
+
+            def compute(progress):
+                G = GraphAlgorithms.generate_random_graph(num_vertices, "welsh_powell")
+                return (G,) + tuple(GraphAlgorithms.coloration(G, strategy))
+
+            self.run_in_background(
+                compute, lambda result: GraphVisualizer().display_welsh_powell(*result))
             
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
@@ -112,12 +172,13 @@ class DijkstraDialog(BaseDialog):
             if start_index >= num_vertices or end_index >= num_vertices:
                 raise ValueError(ERROR_MESSAGES['invalid_node_index'])
 
-            G = GraphAlgorithms.generate_random_graph(num_vertices, "dijkstra")
-            path, path_length = GraphAlgorithms.dijkstra(G, start_node, end_node)
+            def compute(progress):
+                G = GraphAlgorithms.generate_random_graph(num_vertices, "dijkstra", compact=True)
+                path, path_length = GraphAlgorithms.dijkstra(G, start_node, end_node, progress)
+                return G.to_networkx(), path, path_length
 
-            visualizer = GraphVisualizer()
-            visualizer.display_dijkstra(G, path, path_length)
-            self.dialog.destroy()
+            self.run_in_background(
+                compute, lambda result: GraphVisualizer().display_dijkstra(*result))
 
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
@@ -179,12 +240,15 @@ class BellmanFordDialog(BaseDialog):
             if start_index >= num_vertices or end_index >= num_vertices:
                 raise ValueError(ERROR_MESSAGES['invalid_node_index'])
 
-            G = GraphAlgorithms.generate_random_graph(num_vertices, "bellman_ford")
-            path, path_length = GraphAlgorithms.bellman_ford(G, start_node, end_node)
+            def compute(progress):
+                G = GraphAlgorithms.generate_random_graph(num_vertices, "bellman_ford",
+                                                          compact=True)
+                path, path_length = GraphAlgorithms.bellman_ford(G, start_node, end_node,
+                                                                 progress)
+                return G.to_networkx(), path, path_length
 
-            visualizer = GraphVisualizer()
-            visualizer.display_bellman_ford(G, path, path_length)
-            self.dialog.destroy()
+            self.run_in_background(
+                compute, lambda result: GraphVisualizer().display_bellman_ford(*result))
 
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
@@ -215,12 +279,12 @@ class KruskalDialog(BaseDialog):
             if num_vertices <= 0:
                 raise ValueError(ERROR_MESSAGES['invalid_vertices'])
 
-            G = GraphAlgorithms.generate_random_graph(num_vertices, "kruskal")
-            mst_edges, total_weight = GraphAlgorithms.kruskal(G)
+            def compute(progress):
+                G = GraphAlgorithms.generate_random_graph(num_vertices, "kruskal")
+                return (G,) + tuple(GraphAlgorithms.kruskal(G))
 
-            visualizer = GraphVisualizer()
-            visualizer.display_kruskal(G, mst_edges, total_weight)
-            self.dialog.destroy()
+            self.run_in_background(
+                compute, lambda result: GraphVisualizer().display_kruskal(*result))
 
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
@@ -251,13 +315,14 @@ class FordFulkersonDialog(BaseDialog):
             if num_vertices <= 0:
                 raise ValueError(ERROR_MESSAGES['invalid_vertices'])
 
-            G = GraphAlgorithms.generate_random_graph(num_vertices, "ford_fulkerson")
-            flow_value, flow_dict, cut_value, partition = GraphAlgorithms.ford_fulkerson(
-                G, 0, num_vertices-1)
+            def compute(progress):
+                G = GraphAlgorithms.generate_random_graph(num_vertices, "ford_fulkerson")
+                flow_value, flow_dict, cut_value, partition = GraphAlgorithms.ford_fulkerson(
+                    G, 0, num_vertices-1)
+                return G, flow_dict, flow_value, partition
 
-            visualizer = GraphVisualizer()
-            visualizer.display_ford_fulkerson(G, flow_dict, flow_value, partition)
-            self.dialog.destroy()
+            self.run_in_background(
+                compute, lambda result: GraphVisualizer().display_ford_fulkerson(*result))
 
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
@@ -288,17 +353,13 @@ class PotentielMetraDialog(BaseDialog):
             if num_tasks <= 0:
                 raise ValueError(ERROR_MESSAGES['invalid_vertices'])
 
-            tasks = {}
-            for i in range(num_tasks):
-                duration = random.randint(1, 10)
-                predecessors = [j for j in range(i) if random.random() < 0.3]
-                tasks[i] = {'duration': duration, 'predecessors': predecessors}
+            tasks = random_tasks(num_tasks)
 
-            early_dates, project_duration = GraphAlgorithms.potentiel_metra(tasks)
+            def compute(progress):
+                return (tasks,) + tuple(GraphAlgorithms.potentiel_metra(tasks))
 
-            visualizer = GraphVisualizer()
-            visualizer.display_potentiel_metra(tasks, early_dates, project_duration)
-            self.dialog.destroy()
+            self.run_in_background(
+                compute, lambda result: GraphVisualizer().display_potentiel_metra(*result))
 
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
@@ -339,37 +400,27 @@ class TransportDialog(BaseDialog):
             if num_sources <= 0 or num_destinations <= 0:
                 raise ValueError("Le nombre de sources et de destinations doit être positif")
 
-            # Générer des données aléatoires
-            supply = [random.randint(50, 100) for _ in range(num_sources)]
-            demand = [random.randint(50, 100) for _ in range(num_destinations)]
-            
-            # Équilibrer l'offre et la demande
-            total_supply = sum(supply)
-            total_demand = sum(demand)
-            if total_supply > total_demand:
-                demand[-1] += total_supply - total_demand
-            elif total_demand > total_supply:
-                supply[-1] += total_demand - total_supply
-
-            costs = [[random.randint(10, 100) for _ in range(num_destinations)] 
-                    for _ in range(num_sources)]
-
-            # Résoudre selon la méthode choisie
-            if self.method == "nord_ouest":
-                solution, total_cost = TransportAlgorithms.nord_ouest(supply, demand, costs)
-            elif self.method == "moindre_cout":
-                solution, total_cost = TransportAlgorithms.moindre_cout(supply, demand, costs)
-            else:  # stepping_stone
-                initial_solution, _ = TransportAlgorithms.nord_ouest(supply, demand, costs)
-                solution, total_cost = TransportAlgorithms.stepping_stone(initial_solution, costs)
+            # Générer des données aléatoires (offre et demande équilibrées)
+            supply, demand, costs = random_transport_problem(num_sources, num_destinations)
 
-            # ✅ Définir la méthode utilisée
             method_name = self.method
 
-            # ✅ Appel de la visualisation avec method_name
-            visualizer = GraphVisualizer()
-            visualizer.display_transport_solution(supply, demand, costs, solution, total_cost, method_name)
-            self.dialog.destroy()
+            # Résoudre selon la méthode choisie, hors du thread Tk
+            def compute(progress):
+                if method_name == "nord_ouest":
+                    return TransportAlgorithms.nord_ouest(supply, demand, costs)
+                if method_name == "moindre_cout":
+                    return TransportAlgorithms.moindre_cout(supply, demand, costs)
+                # stepping_stone
+                initial_solution, _ = TransportAlgorithms.nord_ouest(supply, demand, costs)
+                return TransportAlgorithms.stepping_stone(initial_solution, costs, progress)
+
+            def display(result):
+                solution, total_cost = result
+                GraphVisualizer().display_transport_solution(
+                    supply, demand, costs, solution, total_cost, method_name)
+
+            self.run_in_background(compute, display)
         #hhhh
         except ValueError as e:
             messagebox.showerror("Erreur", str(e))
\ No newline at end of file
@@ -0,0 +1,104 @@
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable, Optional
+
+
+class Cancelled(Exception):
+    """Levée dans le calcul en arrière-plan lorsque l'utilisateur l'annule."""
+
+
+class BackgroundJob:
+    """
+    Exécute un calcul dans un thread de travail sans bloquer la boucle Tk.
+
+    `target(progress)` reçoit une fonction de progression à transmettre aux
+    solveurs ; chaque appel lève Cancelled si l'annulation a été demandée.
+    Résultat, erreur et progression sont déposés dans une file que la boucle
+    Tk relève par `widget.after` : les rappels on_done, on_error et
+    on_progress s'exécutent toujours dans le thread principal.
+
+    Un calcul sans point de progression ne peut pas être interrompu : son
+    résultat est alors simplement ignoré à l'annulation.
+    """
+
+    def __init__(self, widget, target: Callable[[Callable], Any],
+                 on_done: Callable[[Any], None],
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 on_progress: Optional[Callable[..., None]] = None,
+                 on_cancel: Optional[Callable[[], None]] = None,
+                 poll_ms: int = 50):
+        self.widget = widget
+        self.target = target
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.poll_ms = poll_ms
+        self._cancel = threading.Event()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def start(self) -> 'BackgroundJob':
+        self._thread.start()
+        self.widget.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def _progress(self, *values) -> None:
+        if self._cancel.is_set():
+            raise Cancelled()
+        self._queue.put(('progress', values))
+
+    def _run(self) -> None:
+        try:
+            self._queue.put(('done', self.target(self._progress)))
+        except Cancelled:
+            self._queue.put(('cancelled', None))
+        except Exception as e:
+            self._queue.put(('error', e))
+
+    def _poll(self) -> None:
+        try:
+            alive = self.widget.winfo_exists()
+        except tk.TclError:
+            alive = False
+        if not alive:
+            # Fenêtre détruite : le calcul s'arrête au prochain point de progression
+            self.cancel()
+            return
+
+        progress, outcome = None, None
+        try:
+            while outcome is None:
+                kind, value = self._queue.get_nowait()
+                if kind == 'progress':
+                    # Seule la dernière progression est affichée
+                    progress = value
+                else:
+                    outcome = (kind, value)
+        except queue.Empty:
+            pass
+
+        if progress is not None and self.on_progress is not None and not self.cancelled:
+            self.on_progress(*progress)
+        if outcome is None:
+            self.widget.after(self.poll_ms, self._poll)
+            return
+
+        kind, value = outcome
+        if kind == 'cancelled' or self.cancelled:
+            if self.on_cancel is not None:
+                self.on_cancel()
+        elif kind == 'error':
+            if self.on_error is None:
+                raise value
+            self.on_error(value)
+        else:
+            self.on_done(value)
@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+import sys
+
+from utils.server import SolveServer
+
+
+async def _serve(args) -> None:
+    async with SolveServer(workers=args.workers, queue_size=args.queue_size,
+                           batch_window=args.batch_window / 1000, max_batch=args.max_batch,
+                           root=args.root) as solver:
+        server = await solver.start(args.host, args.port, args.unix)
+        where = args.unix or ', '.join(str(s.getsockname()) for s in server.sockets)
+        print(f"Serveur à l'écoute sur {where}", file=sys.stderr, flush=True)
+        await server.serve_forever()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serveur local des algorithmes de graphes et de transport : "
+                    "une requête JSON par ligne, une réponse JSON par ligne.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="socket Unix à utiliser à la place de TCP")
+    parser.add_argument('-w', '--workers', type=int, help="processus de calcul (tous les cœurs par défaut)")
+    parser.add_argument('--queue-size', type=int, default=256,
+                        help="calculs en attente au-delà desquels les clients sont ralentis")
+    parser.add_argument('--batch-window', type=float, default=2.0,
+                        help="attente (ms) pour regrouper les plus courts chemins d'un même graphe")
+    parser.add_argument('--max-batch', type=int, default=64)
+    parser.add_argument('--root', default='.',
+                        help="répertoire de base des graphes désignés par un chemin")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from algorithms.assignment import auction, dense_to_csr, hungarian
+from algorithms.generators import random_assignment_problem
+from algorithms.transport import TransportAlgorithms
+
+
+def _brute_force(costs):
+    """Coût minimal sur toutes les affectations des lignes à des colonnes distinctes."""
+    C = np.asarray([[np.inf if c is None else c for c in row] for row in costs], dtype=float)
+    n, m = C.shape
+    return min(sum(C[i, j] for i, j in enumerate(columns))
+               for columns in itertools.permutations(range(m), n))
+
+
+def _assert_permutation(allocation):
+    allocation = np.asarray(allocation)
+    assert allocation.sum(axis=0).tolist() == [1] * len(allocation)
+    assert allocation.sum(axis=1).tolist() == [1] * len(allocation)
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('method', ['hongroise', 'encheres'])
+def test_dense_matches_brute_force(seed, method):
+    n = 2 + seed % 6
+    costs = random_assignment_problem(n, seed=seed)
+    allocation, total = TransportAlgorithms.affectation(costs, method)
+    _assert_permutation(allocation)
+    assert total == _brute_force(costs)
+    assert total == sum(c for row, cost_row in zip(allocation, costs)
+                        for a, c in zip(row, cost_row) if a)
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('method', ['hongroise', 'encheres'])
+def test_sparse_matches_brute_force(seed, method):
+    costs = random_assignment_problem(7, seed=seed, degree=2)
+    allocation, total = TransportAlgorithms.affectation(costs, method)
+    _assert_permutation(allocation)
+    assert all(costs[i][j] is not None for i, j in zip(*np.nonzero(allocation)))
+    assert total == _brute_force(costs)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_hungarian_rectangular_and_real_costs(seed):
+    rng = np.random.default_rng(seed)
+    costs = rng.uniform(0, 50, (4, 7))
+    assignment, total = hungarian(costs)
+    assert len(set(assignment.tolist())) == 4
+    assert total == pytest.approx(costs[np.arange(4), assignment].sum())
+    assert total == pytest.approx(_brute_force(costs.tolist()))
+
+
+def test_unit_transport_problem_routed_to_assignment():
+    costs = random_assignment_problem(6, seed=3)
+    initial, _ = TransportAlgorithms.nord_ouest([1] * 6, [1] * 6, costs)
+    allocation, total = TransportAlgorithms.stepping_stone(initial, costs)
+    _assert_permutation(allocation)
+    assert total == _brute_force(costs)
+
+
+def test_infeasible_and_invalid_inputs():
+    blocked = [[1, np.inf], [2, np.inf]]
+    with pytest.raises(ValueError):
+        hungarian(blocked)
+    with pytest.raises(ValueError):
+        auction(*dense_to_csr(blocked))
+    with pytest.raises(ValueError):
+        TransportAlgorithms.affectation([[1, 2, 3], [4, 5, 6]])
+    with pytest.raises(ValueError):
+        TransportAlgorithms.affectation([[1, 2], [3, 4]], 'glouton')
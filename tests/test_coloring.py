@@ -0,0 +1,48 @@
+import networkx as nx
+import pytest
+
+from algorithms.coloring import color_graph
+from algorithms.csr import CompactGraph
+from algorithms.graph_algorithms import GraphAlgorithms
+
+
+def _assert_proper(G, colors, num_colors):
+    assert set(colors) == set(G.nodes())
+    assert all(colors[u] != colors[v] for u, v in G.edges())
+    assert num_colors == len(set(colors.values()))
+
+
+@pytest.mark.parametrize('strategy', ['dsatur', 'smallest_last'])
+@pytest.mark.parametrize('seed', range(10))
+def test_random_graphs_are_properly_colored(strategy, seed):
+    G = nx.gnp_random_graph(120, 0.08, seed=seed)
+    for graph in (G, CompactGraph.from_networkx(G)):
+        colors, num_colors = GraphAlgorithms.coloration(graph, strategy)
+        _assert_proper(G, colors, num_colors)
+        assert num_colors <= max(d for _, d in G.degree()) + 1
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_smallest_last_within_degeneracy(seed):
+    G = nx.barabasi_albert_graph(200, 3, seed=seed)
+    colors, num_colors = color_graph(G, 'smallest_last')
+    _assert_proper(G, colors, num_colors)
+    assert num_colors <= max(nx.core_number(G).values()) + 1
+
+
+def test_dsatur_is_exact_on_bipartite_graphs():
+    for G in (nx.cycle_graph(10), nx.grid_2d_graph(6, 7), nx.complete_bipartite_graph(4, 9)):
+        colors, num_colors = color_graph(G, 'dsatur')
+        _assert_proper(G, colors, num_colors)
+        assert num_colors == 2
+
+
+@pytest.mark.parametrize('strategy', ['dsatur', 'smallest_last'])
+def test_complete_graph_and_empty_graph(strategy):
+    assert color_graph(nx.complete_graph(7), strategy)[1] == 7
+    assert color_graph(nx.Graph(), strategy) == ({}, 0)
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        color_graph(nx.path_graph(3), 'glouton')
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from algorithms.csr import CompactGraph
+from algorithms.csr_algorithms import dijkstra_csr
+from algorithms.delta_stepping import delta_stepping_csr
+from algorithms.generators import random_graph
+from algorithms.graph_algorithms import GraphAlgorithms
+
+
+def _reference(graph, source=0):
+    dist, _ = dijkstra_csr(graph, source)
+    return np.asarray(dist, dtype=float)
+
+
+# 22 / 7.333333333333334 s'arrondit à 2.9999999999999996 : le seau courant
+# était calculé vide et le delta-stepping échouait
+@pytest.mark.parametrize('delta', [7.333333333333334, 22 / 3])
+def test_bucket_bound_rounding(delta):
+    graph = CompactGraph.from_edges(3, [0, 1], [1, 2], weight=np.array([22, 1]),
+                                    labels=['a', 'b', 'c'])
+    dist, _ = delta_stepping_csr(graph, 0, delta)
+    assert np.array_equal(dist, _reference(graph))
+    assert GraphAlgorithms.delta_stepping(graph, 'a', 'c', delta=delta) == (['a', 'b', 'c'], 23)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_graphs_match_dijkstra(seed):
+    graph = random_graph(300, 'dijkstra', seed=seed, probability=0.02)
+    rng = np.random.default_rng(seed)
+    for delta in (None, float(rng.uniform(0.5, 40)), 1.0):
+        dist, pred = delta_stepping_csr(graph, 0, delta)
+        assert np.array_equal(dist, _reference(graph))
+        # Chaque prédécesseur réalise la distance de son sommet
+        reached = np.flatnonzero(pred >= 0)
+        for v in reached.tolist():
+            u = int(pred[v])
+            k = graph.indptr[u] + np.flatnonzero(graph.neighbors(u) == v)
+            assert dist[u] + graph.weight[k].min() == dist[v]
+
+
+def test_shards_match_single_process(monkeypatch):
+    from algorithms import delta_stepping
+    monkeypatch.setattr(delta_stepping, 'SHARD_MIN_EDGES', 10)
+    graph = random_graph(500, 'dijkstra', seed=3, probability=0.02)
+    dist, _ = delta_stepping_csr(graph, 0, processes=2)
+    assert np.array_equal(dist, _reference(graph))
+
+
+def test_negative_weights_rejected():
+    graph = CompactGraph.from_edges(2, [0], [1], weight=np.array([-1]))
+    with pytest.raises(ValueError):
+        delta_stepping_csr(graph, 0)
@@ -0,0 +1,126 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.generators import random_tasks
+from algorithms.scheduling import IncrementalSchedule, cpm
+
+
+def _longest_paths(tasks):
+    """
+    Dates au plus tôt et durée du projet selon networkx : plus longs chemins
+    d'un sommet de départ commun, chaque arc portant la durée de sa tâche.
+    """
+    G = nx.DiGraph()
+    for task, spec in tasks.items():
+        G.add_edge('début', task, weight=0)
+        G.add_edge(task, 'fin', weight=spec['duration'])
+        for pred in spec['predecessors']:
+            G.add_edge(pred, task, weight=tasks[pred]['duration'])
+    duration = nx.dag_longest_path_length(G)
+    for _, _, data in G.edges(data=True):
+        data['weight'] = -data['weight']
+    dist = nx.single_source_bellman_ford_path_length(G, 'début')
+    return {task: -dist[task] for task in tasks}, duration
+
+
+def _with_float_durations(tasks, seed):
+    rng = np.random.default_rng(seed)
+    return {task: {'duration': float(rng.uniform(0.1, 9.9)), 'predecessors': spec['predecessors']}
+            for task, spec in tasks.items()}
+
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('floats', [False, True])
+def test_cpm_matches_networkx_longest_paths(seed, floats):
+    tasks = random_tasks(150, seed=seed, probability=0.05)
+    if floats:
+        tasks = _with_float_durations(tasks, seed)
+    result = cpm(tasks)
+    earliest, duration = _longest_paths(tasks)
+
+    assert result.project_duration == pytest.approx(duration)
+    assert np.allclose(result.earliest_start, [earliest[task] for task in result.tasks])
+    assert np.all(result.total_float >= -1e-9)
+    assert np.all(result.free_float >= -1e-9)
+    assert np.all(result.free_float <= result.total_float + 1e-9)
+
+    # Le chemin critique est une chaîne de tâches qui couvre tout le projet
+    path = result.critical_path
+    assert all(a in tasks[b]['predecessors'] for a, b in zip(path, path[1:]))
+    assert sum(tasks[task]['duration'] for task in path) == pytest.approx(duration)
+
+
+def test_integer_durations_stay_integer():
+    result = cpm(random_tasks(50, seed=1))
+    assert result.earliest_start.dtype.kind == 'i'
+    assert isinstance(result.project_duration, int)
+
+
+@pytest.mark.parametrize('tasks', [
+    {'A': {'duration': 1, 'predecessors': ['B']}, 'B': {'duration': 2, 'predecessors': ['A']}},
+    {'A': {'duration': 1, 'predecessors': ['A']}},
+    {'A': {'duration': 1, 'predecessors': []}, 'B': {'duration': 2, 'predecessors': ['A', 'D']},
+     'C': {'duration': 3, 'predecessors': ['B']}, 'D': {'duration': 1, 'predecessors': ['C']}},
+])
+def test_cpm_rejects_cycles(tasks):
+    with pytest.raises(ValueError, match="cycles"):
+        cpm(tasks)
+
+
+def test_cpm_rejects_unknown_predecessor():
+    with pytest.raises(ValueError, match="inconnu"):
+        cpm({'A': {'duration': 1, 'predecessors': ['Z']}})
+
+
+def _chain():
+    return {'A': {'duration': 3, 'predecessors': []},
+            'B': {'duration': 2, 'predecessors': ['A']},
+            'C': {'duration': 4, 'predecessors': ['B']},
+            'D': {'duration': 1, 'predecessors': []}}
+
+
+@pytest.mark.parametrize('task, predecessor', [('A', 'C'), ('A', 'B'), ('B', 'B')])
+def test_incremental_rejects_cycles_and_stays_unchanged(task, predecessor):
+    schedule = IncrementalSchedule(_chain())
+    before = schedule.earliest_dates
+    with pytest.raises(ValueError, match="cycles"):
+        schedule.add_predecessor(task, predecessor)
+    assert schedule.earliest_dates == before
+    assert schedule.project_duration == 9
+    # L'ordre topologique est intact : un arc valide s'ajoute encore
+    schedule.add_predecessor('A', 'D')
+    assert schedule.earliest_dates == {'A': 1, 'B': 4, 'C': 6, 'D': 0}
+
+
+def test_incremental_duplicate_predecessor_removed_once():
+    tasks = _chain()
+    tasks['B']['predecessors'] = ['A', 'A']
+    schedule = IncrementalSchedule(tasks)
+    schedule.remove_predecessor('B', 'A')
+    assert schedule.earliest_start('B') == 0
+    assert schedule.project_duration == 6
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_edits_match_full_recomputation(seed):
+    rng = np.random.default_rng(seed)
+    tasks = random_tasks(60, seed=seed, probability=0.05)
+    schedule = IncrementalSchedule(tasks)
+    for _ in range(100):
+        a, b = (int(x) for x in rng.integers(0, len(tasks), 2))
+        if rng.random() < 0.3:
+            tasks[a]['duration'] = int(rng.integers(1, 11))
+            schedule.set_duration(a, tasks[a]['duration'])
+        elif a in tasks[b]['predecessors']:
+            tasks[b]['predecessors'].remove(a)
+            schedule.remove_predecessor(b, a)
+        else:
+            try:
+                schedule.add_predecessor(b, a)
+            except ValueError:
+                continue
+            tasks[b]['predecessors'].append(a)
+        expected = cpm(tasks)
+        assert schedule.project_duration == expected.project_duration
+        assert list(schedule.earliest_dates.values()) == expected.earliest_start.tolist()
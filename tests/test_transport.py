@@ -0,0 +1,100 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.generators import random_transport_problem
+from algorithms.transport import TransportAlgorithms
+
+
+def _optimum(supply, demand, costs):
+    """Coût optimal selon networkx (flot de coût minimum biparti)."""
+    G = nx.DiGraph()
+    for i, quantity in enumerate(supply):
+        G.add_node(('offre', i), demand=-quantity)
+    for j, quantity in enumerate(demand):
+        G.add_node(('demande', j), demand=quantity)
+    for i, row in enumerate(costs):
+        for j, cost in enumerate(row):
+            G.add_edge(('offre', i), ('demande', j), weight=cost)
+    return nx.min_cost_flow_cost(G)
+
+
+def _assert_feasible(allocation, supply, demand, costs, total):
+    allocation = np.asarray(allocation, dtype=object)
+    assert allocation.sum(axis=1).tolist() == list(supply)
+    assert allocation.sum(axis=0).tolist() == list(demand)
+    assert (allocation >= 0).all()
+    assert total == sum(a * c for row, cost_row in zip(allocation.tolist(), costs)
+                        for a, c in zip(row, cost_row))
+
+
+def _small_problem(rng):
+    # Petites quantités et coûts répétés : solutions de départ souvent dégénérées
+    m, n = (int(x) for x in rng.integers(1, 7, 2))
+    supply = rng.integers(0, 6, m).tolist()
+    demand = [0] * n
+    for _ in range(sum(supply)):
+        demand[int(rng.integers(0, n))] += 1
+    costs = rng.integers(0, 5, (m, n)).tolist()
+    return supply, demand, costs
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_stepping_stone_reaches_networkx_optimum(seed):
+    supply, demand, costs = _small_problem(np.random.default_rng(seed))
+    optimum = _optimum(supply, demand, costs)
+    for method in (TransportAlgorithms.nord_ouest, TransportAlgorithms.moindre_cout):
+        initial, initial_cost = method(supply, demand, costs)
+        _assert_feasible(initial, supply, demand, costs, initial_cost)
+        allocation, total = TransportAlgorithms.stepping_stone(initial, costs)
+        _assert_feasible(allocation, supply, demand, costs, total)
+        assert total == optimum
+
+
+@pytest.mark.parametrize('size', [(8, 12), (20, 20), (30, 25)])
+def test_random_instances(size):
+    supply, demand, costs = random_transport_problem(*size, seed=sum(size))
+    initial, _ = TransportAlgorithms.moindre_cout(supply, demand, costs)
+    allocation, total = TransportAlgorithms.stepping_stone(initial, costs)
+    _assert_feasible(allocation, supply, demand, costs, total)
+    assert total == _optimum(supply, demand, costs)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_big_integer_costs_stay_exact(seed):
+    # Coûts au-delà de int64 : calcul en entiers Python, même optimum à l'échelle près
+    supply, demand, costs = _small_problem(np.random.default_rng(seed))
+    big = [[c * 2 ** 70 + 1 for c in row] for row in costs]
+    initial, initial_cost = TransportAlgorithms.nord_ouest(supply, demand, big)
+    _assert_feasible(initial, supply, demand, big, initial_cost)
+    allocation, total = TransportAlgorithms.stepping_stone(initial, big)
+    _assert_feasible(allocation, supply, demand, big, total)
+    assert total == _optimum(supply, demand, costs) * 2 ** 70 + sum(supply)
+
+
+def test_big_integer_costs_reach_optimum():
+    allocation, total = TransportAlgorithms.stepping_stone([[4, 1], [0, 5]],
+                                                           [[2 ** 62, 1], [1, 2 ** 62]])
+    assert allocation == [[0, 5], [4, 1]]
+    assert total == 9 + 2 ** 62
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_float_costs(seed):
+    # Décaler tous les coûts de 0.5 ajoute 0.5 par unité transportée
+    supply, demand, costs = _small_problem(np.random.default_rng(seed))
+    shifted = [[c + 0.5 for c in row] for row in costs]
+    initial, _ = TransportAlgorithms.nord_ouest(supply, demand, shifted)
+    _, total = TransportAlgorithms.stepping_stone(initial, shifted)
+    assert total == pytest.approx(_optimum(supply, demand, costs) + 0.5 * sum(supply))
+
+
+def test_zero_total_quantity():
+    allocation, total = TransportAlgorithms.nord_ouest([0, 0], [0, 0, 0], [[1, 2, 3], [4, 5, 6]])
+    assert allocation == [[0, 0, 0], [0, 0, 0]] and total == 0
+
+
+@pytest.mark.parametrize('method', [TransportAlgorithms.nord_ouest, TransportAlgorithms.moindre_cout])
+def test_unbalanced_problem_rejected(method):
+    with pytest.raises(ValueError):
+        method([5, 5], [3, 3], [[1, 2], [3, 4]])
@@ -0,0 +1,83 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from algorithms.csr import CompactGraph
+from algorithms.transport import TransportAlgorithms
+
+
+def _network(seed, capacities=False):
+    """
+    Réseau orienté aléatoire : sources, entrepôts et demandes, chaque source
+    reliée à chaque demande par une chaîne coûteuse pour garantir la faisabilité.
+    """
+    rng = np.random.default_rng(seed)
+    G = nx.gnp_random_graph(30, 0.15, seed=seed, directed=True)
+    for u, v in G.edges():
+        G[u][v]['weight'] = int(rng.integers(1, 20))
+    sources, sinks = [0, 1, 2], [27, 28, 29]
+    supply = {s: int(rng.integers(1, 10)) for s in sources}
+    demand = dict.fromkeys(sinks, 0)
+    for _ in range(sum(supply.values())):
+        demand[sinks[int(rng.integers(0, len(sinks)))]] += 1
+    for s in sources:
+        for t in sinks:
+            G.add_edge(s, t, weight=100)
+    if capacities:
+        for u, v in G.edges():
+            G[u][v]['capacity'] = int(rng.integers(1, 8)) if G[u][v]['weight'] < 100 else 100
+    return G, supply, demand
+
+
+def _optimum(G, supply, demand):
+    H = G.copy()
+    for v in H:
+        H.nodes[v]['demand'] = demand.get(v, 0) - supply.get(v, 0)
+    return nx.min_cost_flow_cost(H)
+
+
+def _assert_feasible(G, flows, supply, demand, total):
+    balance = {v: 0 for v in G}
+    for (u, v), quantity in flows.items():
+        assert G.has_edge(u, v) and quantity > 0
+        assert quantity <= G[u][v].get('capacity', float('inf'))
+        balance[u] += quantity
+        balance[v] -= quantity
+    assert balance == {v: supply.get(v, 0) - demand.get(v, 0) for v in G}
+    assert total == sum(quantity * G[u][v]['weight'] for (u, v), quantity in flows.items())
+
+
+@pytest.mark.parametrize('seed', range(10))
+@pytest.mark.parametrize('capacities', [False, True])
+def test_transshipment_matches_networkx(seed, capacities):
+    G, supply, demand = _network(seed, capacities)
+    expected = _optimum(G, supply, demand)
+    for graph in (G, CompactGraph.from_networkx(G)):
+        flows, total = TransportAlgorithms.transbordement(graph, supply, demand)
+        _assert_feasible(G, flows, supply, demand, total)
+        assert total == expected
+
+
+def test_route_through_depot():
+    G = nx.DiGraph()
+    G.add_edge('usine', 'entrepôt', weight=2)
+    G.add_edge('entrepôt', 'client', weight=3)
+    G.add_edge('usine', 'client', weight=10)
+    flows, total = TransportAlgorithms.transbordement(G, {'usine': 4}, {'client': 4})
+    assert flows == {('usine', 'entrepôt'): 4, ('entrepôt', 'client'): 4}
+    assert total == 20
+
+
+def test_undirected_network_rejected():
+    with pytest.raises(ValueError):
+        TransportAlgorithms.transbordement(nx.path_graph(3), {0: 1}, {2: 1})
+
+
+def test_unbalanced_or_unreachable_demand_rejected():
+    G = nx.DiGraph()
+    G.add_edge('a', 'b', weight=1)
+    G.add_node('c')
+    with pytest.raises(ValueError):
+        TransportAlgorithms.transbordement(G, {'a': 2}, {'b': 1})
+    with pytest.raises(ValueError):
+        TransportAlgorithms.transbordement(G, {'a': 1}, {'c': 1})
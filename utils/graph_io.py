@@ -0,0 +1,403 @@
+import csv
+import gzip
+import itertools
+import json
+import os
+import xml.etree.ElementTree as ET
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from algorithms.csr import CompactGraph
+
+# Format binaire : un répertoire contenant un .npy par tableau CSR (chargeable
+# par np.load(mmap_mode='r')) et un meta.json décrivant le graphe.
+FORMAT_VERSION = 1
+BINARY_SUFFIX = '.cgraph'
+_COLUMNS = ('weight', 'capacity')
+
+
+def _label_to_json(label: Hashable):
+    """
+    Libellé de sommet enregistrable en JSON : scalaire ou tuple (écrit comme
+    une liste, par exemple les sommets (i, j) d'une grille).
+    """
+    if isinstance(label, np.generic):
+        label = label.item()
+    if label is None or isinstance(label, (str, int, float)):
+        return label
+    if isinstance(label, tuple):
+        return [_label_to_json(item) for item in label]
+    raise ValueError(f"Libellé de sommet non enregistrable : {label!r}")
+
+
+def _label_from_json(label) -> Hashable:
+    """Inverse de _label_to_json : une liste ne peut être qu'un tuple enregistré."""
+    if isinstance(label, list):
+        return tuple(_label_from_json(item) for item in label)
+    return label
+
+
+def save_graph(graph: CompactGraph, path: str, arrays: bool = True) -> None:
+    """
+    Enregistre un CompactGraph au format binaire. Avec arrays=False, seuls
+    indptr et les métadonnées sont écrits (les autres tableaux sont déjà en place).
+    """
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, 'indptr.npy'), np.asarray(graph.indptr, dtype=np.int64))
+    if arrays:
+        np.save(os.path.join(path, 'indices.npy'), np.asarray(graph.indices, dtype=np.int64))
+    columns = []
+    for name in _COLUMNS:
+        values = getattr(graph, name)
+        if values is not None:
+            if arrays:
+                np.save(os.path.join(path, f'{name}.npy'), np.asarray(values))
+            columns.append(name)
+
+    labels = graph._labels
+    if labels is not None:
+        with open(os.path.join(path, 'labels.json'), 'w', encoding='utf-8') as f:
+            json.dump([_label_to_json(label) for label in labels], f)
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'directed': graph.directed,
+        'num_nodes': graph.num_nodes,
+        'prefix': graph._prefix,
+        'labels': labels is not None,
+        'columns': columns,
+    }
+    with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+
+def load_graph(path: str, mmap: bool = True) -> CompactGraph:
+    """
+    Charge un graphe binaire. Avec mmap=True les tableaux sont projetés en
+    mémoire (lecture seule) : l'ouverture est quasi instantanée et les pages
+    sont partagées entre les processus qui ouvrent le même fichier.
+    """
+    try:
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Erreur lors du chargement du graphe : {str(e)}")
+    if meta.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Version de format non supportée: {meta.get('format_version')}")
+
+    mode = 'r' if mmap else None
+    indptr = np.load(os.path.join(path, 'indptr.npy'), mmap_mode=mode)
+    indices = np.load(os.path.join(path, 'indices.npy'), mmap_mode=mode)
+    columns = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mode)
+               for name in meta['columns']}
+    labels = None
+    if meta['labels']:
+        with open(os.path.join(path, 'labels.json'), encoding='utf-8') as f:
+            labels = [_label_from_json(label) for label in json.load(f)]
+    return CompactGraph(indptr, indices, meta['directed'], labels=labels,
+                        prefix=meta['prefix'], **columns)
+
+
+class _LabelTable:
+    """
+    Interne les libellés de sommets au fil de la lecture. Avec numeric=True,
+    des libellés tous écrits comme des entiers canoniques (« 12 », pas
+    « 012 ») sont rendus en entiers : deux libellés distincts ne peuvent
+    donc pas se confondre.
+    """
+
+    def __init__(self, numeric: bool = True):
+        self.index: Dict[Hashable, int] = {}
+        self.labels: List[Hashable] = []
+        self.numeric = numeric
+
+    def __call__(self, label: Hashable) -> int:
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+        return i
+
+    def finalize(self) -> List[Hashable]:
+        """Libellés entiers si tous les identifiants lus sont numériques."""
+        if self.numeric and all(isinstance(label, str) and label.isdigit()
+                                and str(int(label)) == label for label in self.labels):
+            return [int(label) for label in self.labels]
+        return self.labels
+
+
+def _compact_from_arrays(table: _LabelTable, src: array, dst: array,
+                         columns: Dict[str, array], directed: bool) -> CompactGraph:
+    values = {name: np.frombuffer(col, dtype=np.float64) for name, col in columns.items()}
+    # Les attributs entiers restent entiers
+    values = {name: col.astype(np.int64) if np.all(col == np.round(col)) else col
+              for name, col in values.items()}
+    return CompactGraph.from_edges(len(table.labels), np.frombuffer(src, dtype=np.int64),
+                                   np.frombuffer(dst, dtype=np.int64), directed,
+                                   labels=table.finalize(), **values)
+
+
+def read_graphml(path: str) -> CompactGraph:
+    """
+    Lecture GraphML en flux (iterparse) : chaque élément est libéré dès qu'il
+    est traité, les arêtes sont accumulées dans des tableaux typés compacts.
+    Les identifiants de sommets restent des chaînes, comme nx.read_graphml.
+    """
+    table = _LabelTable(numeric=False)
+    src, dst = array('q'), array('q')
+    columns: Dict[str, array] = {}
+    keys: Dict[str, str] = {}
+    directed = False
+    # Éléments ouverts : un nœud ou une arête traité est retiré de son parent,
+    # sans quoi l'arbre garderait un élément vide par nœud et par arête
+    open_elements = []
+    try:
+        for event, elem in ET.iterparse(path, events=('start', 'end')):
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if tag == 'key' and elem.get('for') in ('edge', 'all') \
+                    and elem.get('attr.name') in _COLUMNS:
+                keys[elem.get('id')] = elem.get('attr.name')
+                columns.setdefault(elem.get('attr.name'), array('d'))
+            elif tag == 'node':
+                table(elem.get('id'))
+                elem.clear()
+                open_elements[-1].remove(elem)
+            elif tag == 'edge':
+                src.append(table(elem.get('source')))
+                dst.append(table(elem.get('target')))
+                found = {}
+                for data in elem:
+                    name = keys.get(data.get('key'))
+                    if name is not None:
+                        found[name] = float(data.text)
+                for name, col in columns.items():
+                    if name not in found:
+                        raise ValueError(f"Attribut '{name}' manquant sur une arête")
+                    col.append(found[name])
+                elem.clear()
+                open_elements[-1].remove(elem)
+            elif tag == 'graph':
+                directed = elem.get('edgedefault') == 'directed'
+    except ET.ParseError as e:
+        raise ValueError(f"Erreur lors du chargement du graphe : {str(e)}")
+    return _compact_from_arrays(table, src, dst, columns, directed)
+
+
+class EdgeStream:
+    """
+    Lecture par blocs d'une liste d'arêtes CSV/TSV, éventuellement compressée
+    (.gz) : source, cible, puis colonnes optionnelles nommées dans un en-tête
+    (weight, capacity). Sans en-tête, une troisième colonne est le poids.
+
+    Chaque itération relit le fichier et produit des blocs
+    (src, dst, {attribut: valeurs}) d'au plus `chunk_size` arêtes ; les
+    sommets sont internés en entiers de façon stable d'un passage à l'autre.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1_000_000,
+                 delimiter: Optional[str] = None):
+        if delimiter is None:
+            delimiter = '\t' if '.tsv' in os.path.basename(path) else ','
+        self.path = path
+        self.chunk_size = chunk_size
+        self.delimiter = delimiter
+        self._table = _LabelTable()
+
+    @property
+    def num_nodes(self) -> int:
+        """Nombre de sommets vus jusqu'ici (exact après un passage complet)."""
+        return len(self._table.labels)
+
+    @property
+    def labels(self) -> List[Hashable]:
+        return self._table.finalize()
+
+    def _open(self):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, 'rt', newline='', encoding='utf-8')
+        return open(self.path, newline='', encoding='utf-8')
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]]:
+        table = self._table
+        with self._open() as f:
+            reader = csv.reader(f, delimiter=self.delimiter)
+            first = next(reader, None)
+            if first is None:
+                return
+            if any(name in _COLUMNS for name in first[2:]) or first[:2] == ['source', 'target']:
+                names = first[2:]
+                rows = reader
+            else:
+                names = ['weight'][:len(first) - 2]
+                rows = itertools.chain([first], reader)
+            positions = {name: 2 + k for k, name in enumerate(names) if name in _COLUMNS}
+
+            while True:
+                block = [row for row in itertools.islice(rows, self.chunk_size) if row]
+                if not block:
+                    return
+                src = np.fromiter((table(row[0]) for row in block), dtype=np.int64,
+                                  count=len(block))
+                dst = np.fromiter((table(row[1]) for row in block), dtype=np.int64,
+                                  count=len(block))
+                columns = {name: np.fromiter((float(row[k]) for row in block),
+                                             dtype=np.float64, count=len(block))
+                           for name, k in positions.items()}
+                yield src, dst, columns
+
+
+def read_edge_list(path: str, delimiter: Optional[str] = None,
+                   directed: bool = False) -> CompactGraph:
+    """Lecture complète d'une liste d'arêtes CSV/TSV (voir EdgeStream)."""
+    return build_csr(EdgeStream(path, delimiter=delimiter), directed=directed)
+
+
+def build_csr(stream: Iterable, directed: bool = False,
+              out_dir: Optional[str] = None) -> CompactGraph:
+    """
+    Construit le CSR en deux passages sur le flux, à mémoire bornée :
+    le premier compte les degrés, le second place chaque arête à sa position
+    définitive. Seuls un bloc, les compteurs par sommet et les tableaux de
+    sortie sont en mémoire ; avec `out_dir`, ces derniers sont écrits
+    directement au format binaire (projection mémoire) puis rechargés.
+    """
+    # Premier passage : degrés et types des attributs
+    degree = np.zeros(0, dtype=np.int64)
+    integral: Dict[str, bool] = {}
+    for src, dst, columns in stream:
+        top = max(int(src.max(initial=-1)), int(dst.max(initial=-1))) + 1
+        if top > len(degree):
+            degree = np.concatenate([degree, np.zeros(top - len(degree), dtype=np.int64)])
+        degree += np.bincount(src, minlength=len(degree))
+        if not directed:
+            mirror = src != dst
+            degree += np.bincount(dst[mirror], minlength=len(degree))
+        for name, values in columns.items():
+            integral[name] = integral.get(name, True) and bool(np.all(values == np.round(values)))
+
+    num_nodes = getattr(stream, 'num_nodes', len(degree))
+    if num_nodes > len(degree):
+        degree = np.concatenate([degree, np.zeros(num_nodes - len(degree), dtype=np.int64)])
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(degree, out=indptr[1:])
+    total = int(indptr[-1])
+
+    def allocate(name, dtype):
+        if out_dir is None:
+            return np.empty(total, dtype=dtype)
+        return np.lib.format.open_memmap(os.path.join(out_dir, f'{name}.npy'), mode='w+',
+                                         dtype=dtype, shape=(total,))
+
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    indices = allocate('indices', np.int64)
+    outputs = {name: allocate(name, np.int64 if integral[name] else np.float64)
+               for name in integral}
+
+    # Second passage : remplissage aux curseurs de chaque sommet
+    cursor = indptr[:-1].copy()
+    for src, dst, columns in stream:
+        if not directed:
+            mirror = src != dst
+            src, dst = np.concatenate([src, dst[mirror]]), np.concatenate([dst, src[mirror]])
+            columns = {name: np.concatenate([values, values[mirror]])
+                       for name, values in columns.items()}
+        order = np.argsort(src, kind='stable')
+        src_sorted = src[order]
+        counts = np.bincount(src_sorted, minlength=num_nodes)
+        group_start = np.cumsum(counts) - counts
+        positions = cursor[src_sorted] + np.arange(len(order)) - group_start[src_sorted]
+        indices[positions] = dst[order]
+        for name, values in columns.items():
+            outputs[name][positions] = values[order]
+        cursor += counts
+
+    labels = stream.labels if hasattr(stream, 'labels') else None
+    graph = CompactGraph(indptr, indices, directed, labels=labels, **outputs)
+    if out_dir is None:
+        return graph
+    for values in (indices, *outputs.values()):
+        values.flush()
+    save_graph(graph, out_dir, arrays=False)
+    return load_graph(out_dir)
+
+
+def convert_to_binary(source: str, destination: str, directed: bool = False) -> CompactGraph:
+    """
+    Convertit un fichier GraphML ou une liste d'arêtes CSV/TSV au format
+    binaire. Les listes d'arêtes sont converties en flux, sans jamais tenir
+    le graphe complet en mémoire.
+    """
+    if source.endswith('.graphml'):
+        graph = read_graphml(source)
+        save_graph(graph, destination)
+        return load_graph(destination)
+    return build_csr(EdgeStream(source), directed=directed, out_dir=destination)
+
+
+def read_graph(path: str) -> CompactGraph:
+    """
+    Lit un graphe quel que soit son format : binaire (.cgraph ou répertoire),
+    GraphML, ou liste d'arêtes CSV/TSV.
+    """
+    if os.path.isdir(path) or path.endswith(BINARY_SUFFIX):
+        return load_graph(path)
+    if path.endswith('.graphml'):
+        return read_graphml(path)
+    return read_edge_list(path)
+
+
+def graph_from_dict(spec: Dict) -> CompactGraph:
+    """
+    Construit un graphe depuis sa description JSON :
+    {"directed": false, "nodes": [...], "edges": [[u, v], [u, v, poids] ou
+    [u, v, {"weight": ..., "capacity": ...}], ...]}. La liste "nodes" est
+    facultative (sommets isolés).
+    """
+    # Les libellés JSON sont déjà typés : pas de conversion des chaînes
+    table = _LabelTable(numeric=False)
+    for node in spec.get('nodes', ()):
+        table(_label_from_json(node))
+    edges = spec.get('edges', [])
+    src, dst = array('q'), array('q')
+    columns: Dict[str, array] = {}
+    for k, edge in enumerate(edges):
+        if len(edge) < 2:
+            raise ValueError(f"Arête invalide: {edge}")
+        src.append(table(_label_from_json(edge[0])))
+        dst.append(table(_label_from_json(edge[1])))
+        data = edge[2] if len(edge) > 2 else {}
+        if not isinstance(data, dict):
+            data = {'weight': data}
+        if k == 0:
+            columns = {name: array('d') for name in _COLUMNS if name in data}
+        for name, col in columns.items():
+            if name not in data:
+                raise ValueError(f"Attribut '{name}' manquant sur une arête")
+            col.append(float(data[name]))
+    return _compact_from_arrays(table, src, dst, columns, bool(spec.get('directed', False)))
+
+
+def graph_to_dict(graph) -> Dict:
+    """
+    Description JSON d'un graphe (CompactGraph ou networkx), relue par
+    graph_from_dict : chaque arête n'apparaît qu'une fois, avec ses
+    attributs 'weight' et 'capacity'.
+    """
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph.from_networkx(graph)
+    labels = [_label_to_json(label) for label in graph.labels]
+    src, dst, columns = graph.edge_arrays()
+    values = {name: col.tolist() for name, col in columns.items()}
+    edges = []
+    for k, (u, v) in enumerate(zip(src.tolist(), dst.tolist())):
+        edge = [labels[u], labels[v]]
+        if values:
+            edge.append({name: col[k] for name, col in values.items()})
+        edges.append(edge)
+    return {'directed': graph.directed, 'nodes': labels, 'edges': edges}
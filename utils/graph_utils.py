@@ -1,17 +1,100 @@
-import networkx as nx
 import numpy as np
-import tkinter as tk
-from tkinter import messagebox 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from config.settings import GRAPH_SETTINGS, ALGORITHM_COLORS
+from utils.graph_io import read_graph
+from utils.layout import LayoutCache
 
+# Placements partagés par toutes les vues, indexés par le contenu du graphe
+LAYOUTS = LayoutCache(capacity=GRAPH_SETTINGS['LAYOUT_CACHE_SIZE'],
+                      directory=GRAPH_SETTINGS['LAYOUT_CACHE_DIR'],
+                      seed=GRAPH_SETTINGS['LAYOUT_SEED'],
+                      small_graph=GRAPH_SETTINGS['LARGE_GRAPH_NODES'])
+
+
+# tkinter, matplotlib et networkx ne sont importés qu'à l'ouverture d'une
+# fenêtre : importer ce module ne coûte rien à un usage sans affichage.
 class GraphVisualizer:
     def __init__(self):
         self.window = None
         self.fig = None
 
+    @staticmethod
+    def _layout(G):
+        """Placement (nœuds, positions, src, dst) du graphe, via le cache partagé."""
+        return LAYOUTS.get(G)
+
+    def _positions(self, G):
+        nodes, positions, _, _ = self._layout(G)
+        return dict(zip(nodes, positions))
+
+    @staticmethod
+    def _is_large(G):
+        return G.number_of_nodes() > GRAPH_SETTINGS['LARGE_GRAPH_NODES']
+
+    @staticmethod
+    def _show_edge_labels(G):
+        return G.number_of_edges() <= GRAPH_SETTINGS['EDGE_LABEL_THRESHOLD']
+
+    def _draw_large(self, G, highlight=(), highlight_color='red', node_colors=None,
+                    cmap=None, edge_color='gray'):
+        """
+        Rendu des grands graphes : arêtes en LineCollection (échantillonnées
+        au-delà de MAX_DRAWN_EDGES), sommets en un seul nuage de points ou en
+        densité agrégée au-delà de MAX_DRAWN_NODES, étiquettes selon le zoom.
+        """
+        from matplotlib.collections import LineCollection
+        ax = self.ax
+        nodes, positions, src, dst = self._layout(G)
+
+        if len(src) > GRAPH_SETTINGS['MAX_DRAWN_EDGES']:
+            keep = np.random.default_rng(0).choice(len(src), GRAPH_SETTINGS['MAX_DRAWN_EDGES'],
+                                                   replace=False)
+            src, dst = src[keep], dst[keep]
+        ax.add_collection(LineCollection(np.stack([positions[src], positions[dst]], axis=1),
+                                         colors=edge_color, linewidths=0.3, alpha=0.3))
+        if highlight:
+            index = {node: i for i, node in enumerate(nodes)}
+            u = [index[a] for a, _ in highlight]
+            v = [index[b] for _, b in highlight]
+            ax.add_collection(LineCollection(np.stack([positions[u], positions[v]], axis=1),
+                                             colors=highlight_color,
+                                             linewidths=GRAPH_SETTINGS['EDGE_WIDTH'], zorder=3))
+
+        if len(nodes) > GRAPH_SETTINGS['MAX_DRAWN_NODES']:
+            ax.hexbin(positions[:, 0], positions[:, 1], gridsize=120, bins='log',
+                      mincnt=1, cmap='Blues', zorder=2)
+        else:
+            size = max(2.0, GRAPH_SETTINGS['NODE_SIZE'] * 50 / len(nodes))
+            ax.scatter(positions[:, 0], positions[:, 1], s=size,
+                       c=node_colors if node_colors is not None else 'lightblue',
+                       cmap=cmap, zorder=2)
+        ax.autoscale_view()
+        ax.set_axis_off()
+        self._attach_zoom_labels(nodes, positions)
+
+    def _attach_zoom_labels(self, nodes, positions):
+        """Affiche les étiquettes des sommets visibles dès qu'ils sont peu nombreux."""
+        ax = self.ax
+        texts = []
+
+        def update(_=None):
+            for text in texts:
+                text.remove()
+            texts.clear()
+            (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+            visible = np.flatnonzero((positions[:, 0] >= x0) & (positions[:, 0] <= x1)
+                                     & (positions[:, 1] >= y0) & (positions[:, 1] <= y1))
+            if len(visible) <= GRAPH_SETTINGS['LABEL_THRESHOLD']:
+                for i in visible.tolist():
+                    texts.append(ax.text(positions[i, 0], positions[i, 1], str(nodes[i]),
+                                         fontsize=8, ha='center', va='center', zorder=4))
+
+        ax.callbacks.connect('xlim_changed', update)
+        ax.callbacks.connect('ylim_changed', update)
+        update()
+
     def _create_window(self, title):
+        import tkinter as tk
+        import matplotlib.pyplot as plt
         self.window = tk.Toplevel()
         self.window.title(title)
         self.window.geometry("800x800")
@@ -24,12 +107,16 @@ class GraphVisualizer:
         return main_frame, self.ax  # Retourner aussi l'axe
 
     def _add_info_and_close(self, main_frame, info_text):
+        import tkinter as tk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
         # Vérification si main_frame est un tuple
         if isinstance(main_frame, tuple):
             main_frame = main_frame[0]
 
         canvas = FigureCanvasTkAgg(self.fig, master=main_frame)
         canvas.draw()
+        # Barre d'outils : zoom et déplacement (étiquettes des grands graphes)
+        NavigationToolbar2Tk(canvas, main_frame)
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
         # Ajouter les informations
@@ -44,66 +131,106 @@ class GraphVisualizer:
 
 
     def display_welsh_powell(self, G, colors, num_colors):
+        import networkx as nx
+        import matplotlib.pyplot as plt
         main_frame = self._create_window("Coloration de graphe - Welsh Powell")
-        pos = nx.spring_layout(G)
+        info_text = f"Nombre de couleurs utilisées: {num_colors}"
+        if self._is_large(G):
+            nodes = self._layout(G)[0]
+            self._draw_large(G, node_colors=[colors[node] for node in nodes],
+                             cmap=plt.cm.rainbow)
+            self._add_info_and_close(main_frame, info_text)
+            return
+        pos = self._positions(G)
         nx.draw(G, pos, node_color=[colors[node] for node in G.nodes()],
                with_labels=True, node_size=GRAPH_SETTINGS['NODE_SIZE'],
                cmap=plt.cm.rainbow)
-        self._add_info_and_close(main_frame, f"Nombre de couleurs utilisées: {num_colors}")
+        self._add_info_and_close(main_frame, info_text)
 
     def display_dijkstra(self, G, path, path_length):
+        import networkx as nx
         main_frame = self._create_window("Plus court chemin - Dijkstra")
-        pos = nx.spring_layout(G)
+        path_edges = list(zip(path[:-1], path[1:]))
+        info_text = f"Plus court chemin: {' -> '.join(map(str, path))}\nDistance totale: {path_length}"
+        if self._is_large(G):
+            self._draw_large(G, path_edges, ALGORITHM_COLORS['dijkstra']['path_highlight'])
+            self._add_info_and_close(main_frame, info_text)
+            return
+        pos = self._positions(G)
         
         nx.draw_networkx_edges(G, pos, alpha=0.2)
         nx.draw_networkx_nodes(G, pos, node_size=GRAPH_SETTINGS['NODE_SIZE'],
                              node_color=ALGORITHM_COLORS['dijkstra']['node_default'])
         
-        path_edges = list(zip(path[:-1], path[1:]))
         nx.draw_networkx_edges(G, pos, edgelist=path_edges,
                              edge_color=ALGORITHM_COLORS['dijkstra']['path_highlight'],
                              width=GRAPH_SETTINGS['EDGE_WIDTH'])
         
         nx.draw_networkx_labels(G, pos)
-        edge_labels = nx.get_edge_attributes(G, 'weight')
-        nx.draw_networkx_edge_labels(G, pos, edge_labels)
+        if self._show_edge_labels(G):
+            edge_labels = nx.get_edge_attributes(G, 'weight')
+            nx.draw_networkx_edge_labels(G, pos, edge_labels)
         
-        info_text = f"Plus court chemin: {' -> '.join(map(str, path))}\nDistance totale: {path_length}"
         self._add_info_and_close(main_frame, info_text)
 
     def display_kruskal(self, G, mst_edges, total_weight):
+        import networkx as nx
         main_frame = self._create_window("Arbre couvrant minimal - Kruskal")
-        pos = nx.spring_layout(G)
+        mst_edge_list = [(u, v) for u, v, _ in mst_edges]
+        info_text = f"Coût total de l'arbre couvrant minimal: {total_weight}"
+        # Une forêt couvrante a une arête de moins que de sommets par composante
+        components = G.number_of_nodes() - len(mst_edges)
+        if components > 1:
+            info_text = (f"Graphe non connexe ({components} composantes) - "
+                         f"coût total de la forêt couvrante minimale: {total_weight}")
+        if self._is_large(G):
+            self._draw_large(G, mst_edge_list, ALGORITHM_COLORS['kruskal']['mst_highlight'])
+            self._add_info_and_close(main_frame, info_text)
+            return
+        pos = self._positions(G)
         
         nx.draw_networkx_edges(G, pos, alpha=0.2)
         nx.draw_networkx_nodes(G, pos, node_size=GRAPH_SETTINGS['NODE_SIZE'])
         
-        mst_edge_list = [(u, v) for u, v, _ in mst_edges]
         nx.draw_networkx_edges(G, pos, edgelist=mst_edge_list,
                              edge_color=ALGORITHM_COLORS['kruskal']['mst_highlight'],
                              width=GRAPH_SETTINGS['EDGE_WIDTH'])
         
         nx.draw_networkx_labels(G, pos)
-        edge_labels = nx.get_edge_attributes(G, 'weight')
-        nx.draw_networkx_edge_labels(G, pos, edge_labels)
+        if self._show_edge_labels(G):
+            edge_labels = nx.get_edge_attributes(G, 'weight')
+            nx.draw_networkx_edge_labels(G, pos, edge_labels)
         
-        info_text = f"Coût total de l'arbre couvrant minimal: {total_weight}"
         self._add_info_and_close(main_frame, info_text)
 
     def display_bellman_ford(self, G, distances, predecessors):
+        import networkx as nx
         main_frame = self._create_window("Plus court chemin - Bellman-Ford")
-        pos = nx.spring_layout(G)
-        
-        # Dessin des arêtes du graphe
-        nx.draw_networkx_edges(G, pos, alpha=0.2)
-        nx.draw_networkx_nodes(G, pos, node_size=GRAPH_SETTINGS['NODE_SIZE'],
-                            node_color=ALGORITHM_COLORS['bellman_ford']['node_default'])
         
         # Vérification et conversion des données si nécessaire
         if isinstance(distances, list):
             distances_dict = {i: dist for i, dist in enumerate(distances)}
         else:
             distances_dict = distances
+        
+        # Texte d'information sur les distances
+        info_text = "Distances minimales depuis la source :\n"
+        for node, dist in distances_dict.items():
+            info_text += f"{node}: {dist}\n"
+        
+        if self._is_large(G):
+            # Une liste de sommets est le chemin trouvé : on le met en évidence
+            path = distances if isinstance(distances, list) else []
+            self._draw_large(G, list(zip(path[:-1], path[1:])),
+                             ALGORITHM_COLORS['bellman_ford']['mst_highlight'])
+            self._add_info_and_close(main_frame, info_text)
+            return
+        pos = self._positions(G)
+        
+        # Dessin des arêtes du graphe
+        nx.draw_networkx_edges(G, pos, alpha=0.2)
+        nx.draw_networkx_nodes(G, pos, node_size=GRAPH_SETTINGS['NODE_SIZE'],
+                            node_color=ALGORITHM_COLORS['bellman_ford']['node_default'])
             
         if not isinstance(predecessors, dict):
             if isinstance(predecessors, list):
@@ -138,21 +265,27 @@ class GraphVisualizer:
         nx.draw_networkx_labels(G, pos)
         
         # Affichage des poids des arêtes
-        edge_labels = nx.get_edge_attributes(G, 'weight')
-        nx.draw_networkx_edge_labels(G, pos, edge_labels)
-        
-        # Texte d'information sur les distances
-        info_text = "Distances minimales depuis la source :\n"
-        for node, dist in distances_dict.items():
-            info_text += f"{node}: {dist}\n"
+        if self._show_edge_labels(G):
+            edge_labels = nx.get_edge_attributes(G, 'weight')
+            nx.draw_networkx_edge_labels(G, pos, edge_labels)
         
         self._add_info_and_close(main_frame, info_text)
 
 
     def display_ford_fulkerson(self, G, flow_dict, flow_value, partition):
+        import networkx as nx
         main_frame = self._create_window("Flot maximum - Ford-Fulkerson")
-        pos = nx.spring_layout(G)
         reachable, non_reachable = partition
+        info_text = f"Flot maximum: {flow_value}"
+        if self._is_large(G):
+            colors = ALGORITHM_COLORS['ford_fulkerson']
+            reachable = set(reachable)
+            self._draw_large(G, node_colors=[colors['source_node'] if node in reachable
+                                             else colors['sink_node'] for node in self._layout(G)[0]],
+                             edge_color=colors['edge_default'])
+            self._add_info_and_close(main_frame, info_text)
+            return
+        pos = self._positions(G)
         
         nx.draw_networkx_nodes(G, pos, nodelist=reachable,
                              node_color=ALGORITHM_COLORS['ford_fulkerson']['source_node'],
@@ -167,20 +300,160 @@ class GraphVisualizer:
         
         nx.draw_networkx_labels(G, pos)
         
-        edge_labels = {}
-        for u, v, data in G.edges(data=True):
-            flow = flow_dict[u][v]
-            capacity = data['capacity']
-            edge_labels[(u, v)] = f'{flow}/{capacity}'
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels)
+        if self._show_edge_labels(G):
+            edge_labels = {}
+            for u, v, data in G.edges(data=True):
+                flow = flow_dict[u][v]
+                capacity = data['capacity']
+                edge_labels[(u, v)] = f'{flow}/{capacity}'
+            nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels)
         
-        info_text = f"Flot maximum: {flow_value}"
         self._add_info_and_close(main_frame, info_text)
         
+    @staticmethod
+    def _transport_totals(solution, costs):
+        """Quantités, coûts par cellule, coûts par ligne et par colonne (NumPy)."""
+        quantities = np.asarray(solution)
+        cell_costs = quantities * np.asarray(costs)
+        return quantities, cell_costs, cell_costs.sum(axis=1), cell_costs.sum(axis=0)
+
+    def _draw_transport_table(self, ax, supply, demand, costs, quantities, cell_costs,
+                              row_costs, col_costs, total_cost):
+        """Tableau complet (quantité, coût unitaire, coût) : réservé aux petits problèmes."""
+        col_labels = ['Sources'] + [f'D{j+1}' for j in range(len(demand))] + ['Offre']
+        q, c, cc = quantities.tolist(), np.asarray(costs).tolist(), cell_costs.tolist()
+        cell_text = []
+        for i, (row_q, row_c, row_cc) in enumerate(zip(q, c, cc)):
+            cell_text.append([f'S{i+1}']
+                             + [f'{a}\n({b})\n={d}' for a, b, d in zip(row_q, row_c, row_cc)]
+                             + [f'{supply[i]}\n({row_costs[i]})'])
+        # Ligne de demande avec totaux
+        cell_text.append(['Demande']
+                         + [f'{d}\n({cost})' for d, cost in zip(demand, col_costs.tolist())]
+                         + [f'{sum(demand)}\n({total_cost})'])
+
+        table = ax.table(cellText=cell_text,
+                        colLabels=col_labels,
+                        loc='center',
+                        cellLoc='center',
+                        bbox=[0.1, 0.1, 0.8, 0.8])
+        table.auto_set_font_size(False)
+        table.set_fontsize(9)
+        table.scale(1.2, 1.5)
+        ax.axis('off')
+
+    def _draw_transport_heatmap(self, parent, ax, costs, quantities, cell_costs):
+        """
+        Carte de chaleur (imshow) des quantités, coûts unitaires ou coûts par
+        cellule : un seul objet graphique quelle que soit la taille m x n.
+        """
+        import tkinter as tk
+        from matplotlib.ticker import FuncFormatter
+        layers = {
+            'Quantités': quantities,
+            'Coûts unitaires': np.asarray(costs),
+            'Coûts (quantité x coût)': cell_costs,
+        }
+        image = ax.imshow(quantities, aspect='auto', cmap='viridis', interpolation='nearest')
+        self.fig.colorbar(image, ax=ax)
+        ax.set_xlabel('Destinations')
+        ax.set_ylabel('Sources')
+        ax.xaxis.set_major_formatter(FuncFormatter(lambda x, _: f'D{int(round(x)) + 1}'))
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: f'S{int(round(y)) + 1}'))
+
+        choice = tk.StringVar(value='Quantités')
+
+        def show(*_):
+            data = layers[choice.get()]
+            image.set_data(data)
+            image.set_clim(data.min(), data.max())
+            self.fig.canvas.draw_idle()
+
+        selector = tk.Frame(parent)
+        selector.pack(side=tk.TOP)
+        for name in layers:
+            tk.Radiobutton(selector, text=name, value=name, variable=choice,
+                           command=show).pack(side=tk.LEFT)
+
+    def _add_transport_pager(self, parent, supply, demand, costs, quantities,
+                             row_costs, col_costs, total_cost):
+        """
+        Vue détaillée paginée : seules les cellules d'une page (TRANSPORT_PAGE_SIZE)
+        sont affichées. Retourne show_cell(i, j), qui amène la page de la cellule.
+        """
+        import tkinter as tk
+        from tkinter import ttk
+        rows, cols = GRAPH_SETTINGS['TRANSPORT_PAGE_SIZE']
+        m, n = quantities.shape
+        costs = np.asarray(costs)
+        row_costs, col_costs = row_costs.tolist(), col_costs.tolist()
+        page = {'i': 0, 'j': 0}
+
+        frame = tk.Frame(parent)
+        frame.pack(side=tk.RIGHT, fill=tk.Y, padx=5)
+        position = tk.Label(frame, font=("Arial", 10))
+        position.pack(pady=5)
+        body = tk.Frame(frame)
+        body.pack(fill=tk.BOTH, expand=True)
+        tree = ttk.Treeview(body, show='headings', height=rows + 1, selectmode='browse')
+        scroll = ttk.Scrollbar(body, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scroll.set)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        def render(selected=None):
+            i0, j0 = page['i'], page['j']
+            i1, j1 = min(i0 + rows, m), min(j0 + cols, n)
+            columns = ['source'] + [f'd{j}' for j in range(j0, j1)] + ['offre']
+            tree.configure(columns=columns)
+            headings = ['Source'] + [f'D{j+1}' for j in range(j0, j1)] + ['Offre (coût)']
+            for column, text in zip(columns, headings):
+                tree.heading(column, text=text)
+                tree.column(column, width=90 if column != 'source' else 70, anchor='center')
+            tree.delete(*tree.get_children())
+            q = quantities[i0:i1, j0:j1].tolist()
+            c = costs[i0:i1, j0:j1].tolist()
+            for r, (row_q, row_c) in enumerate(zip(q, c)):
+                i = i0 + r
+                item = tree.insert('', tk.END, values=[f'S{i+1}']
+                                   + [f'{a} ({b})' for a, b in zip(row_q, row_c)]
+                                   + [f'{supply[i]} ({row_costs[i]})'])
+                if i == selected:
+                    tree.selection_set(item)
+                    tree.see(item)
+            tree.insert('', tk.END, values=['Demande']
+                        + [f'{demand[j]} ({col_costs[j]})' for j in range(j0, j1)]
+                        + [f'{sum(demand)} ({total_cost})'])
+            position.config(text=f"Sources {i0+1}-{i1} / {m}    "
+                                 f"Destinations {j0+1}-{j1} / {n}")
+
+        def move(di, dj):
+            page['i'] = min(max(page['i'] + di * rows, 0), (m - 1) // rows * rows)
+            page['j'] = min(max(page['j'] + dj * cols, 0), (n - 1) // cols * cols)
+            render()
+
+        def show_cell(i, j):
+            if 0 <= i < m and 0 <= j < n:
+                page['i'], page['j'] = i // rows * rows, j // cols * cols
+                render(selected=i)
+
+        buttons = tk.Frame(frame)
+        buttons.pack(pady=5)
+        for text, di, dj in (('◀', 0, -1), ('▲', -1, 0), ('▼', 1, 0), ('▶', 0, 1)):
+            tk.Button(buttons, text=text, width=3,
+                      command=lambda di=di, dj=dj: move(di, dj)).pack(side=tk.LEFT)
+        render()
+        return show_cell
+
     def display_transport_solution(self, supply, demand, costs, solution, total_cost, method_name):
         """
         Affiche la solution du problème de transport avec le nom de la méthode utilisée.
-        
+
+        Les petits problèmes sont affichés en tableau complet ; au-delà de
+        TRANSPORT_TABLE_CELLS cellules, une carte de chaleur et une vue
+        détaillée paginée remplacent le tableau (un clic sur la carte
+        affiche la page de la cellule).
+
         Args:
             method_name: str - 'nord_ouest', 'moindre_cout', ou 'stepping_stone'
         """
@@ -192,51 +465,19 @@ class GraphVisualizer:
         
         title = method_titles.get(method_name, 'Solution du problème de transport')
         main_frame, ax = self._create_window(title)
-        
-        # Préparer les données du tableau
-        cell_text = []
-        col_labels = ['Sources'] + [f'D{j+1}' for j in range(len(demand))] + ['Offre']
-        
-        # Données des cellules avec coûts et quantités
-        total_allocated = 0
-        for i in range(len(supply)):
-            row = [f'S{i+1}']
-            row_cost = 0
-            row_quantity = 0
-            for j in range(len(demand)):
-                quantity = solution[i][j]
-                cost = costs[i][j]
-                cell_cost = quantity * cost
-                row_cost += cell_cost
-                row_quantity += quantity
-                row.append(f'{quantity}\n({cost})\n={cell_cost}')
-            row.append(f'{supply[i]}\n({row_cost})')
-            total_allocated += row_quantity
-            cell_text.append(row)
-        
-        # Ligne de demande avec totaux
-        demand_row = ['Demande']
-        for j in range(len(demand)):
-            col_cost = sum(solution[i][j] * costs[i][j] for i in range(len(supply)))
-            demand_row.append(f'{demand[j]}\n({col_cost})')
-        demand_row.append(f'{sum(demand)}\n({total_cost})')
-        cell_text.append(demand_row)
-        
-        # Créer et personnaliser le tableau
-        table = ax.table(cellText=cell_text,
-                        colLabels=col_labels,
-                        loc='center',
-                        cellLoc='center',
-                        bbox=[0.1, 0.1, 0.8, 0.8])
-        
-        # Personnalisation
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1.2, 1.5)
-        
-        # Masquer les axes
-        ax.axis('off')
-        
+
+        quantities, cell_costs, row_costs, col_costs = self._transport_totals(solution, costs)
+        total_allocated = quantities.sum().item()
+        show_cell = None
+        if quantities.size <= GRAPH_SETTINGS['TRANSPORT_TABLE_CELLS']:
+            self._draw_transport_table(ax, supply, demand, costs, quantities, cell_costs,
+                                       row_costs, col_costs, total_cost)
+        else:
+            self.window.geometry("1400x850")
+            show_cell = self._add_transport_pager(main_frame, supply, demand, costs, quantities,
+                                                  row_costs, col_costs, total_cost)
+            self._draw_transport_heatmap(main_frame, ax, costs, quantities, cell_costs)
+
         # Titre
         ax.set_title(f"Solution du problème de transport - {title}")
         
@@ -258,8 +499,15 @@ class GraphVisualizer:
         )
         
         self._add_info_and_close(main_frame, info_text)
+        if show_cell is not None:
+            def on_click(event):
+                if event.inaxes is ax and event.xdata is not None:
+                    show_cell(int(round(event.ydata)), int(round(event.xdata)))
+            self.fig.canvas.mpl_connect('button_press_event', on_click)
         
     def display_potentiel_metra(self, tasks, early_dates, project_duration):
+        import networkx as nx
+        import matplotlib.pyplot as plt
         main_frame, ax = self._create_window("Potentiel Metra - Diagramme PERT")
         
         # Créer un graphe dirigé
@@ -319,6 +567,7 @@ class GraphGenerator:
     @staticmethod
     def create_random_graph(num_nodes=8):
         """Crée un graphe aléatoire avec des poids et des capacités."""
+        import networkx as nx
         G = nx.gnm_random_graph(num_nodes, num_nodes * 2)
         
         for (u, v) in G.edges():
@@ -328,9 +577,21 @@ class GraphGenerator:
         return G
 
     @staticmethod
-    def load_graph_from_file(filename):
-        """Charge un graphe depuis un fichier GraphML."""
+    def load_graph_from_file(filename, compact=False):
+        """
+        Charge un graphe depuis un fichier GraphML, une liste d'arêtes CSV/TSV
+        ou le format binaire (.cgraph, projeté en mémoire).
+
+        Avec compact=True le résultat est un CompactGraph lu en flux, sans
+        passer par networkx.
+        """
         try:
-            return nx.read_graphml(filename)
+            if filename.endswith('.graphml') and not compact:
+                import networkx as nx
+                return nx.read_graphml(filename)
+            graph = read_graph(filename)
+        except ValueError:
+            raise
         except Exception as e:
-            raise ValueError(f"Erreur lors du chargement du graphe : {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Erreur lors du chargement du graphe : {str(e)}")
+        return graph if compact else graph.to_networkx()
\ No newline at end of file
@@ -0,0 +1,188 @@
+import hashlib
+import io
+import numpy as np
+from typing import Hashable, List, Optional, Tuple
+
+from algorithms.csr import CompactGraph
+from algorithms.disk_cache import DiskCache
+
+
+def graph_arrays(G) -> Tuple[List[Hashable], np.ndarray, np.ndarray]:
+    """
+    Sommets et arêtes numérotées (nœuds, src, dst) d'un graphe networkx ou
+    CompactGraph ; chaque arête n'apparaît qu'une fois.
+    """
+    if isinstance(G, CompactGraph):
+        src, dst, _ = G.edge_arrays()
+        return list(G.labels), src, dst
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    m = G.number_of_edges()
+    src = np.fromiter((index[u] for u, _ in G.edges()), dtype=np.int64, count=m)
+    dst = np.fromiter((index[v] for _, v in G.edges()), dtype=np.int64, count=m)
+    return nodes, src, dst
+
+
+def _neighbor_sum(values: np.ndarray, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """Somme, pour chaque sommet, des valeurs (n x 2) de ses voisins."""
+    n = len(values)
+    total = np.empty_like(values)
+    for c in range(values.shape[1]):
+        total[:, c] = (np.bincount(src, weights=values[dst, c], minlength=n)
+                       + np.bincount(dst, weights=values[src, c], minlength=n))
+    return total
+
+
+def spectral_layout(num_nodes: int, src: np.ndarray, dst: np.ndarray,
+                    rng: np.random.Generator, iterations: int = 50) -> np.ndarray:
+    """
+    Plongement spectral approché : itérations de la marche aléatoire paresseuse
+    D⁻¹(A + I) sur deux vecteurs, recentrés et orthonormalisés à chaque tour.
+    Ils convergent vers les vecteurs propres de basse fréquence du graphe ;
+    chaque tour coûte O(V + E).
+    """
+    degree = (np.bincount(src, minlength=num_nodes)
+              + np.bincount(dst, minlength=num_nodes) + 1).astype(float)
+    positions = rng.random((num_nodes, 2)) - 0.5
+    for _ in range(iterations):
+        positions = (positions + _neighbor_sum(positions, src, dst)) / degree[:, None]
+        positions -= positions.mean(axis=0)
+        positions, _ = np.linalg.qr(positions)
+    return positions
+
+
+def force_layout(num_nodes: int, src: np.ndarray, dst: np.ndarray,
+                 seed: Optional[int] = None, iterations: int = 50,
+                 samples: int = 16) -> np.ndarray:
+    """
+    Placement par forces (Fruchterman-Reingold) vectorisé, pour les grands graphes.
+
+    Partant du plongement spectral, l'attraction est calculée sur les arêtes
+    et la répulsion estimée sur `samples` sommets tirés au hasard par sommet :
+    chaque itération coûte O(V·samples + E) au lieu de O(V²).
+    Retourne un tableau (n, 2) de positions dans [-1, 1].
+    """
+    if num_nodes == 0:
+        return np.empty((0, 2))
+    if num_nodes == 1:
+        return np.zeros((1, 2))
+    rng = np.random.default_rng(seed)
+    positions = spectral_layout(num_nodes, src, dst, rng)
+    positions /= np.abs(positions).max()
+    # Petit bruit pour séparer les sommets confondus (composantes, jumeaux)
+    positions += rng.normal(scale=1e-3, size=positions.shape)
+
+    k = 2.0 / np.sqrt(num_nodes)
+    samples = min(samples, num_nodes - 1)
+    temperature = 0.1
+    cooling = (0.01 / temperature) ** (1 / max(iterations, 1))
+    for _ in range(iterations):
+        # Répulsion k²/d, estimée par échantillonnage et remise à l'échelle
+        x, y = positions[:, 0], positions[:, 1]
+        others = rng.integers(0, num_nodes, size=(num_nodes, samples))
+        dx = x[:, None] - x[others]
+        dy = y[:, None] - y[others]
+        strength = (k * k * num_nodes / samples) / (dx * dx + dy * dy + 1e-9)
+        displacement = np.column_stack([(dx * strength).sum(axis=1),
+                                        (dy * strength).sum(axis=1)])
+
+        # Attraction d²/k le long des arêtes
+        delta = positions[src] - positions[dst]
+        dist = np.hypot(delta[:, 0], delta[:, 1]) + 1e-9
+        force = delta * (dist / k)[:, None]
+        for c in range(2):
+            displacement[:, c] -= np.bincount(src, weights=force[:, c], minlength=num_nodes)
+            displacement[:, c] += np.bincount(dst, weights=force[:, c], minlength=num_nodes)
+
+        length = np.hypot(displacement[:, 0], displacement[:, 1]) + 1e-9
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature *= cooling
+
+    positions -= positions.mean(axis=0)
+    return positions / max(np.abs(positions).max(), 1e-9)
+
+
+def compute_layout(G, seed: Optional[int] = None,
+                   small_graph: int = 200) -> Tuple[List[Hashable], np.ndarray]:
+    """
+    Positions (nœuds, tableau n x 2) d'un graphe. Les petits graphes gardent
+    le spring_layout de networkx ; au-delà de `small_graph` sommets, le
+    placement vectorisé force_layout est utilisé.
+    """
+    nodes, src, dst = graph_arrays(G)
+    if len(nodes) <= small_graph:
+        import networkx as nx
+        if isinstance(G, CompactGraph):
+            G = G.to_networkx()
+        pos = nx.spring_layout(G, seed=seed)
+        return nodes, np.array([pos[node] for node in nodes]).reshape(len(nodes), 2)
+    return nodes, force_layout(len(nodes), src, dst, seed=seed)
+
+
+# À incrémenter si le calcul du placement change : invalide les caches sur disque
+LAYOUT_VERSION = 1
+
+Layout = Tuple[List[Hashable], np.ndarray, np.ndarray, np.ndarray]
+
+
+def graph_fingerprint(G, nodes: List[Hashable], src: np.ndarray, dst: np.ndarray,
+                      *params) -> str:
+    """
+    Empreinte du contenu d'un graphe : sommets (dans leur ordre, qui est celui
+    des positions), orientation, arêtes triées et paramètres du placement.
+    Deux graphes de même contenu ont la même empreinte, quel que soit
+    l'ordre d'insertion des arêtes.
+    """
+    directed = G.directed if isinstance(G, CompactGraph) else G.is_directed()
+    if not directed:
+        src, dst = np.minimum(src, dst), np.maximum(src, dst)
+    order = np.lexsort((dst, src))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((LAYOUT_VERSION, directed, len(nodes)) + params).encode())
+    digest.update('\x1f'.join(map(repr, nodes)).encode())
+    digest.update(np.ascontiguousarray(src[order], dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(dst[order], dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+class LayoutCache(DiskCache):
+    """
+    Cache des placements indexé par l'empreinte du contenu du graphe.
+
+    Le même graphe affiché sous plusieurs algorithmes (ou reconstruit à
+    l'identique) réutilise ses positions sans recalcul ; avec `directory`,
+    elles sont conservées sur disque (.npy) d'une session à l'autre. Le
+    placement est déterministe pour un `seed` donné.
+    """
+
+    suffix = '.npy'
+
+    def __init__(self, capacity: int = 16, directory: Optional[str] = None,
+                 seed: int = 0, small_graph: int = 200):
+        super().__init__(capacity, directory)
+        self.seed = seed
+        self.small_graph = small_graph
+
+    def encode(self, positions: np.ndarray) -> bytes:
+        buffer = io.BytesIO()
+        np.save(buffer, positions)
+        return buffer.getvalue()
+
+    def decode(self, data: bytes) -> np.ndarray:
+        try:
+            positions = np.load(io.BytesIO(data))
+        except (OSError, EOFError) as e:
+            raise ValueError(str(e)) from e
+        if positions.ndim != 2 or positions.shape[1] != 2:
+            raise ValueError(f"positions de forme {positions.shape}")
+        return positions
+
+    def get(self, G) -> Layout:
+        """Placement (nœuds, positions, src, dst) du graphe, calculé au besoin."""
+        nodes, src, dst = graph_arrays(G)
+        key = graph_fingerprint(G, nodes, src, dst, self.seed, self.small_graph)
+        found, positions = super().get(key)
+        if not found:
+            positions = compute_layout(G, seed=self.seed, small_graph=self.small_graph)[1]
+            self.put(key, positions)
+        return nodes, positions, src, dst
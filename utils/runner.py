@@ -0,0 +1,151 @@
+import inspect
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+from algorithms.csr import CompactGraph
+from algorithms.graph_algorithms import GraphAlgorithms
+from algorithms.instrumentation import instrument
+from algorithms.transport import TransportAlgorithms
+from utils.graph_io import graph_from_dict, graph_to_dict, read_graph
+
+# Clés d'un fichier problème qui ne sont pas des arguments de l'algorithme
+_RESERVED = ('algorithm', 'graph', 'params')
+
+
+def _public_methods(cls) -> Dict[str, Callable]:
+    return {name: getattr(cls, name) for name in vars(cls)
+            if not name.startswith('_') and isinstance(vars(cls)[name], staticmethod)}
+
+
+# Toutes les méthodes publiques de GraphAlgorithms et TransportAlgorithms
+ALGORITHMS: Dict[str, Callable] = {**_public_methods(GraphAlgorithms),
+                                   **_public_methods(TransportAlgorithms)}
+
+
+def _int_keys(tasks: Dict[str, Dict]) -> Dict[Hashable, Dict]:
+    """Les clés JSON sont des chaînes : on rend leurs entiers aux identifiants (tâches, sommets)."""
+    if all(isinstance(task, str) and task.isdigit() for task in tasks):
+        return {int(task): data for task, data in tasks.items()}
+    return tasks
+
+
+def prepare_problem(problem: Dict[str, Any], base_dir: str = '.') -> Dict[str, Any]:
+    """
+    Complète une description de problème déjà décodée : fusion de `params`,
+    lecture du graphe (chemin relatif à `base_dir` ou dictionnaire),
+    identifiants de tâches entiers.
+    """
+    problem = dict(problem)
+    problem.update(problem.pop('params', None) or {})
+    graph = problem.get('graph')
+    if isinstance(graph, str):
+        problem['graph'] = read_graph(os.path.join(base_dir, graph))
+    elif isinstance(graph, dict):
+        problem['graph'] = graph_from_dict(graph)
+    for key in ('tasks', 'supply', 'demand'):
+        if isinstance(problem.get(key), dict):
+            problem[key] = _int_keys(problem[key])
+    return problem
+
+
+def load_problem(path: str, algorithm: Optional[str] = None,
+                 params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Lit un fichier problème.
+
+    Un fichier JSON décrit l'algorithme et ses arguments, par exemple
+    {"algorithm": "dijkstra", "graph": {...} ou "graphe.csv", "start": "X0",
+    "end": "X5"} ou {"algorithm": "nord_ouest", "supply": [...], ...}.
+    Tout autre fichier (CSV/TSV, GraphML, binaire) est un graphe ; l'algorithme
+    est alors donné par `algorithm`. `params` complète ou remplace les arguments.
+    """
+    if path.endswith('.json'):
+        try:
+            with open(path, encoding='utf-8') as f:
+                problem = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Erreur lors du chargement du problème : {str(e)}")
+        problem = prepare_problem(problem, os.path.dirname(path))
+    else:
+        problem = {'graph': read_graph(path)}
+    if algorithm is not None:
+        problem['algorithm'] = algorithm
+    problem.update(params or {})
+    if 'algorithm' not in problem:
+        raise ValueError("Aucun algorithme spécifié")
+    return problem
+
+
+def solve(problem: Dict[str, Any]) -> Any:
+    """Appelle la méthode demandée ; le graphe éventuel est passé comme premier argument G."""
+    name = problem['algorithm']
+    if name not in ALGORITHMS:
+        raise ValueError(f"Algorithme non supporté: {name}")
+    method = ALGORITHMS[name]
+    arguments = {key: value for key, value in problem.items() if key not in _RESERVED}
+    if 'graph' in problem:
+        arguments['G'] = problem['graph']
+    try:
+        inspect.signature(method).bind(**arguments)
+    except TypeError as e:
+        raise ValueError(f"Arguments invalides pour {name} : {str(e)}")
+    return method(**arguments)
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convertit un résultat (NamedTuple, tableaux NumPy, ensembles...) en JSON."""
+    if hasattr(value, '_asdict'):
+        return {key: to_jsonable(item) for key, item in value._asdict().items()}
+    if isinstance(value, dict):
+        return {key if isinstance(key, (str, int, float, bool)) or key is None
+                else str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset, range)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return str(value)
+    if isinstance(value, CompactGraph) or hasattr(value, 'is_directed'):
+        # Graphes (generate_random_graph) : même description que les fichiers problèmes
+        return graph_to_dict(value)
+    return value
+
+
+def run_file(path: str, algorithm: Optional[str] = None,
+             params: Optional[Dict[str, Any]] = None,
+             metrics: bool = False) -> Dict[str, Any]:
+    """
+    Traite un fichier et retourne l'enregistrement à écrire en JSON lines.
+    Toute erreur est rapportée dans l'enregistrement (avec son type si ce
+    n'est pas une erreur de données), sans interrompre le traitement des
+    autres fichiers. Avec `metrics`, les
+    compteurs et chronomètres de la résolution y sont ajoutés.
+    """
+    record = {'input': path, 'algorithm': algorithm}
+    start = time.perf_counter()
+    try:
+        problem = load_problem(path, algorithm, params)
+        record['algorithm'] = problem['algorithm']
+        if metrics:
+            with instrument() as recorder:
+                result = solve(problem)
+            record['metrics'] = recorder.to_dict()
+        else:
+            result = solve(problem)
+        record['result'] = to_jsonable(result)
+        record['status'] = 'ok'
+    except (ValueError, KeyError, OSError) as e:
+        record['status'] = 'error'
+        record['error'] = str(e)
+    except Exception as e:
+        # Données mal typées ou erreur d'un solveur : le lot continue
+        record['status'] = 'error'
+        record['error'] = f"{type(e).__name__}: {e}"
+    record['elapsed'] = time.perf_counter() - start
+    return record
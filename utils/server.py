@@ -0,0 +1,349 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from algorithms.csr import CompactGraph
+from algorithms.csr_algorithms import bellman_ford_csr, dijkstra_csr, path_from_predecessors
+from algorithms.graph_algorithms import NO_PATH
+from utils.runner import ALGORITHMS, prepare_problem, solve, to_jsonable
+
+# Requêtes de plus court chemin regroupées par graphe
+BATCHED = ('dijkstra', 'bellman_ford')
+# Clés d'une requête regroupable ; seul 'id' peut s'y ajouter
+_BATCH_KEYS = {'algorithm', 'graph', 'start', 'end'}
+
+# Résultat d'une requête côté processus de calcul : ('ok', résultat) ou ('error', message)
+Outcome = Tuple[str, Any]
+
+# --- Côté processus de calcul ------------------------------------------------
+
+# Graphes déjà lus par ce processus, indexés par graph_key
+_GRAPHS: 'OrderedDict[str, CompactGraph]' = OrderedDict()
+GRAPH_CACHE_SIZE = 8
+
+
+def graph_key(spec: Any, root: str) -> str:
+    """
+    Identifiant d'une description de graphe : chemin absolu et date de
+    modification pour un fichier, empreinte du JSON canonique sinon.
+    """
+    if isinstance(spec, str):
+        path = os.path.abspath(os.path.join(root, spec))
+        try:
+            stamp = os.stat(path).st_mtime_ns
+        except OSError:
+            stamp = None
+        return f'file:{path}:{stamp}'
+    text = json.dumps(spec, sort_keys=True, separators=(',', ':'))
+    return 'json:' + hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _load_graph(key: str, spec: Any, root: str) -> CompactGraph:
+    graph = _GRAPHS.get(key)
+    if graph is None:
+        graph = prepare_problem({'graph': spec}, root)['graph']
+        _GRAPHS[key] = graph
+        while len(_GRAPHS) > GRAPH_CACHE_SIZE:
+            _GRAPHS.popitem(last=False)
+    else:
+        _GRAPHS.move_to_end(key)
+    return graph
+
+
+def _solve_problem(problem: Dict[str, Any], key: Optional[str], root: str) -> List[Outcome]:
+    try:
+        if key is not None:
+            problem = dict(problem, graph=_load_graph(key, problem['graph'], root))
+        return [('ok', to_jsonable(solve(prepare_problem(problem, root))))]
+    except (ValueError, KeyError, OSError) as e:
+        return [('error', str(e))]
+
+
+def _shortest_paths(algorithm: str, key: str, spec: Any, root: str,
+                    queries: List[Tuple[Any, Any]]) -> List[Outcome]:
+    """
+    Plusieurs requêtes (départ, arrivée) sur un même graphe : une seule
+    recherche par source, arrêtée quand toutes ses destinations sont fixées.
+    """
+    try:
+        graph = _load_graph(key, spec, root)
+    except (ValueError, KeyError, OSError) as e:
+        return [('error', str(e))] * len(queries)
+
+    outcomes: List[Optional[Outcome]] = [None] * len(queries)
+    by_source: Dict[int, List[Tuple[int, int]]] = {}
+    for k, (start, end) in enumerate(queries):
+        try:
+            by_source.setdefault(graph.index(start), []).append((k, graph.index(end)))
+        except ValueError as e:
+            outcomes[k] = ('error', str(e))
+
+    for source, items in by_source.items():
+        # Destinations hors de la composante de la source : rejetées sans recherche
+        for k, target in items:
+            if not graph.connected(source, target):
+                outcomes[k] = ('error', NO_PATH)
+        items = [(k, target) for k, target in items if outcomes[k] is None]
+        if not items:
+            continue
+        try:
+            if algorithm == 'dijkstra':
+                dist, pred = dijkstra_csr(graph, source, [target for _, target in items])
+            else:
+                dist, pred = bellman_ford_csr(graph, source)
+        except ValueError as e:
+            for k, _ in items:
+                outcomes[k] = ('error', str(e))
+            continue
+        for k, target in items:
+            if target != source and pred[target] == -1:
+                outcomes[k] = ('error', NO_PATH)
+                continue
+            path = [graph.label(i) for i in path_from_predecessors(pred, source, target)]
+            length = dist[target]
+            if algorithm == 'bellman_ford':
+                length = int(length) if graph.weight.dtype.kind in 'iu' else float(length)
+            outcomes[k] = ('ok', to_jsonable([path, length]))
+    return outcomes
+
+
+# --- Côté serveur ----------------------------------------------------------------
+
+class _Batch:
+    __slots__ = ('spec', 'queries', 'futures', 'full')
+
+    def __init__(self, spec: Any):
+        self.spec = spec
+        self.queries: List[Tuple[Any, Any]] = []
+        self.futures: List[asyncio.Future] = []
+        self.full = asyncio.Event()
+
+
+class SolveServer:
+    """
+    Serveur local des méthodes de GraphAlgorithms et TransportAlgorithms.
+
+    Protocole : une requête JSON par ligne, par exemple
+    {"id": 1, "algorithm": "dijkstra", "graph": {...} ou "graphe.csv",
+    "start": "X0", "end": "X5"} ; la réponse {"id": 1, "status": "ok",
+    "result": ..., "elapsed": ...} (ou "status": "error" et "error") est
+    écrite dès qu'elle est prête, pas forcément dans l'ordre des requêtes.
+
+    Les calculs partent dans un pool de processus. Les requêtes de plus
+    court chemin reçues sur un même graphe pendant `batch_window` secondes
+    (au plus `max_batch`) sont traitées en un seul calcul. La file des
+    calculs en attente est bornée (`queue_size`) et chaque connexion a au
+    plus `max_inflight` requêtes en cours : au-delà, le serveur cesse de
+    lire et le client est ralenti.
+
+    `submit` traite une requête sans passer par le réseau ; `executor`
+    permet de fournir un autre exécuteur que le pool de processus.
+    """
+
+    def __init__(self, workers: Optional[int] = None, queue_size: int = 256,
+                 batch_window: float = 0.002, max_batch: int = 64,
+                 max_inflight: int = 64, root: str = '.',
+                 executor: Optional[Executor] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_inflight = max_inflight
+        self.root = root
+        self._executor = executor
+        self._own_executor = executor is None
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatchers: List[asyncio.Task] = []
+        self._open: Dict[Tuple[str, str], _Batch] = {}
+        self._flushes: Set[asyncio.Task] = set()
+        self._servers: List[asyncio.AbstractServer] = []
+
+    async def __aenter__(self) -> 'SolveServer':
+        self._ensure_started()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _ensure_started(self) -> None:
+        if self._queue is not None:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._dispatchers = [asyncio.create_task(self._dispatch())
+                             for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        for task in list(self._flushes) + self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._flushes, *self._dispatchers, return_exceptions=True)
+        self._flushes.clear()
+        self._open.clear()
+        self._dispatchers.clear()
+        self._queue = None
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, futures = await self._queue.get()
+            try:
+                outcomes = await loop.run_in_executor(self._executor, func, *args)
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for future, outcome in zip(futures, outcomes):
+                    if not future.done():
+                        future.set_result(outcome)
+            finally:
+                self._queue.task_done()
+
+    async def _enqueue(self, func, args: tuple, futures: List[asyncio.Future]) -> None:
+        # Attend si la file est pleine : c'est la contre-pression vers les clients
+        await self._queue.put((func, args, futures))
+
+    async def _run(self, problem: Dict[str, Any]) -> Outcome:
+        future = asyncio.get_running_loop().create_future()
+        key = graph_key(problem['graph'], self.root) if 'graph' in problem else None
+        await self._enqueue(_solve_problem, (problem, key, self.root), [future])
+        return await future
+
+    async def _batched(self, problem: Dict[str, Any]) -> Outcome:
+        algorithm = problem['algorithm']
+        key = (algorithm, graph_key(problem['graph'], self.root))
+        future = asyncio.get_running_loop().create_future()
+        batch = self._open.get(key)
+        if batch is None:
+            # Premier de son lot : la soumission est confiée à une tâche à part,
+            # qui aboutit même si la requête qui a ouvert le lot est annulée
+            batch = _Batch(problem['graph'])
+            self._open[key] = batch
+            task = asyncio.create_task(self._flush(key, batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        batch.queries.append((problem['start'], problem['end']))
+        batch.futures.append(future)
+        if len(batch.queries) >= self.max_batch and self._open.get(key) is batch:
+            del self._open[key]
+            batch.full.set()
+        return await future
+
+    async def _flush(self, key: Tuple[str, str], batch: _Batch) -> None:
+        """Soumet le lot après `batch_window` secondes (ou dès qu'il est plein)."""
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.batch_window)
+            except asyncio.TimeoutError:
+                pass
+            if self._open.get(key) is batch:
+                del self._open[key]
+            await self._enqueue(_shortest_paths,
+                                (key[0], key[1], batch.spec, self.root, batch.queries),
+                                batch.futures)
+        except asyncio.CancelledError:
+            # Arrêt du serveur : le lot ne sera pas calculé
+            if self._open.get(key) is batch:
+                del self._open[key]
+            for future in batch.futures:
+                if not future.done():
+                    future.cancel()
+            raise
+
+    async def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Traite une requête et retourne la réponse à renvoyer au client."""
+        self._ensure_started()
+        start = time.perf_counter()
+        response = {'id': request.get('id') if isinstance(request, dict) else None}
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("La requête doit être un objet JSON")
+            problem = dict(request)
+            problem.update(problem.pop('params', None) or {})
+            name = problem.get('algorithm')
+            if name not in ALGORITHMS:
+                raise ValueError(f"Algorithme non supporté: {name}")
+            if name in BATCHED and _BATCH_KEYS <= set(problem) <= _BATCH_KEYS | {'id'}:
+                status, value = await self._batched(problem)
+            else:
+                problem.pop('id', None)
+                status, value = await self._run(problem)
+        except ValueError as e:
+            status, value = 'error', str(e)
+        except Exception as e:
+            status, value = 'error', f"Erreur interne : {e!r}"
+        response['status'] = status
+        response['result' if status == 'ok' else 'error'] = value
+        response['elapsed'] = time.perf_counter() - start
+        return response
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        inflight = asyncio.Semaphore(self.max_inflight)
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line: bytes) -> None:
+            try:
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    response = {'id': None, 'status': 'error',
+                                'error': f"Requête JSON invalide : {str(e)}"}
+                else:
+                    response = await self.submit(request)
+                data = json.dumps(response, ensure_ascii=False).encode() + b'\n'
+                async with lock:
+                    writer.write(data)
+                    await writer.drain()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            finally:
+                inflight.release()
+
+        try:
+            while True:
+                await inflight.acquire()
+                line = await reader.readline()
+                if not line:
+                    inflight.release()
+                    break
+                if not line.strip():
+                    inflight.release()
+                    continue
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        except (ConnectionError, ValueError):
+            # Connexion coupée ou ligne dépassant la taille maximale
+            for task in tasks:
+                task.cancel()
+        finally:
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765,
+                    path: Optional[str] = None) -> asyncio.AbstractServer:
+        """Écoute sur `host:port`, ou sur le socket Unix `path` s'il est donné."""
+        self._ensure_started()
+        # Les graphes JSON peuvent être longs : lignes jusqu'à 64 Mo
+        limit = 64 * 2**20
+        if path is not None:
+            server = await asyncio.start_unix_server(self._handle, path=path, limit=limit)
+        else:
+            server = await asyncio.start_server(self._handle, host, port, limit=limit)
+        self._servers.append(server)
+        return server